@@ -0,0 +1,796 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# aufruf: python3 jemobench.py read FOLDER [--repeat N]
+#         python3 jemobench.py switch FOLDER [--repeat N]
+#         python3 jemobench.py sections FOLDER [--repeat N] [--save FILE] [--compare FILE] [--threshold PERCENT]
+#         python3 jemobench.py model FOLDER [--repeat N]
+#         python3 jemobench.py functionspecs FOLDER [--repeat N]
+#         python3 jemobench.py sensors FOLDER [--repeat N]
+#
+# benchmarks for jemoview, need Python 3.9 or later (tracemalloc.reset_peak), jemoview itself runs with 3.7
+# read:   compares reading each model file twice (json.load plus readline, as done up to version 2023-08-27)
+#         with reading it once by readModel(), with cold file cache before every read if the system supports it,
+#         and the peak memory of both. both search the text for switches. the difference is small (a few percent,
+#         a file is opened once instead of twice) and often within the noise of a run, it may also be negative
+# switch: compares getSwitch() of version 2023-08-27 (tables rebuilt at each call) with the precompiled
+#         decoder and with the cached getSwitch(), using all switches referenced in the model files
+# sections: converts all model files and times each step (reading, json decode, each section function called
+#         by extractDict(), extractPat() and writing the csv file, see profiling in jemoview), reports
+#         models/second, p50/p95 latency per model and peak memory; results can be saved as json and
+#         compared with a saved run
+# model:  memory of the decoded model (see decodeModel() in jemoview) per model file, compared with the dicts
+#         of json, and time to decode it
+# functionspecs: compares functionspecs() of version 2023-08-27 (Function-Specs read twice, rows built by
+#         string concatenation) with the single pass, time and memory allocated per model
+# sensors: compares sensordict of version 2023-08-27 (a list of 256 parameters per sensor) with the sparse
+#         dicts of telemdetect(), memory per model, time to build it and to look up parameters
+#
+# Copyright (c) 2020 - 2023, werinza (aka nikolausi / Klaus)
+# All Rights Reserved, Open Source MIT license applies to this program and related works
+#
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import jemoview
+
+
+# remove file from the file cache of the operating system, returns False if not supported (not Linux)
+def dropCache(fileName):
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    fd = os.open(fileName, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+# reading as done by jemoview up to version 2023-08-27: json.load and again with readline for extractPat(),
+# the text is searched for switches like readModel() does, so both return the same result
+def readTwice(fileName):
+    with open(fileName, 'r', encoding='utf-8', errors='replace') as filein:
+        modelData = json.load(filein)
+    with open(fileName, 'r', encoding='utf-8', errors='replace') as filein2:
+        modelTxt = filein2.readline()
+    return [modelData, jemoview.swtextpat.findall(modelTxt)]
+
+
+# highest peak of memory while reading one of the files with readFunc, returns bytes
+def peakRead(fileNames, readFunc):
+    peak = 0
+    tracemalloc.start()
+    for fileName in fileNames:
+        tracemalloc.reset_peak()
+        readFunc(fileName)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+    return peak
+
+
+# time reading all files with readFunc, returns seconds
+def timeRead(fileNames, readFunc, cold):
+    total = 0.0
+    for fileName in fileNames:
+        if cold:
+            dropCache(fileName)
+        start = time.perf_counter()
+        readFunc(fileName)
+        total += time.perf_counter() - start
+    return total
+
+
+def benchRead(args):
+    fileNames = sorted(glob.glob(os.path.join(glob.escape(args.folder), '*.jsn')))
+    if not fileNames:
+        print('no model files found:', args.folder)
+        return 1
+    size = sum(os.path.getsize(fileName) for fileName in fileNames)
+    cold = not args.warm and dropCache(fileNames[0])
+    if not cold and not args.warm:
+        print('file cache cannot be dropped on this system, measuring with warm cache')
+    print(len(fileNames), 'models,', round(size / 1024), 'KiB,', 'cold cache' if cold else 'warm cache')
+    for fileName in fileNames:  # check that both return the same
+        if readTwice(fileName) != jemoview.readModel(fileName):
+            print('different result for', fileName)
+            return 1
+    twice = []
+    once = []
+    for ii in range(args.repeat):
+        # alternate the order, so neither variant profits from the other one
+        if ii % 2 == 0:
+            twice.append(timeRead(fileNames, readTwice, cold))
+            once.append(timeRead(fileNames, jemoview.readModel, cold))
+        else:
+            once.append(timeRead(fileNames, jemoview.readModel, cold))
+            twice.append(timeRead(fileNames, readTwice, cold))
+    best2 = min(twice)
+    best1 = min(once)
+    print('read twice (json.load + readline): %8.2f ms  %6.3f ms/model  peak %6.0f KiB' %
+          (best2 * 1000, best2 * 1000 / len(fileNames), peakRead(fileNames, readTwice) / 1024))
+    print('read once  (readModel)           : %8.2f ms  %6.3f ms/model  peak %6.0f KiB' %
+          (best1 * 1000, best1 * 1000 / len(fileNames), peakRead(fileNames, jemoview.readModel) / 1024))
+    print('saving: %.1f %%' % (100 * (best2 - best1) / best2))
+    return 0
+
+
+# getSwitch() of version 2023-08-27, rebuilds all tables and splits the string at each call
+# only needed as reference for the speedup, ctx is a ModelContext filled by extractDict()
+def legacyGetSwitch(ctx, aString):
+    switches1 = ['nix', 'P1', 'P2', 'P4', 'P3', 'P5', 'P6', 'P7', 'P8', 'SA', 'SB',
+                 'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'P9',
+                 'P10', 'SM', 'SN', 'SO', 'SP']
+    log = ['Log1', 'Log2', 'Log3', 'Log4', 'Log5', 'Log6', 'Log7', 'Log8', 'Log9',
+           'Log10', 'Log11', 'Log12', 'Log13', 'Log14', 'Log15', 'Log16', 'Log17',
+           'Log18', 'Log19', 'Log20', 'Log21', 'Log22', 'Log23', 'Log24', '?zefix?',
+           '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?']
+    voi = ['V01', 'V02', 'V03', 'V04', 'V05', 'V06', 'V07', 'V08', 'V09', 'V10',
+           'V11', 'V12', 'V13', 'V14', 'V15', '?zefix?']
+    mx = ['MX1', 'MX2', 'MX3', 'MX4', 'MX5', 'MX6', 'MX7', 'MX8', 'MX9', 'MX10',
+          'MX11', 'MX12', 'MX13', 'MX14', 'MX15', 'MX16']
+    gx = ['GX', 'GY', 'GZ', 'G/L', 'G/R', 'GXL', 'GXR', 'GHi', '?zefix?', '?zefix?',
+          '?zefix?', '?zefix?', 'timer', 'function', 'servo', 'flight mode']
+    seq = ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6', 'Q7', 'Q8', 'Q9', 'Q10']
+    others = ['CH1', 'CH2', 'CH3', 'CH4', 'CH5', 'CH6', 'CH7', 'CH8', '?zefix?', '?zefix?',
+              '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Tr1', 'Tr2', 'Tr3',
+              'Tr4', 'Tr5', 'Tr6', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'C01', 'C02',
+              'C03', 'C04', 'C05', 'C06', 'C07', 'C08', 'C09', 'C10', '?zefix?',
+              'Log.MAX', '?zefix?', '?zefix?']
+    switches7 = log + voi + mx + gx + seq + others
+    swlist = ['SA', 'SB', 'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM', 'SN', 'SO', 'SP']
+    xx = aString.split(',')
+    if len(xx) != 8:
+        return ['-', '-', '-', False]
+    for ss in xx:
+        if ss[0] in ('-', '+'):
+            if not ss[1:].isdigit():
+                return ['-', '-', '-', False]
+        elif not ss.isdigit():
+            return ['-', '-', '-', False]
+    switchNo1 = int(aString.split(',')[0])
+    switchNo7 = int(aString.split(',')[6])
+    proport = False
+    if int(aString.split(',')[2]) == 1:
+        proport = True
+    if switchNo7 == 76:
+        if ctx.stopwatch[switchNo1] == 'nix':
+            return ['??', '??', '??', False]
+        jj = ctx.stopwatchid.index(switchNo1)
+        if switchNo1 < 10:
+            out = 'T0' + str(jj) + '  (' + ctx.stopwatch[switchNo1] + ')'
+        else:
+            out = 'T' + str(jj) + '  (' + ctx.stopwatch[switchNo1] + ')'
+        return [out, out, out, proport]
+    if switchNo7 == 77:
+        if switchNo1 >= len(ctx.functionlist):
+            return ['?zefix?', '?zefix?', '?zefix?', False]
+        if switchNo1 <= 13:
+            if ctx.functionlist[switchNo1] != 'nix':
+                out = ctx.functionlist[switchNo1]
+            else:
+                out = '??'
+        else:
+            out = 'U' + str(switchNo1 - 13)
+            if ctx.functionlist[switchNo1] != 'nix':
+                if ctx.functionlist[switchNo1] == 'Butterfly':
+                    out = 'Butterfly'
+                else:
+                    out = out + '  (' + ctx.functionlist[switchNo1] + ')'
+        return [out, out, out, proport]
+    if switchNo7 == 78:
+        out = 'O' + str(switchNo1 + 1)
+        if ctx.servolist[switchNo1 + 1] != 'nix':
+            out = out + '  (' + ctx.servolist[switchNo1 + 1] + ')'
+        return [out, out, out, proport]
+    if switchNo7 == 79:
+        if switchNo1 not in ctx.flightmoid:
+            return ['??', '??', '??', False]
+        jj = ctx.flightmoid.index(switchNo1)
+        kk = ctx.flightmoseq.index(switchNo1) + 1
+        out = 'FM' + str(kk) + '  (' + ctx.flightmolist[jj] + ')'
+        return [out, out, out, proport]
+    if switchNo1 == 0:
+        if switchNo7 >= 0:
+            if switches7[switchNo7] == '?zefix?':
+                return ['?zefix?', '?zefix?', '?zefix?', False]
+            out = switches7[switchNo7]
+            return [out, out, out, proport]
+        else:
+            return ['-', '-', '-', False]
+    else:
+        inverted = False
+        if int(aString.split(',')[1]) == 1:
+            inverted = True
+        val = int(aString.split(',')[5])
+        valstr = ''
+        valstr2 = ''
+        if switches1[switchNo1][0] == 'P':
+            if int(aString.split(',')[7]) == -1:
+                if inverted:
+                    comp = '≤'
+                else:
+                    comp = '≥'
+                valstr = '  ' + comp + ' ' + str(int(round(100.*(val/4000.)))) + '%'
+            else:
+                if inverted:
+                    val *= -1
+                valstr = '  ' + str(int(round(100.*(val/4000.)))) + '%'
+        else:
+            xx = switches1[switchNo1]
+            if xx in swlist:
+                jj = swlist.index(xx)
+                if ctx.swsettings[jj] == 0:
+                    val *= -1
+            else:
+                return ['?zefix?', '?zefix?', '?zefix?', False]
+            if inverted:
+                val *= -1
+            if val < 0:
+                valstr = '  ↓'
+            elif val == 0:
+                valstr = '  —'
+            else:
+                valstr = '  ↑'
+            valstr2 = valstr
+        out = switches1[switchNo1]
+        return [out, out + valstr, out + valstr2, proport]
+
+
+# time calling switchFunc for all switches of all models, returns seconds
+def timeSwitches(models, switchFunc, repeat):
+    best = None
+    for ii in range(repeat):
+        start = time.perf_counter()
+        for ctx, switches in models:
+            ctx.newGeneration()  # each run starts with an empty cache
+            for aString in switches:
+                switchFunc(ctx, aString)
+        total = time.perf_counter() - start
+        if best is None or total < best:
+            best = total
+    return best
+
+
+def benchSwitch(args):
+    fileNames = sorted(glob.glob(os.path.join(glob.escape(args.folder), '*.jsn')))
+    if not fileNames:
+        print('no model files found:', args.folder)
+        return 1
+    # convert each model once to fill its context, then collect all switches as extractPat() does
+    models = []
+    calls = 0
+    for fileName in fileNames:
+        modelData, switches = jemoview.readModel(fileName)
+        ctx = jemoview.ModelContext(jemoview.options, jemoview.swsettings)
+        jemoview.extractDict(ctx, modelData)
+        for aString in switches:  # check that results are identical
+            if list(jemoview.getSwitch(ctx, aString)) != legacyGetSwitch(ctx, aString):
+                print('different result for', aString, 'in', fileName)
+                return 1
+        models.append([ctx, switches])
+        calls += len(switches)
+    print(len(fileNames), 'models,', calls, 'switches,', len(set(ss for ctx, switches in models for ss in switches)), 'different')
+    legacy = timeSwitches(models, legacyGetSwitch, args.repeat)
+    decoder = timeSwitches(models, lambda ctx, aString: jemoview.decodeSwitch(ctx, jemoview.parseSwitch(aString)), args.repeat)
+    cached = timeSwitches(models, jemoview.getSwitch, args.repeat)
+    print('getSwitch 2023-08-27 : %8.2f ms  %6.3f us/call' % (legacy * 1000, legacy * 1e6 / calls))
+    print('decodeSwitch         : %8.2f ms  %6.3f us/call  speedup %.1fx' % (decoder * 1000, decoder * 1e6 / calls, legacy / decoder))
+    print('getSwitch cached     : %8.2f ms  %6.3f us/call  speedup %.1fx' % (cached * 1000, cached * 1e6 / calls, legacy / cached))
+    return 0
+
+
+# convert one model as convertModel() does, with the timings of readModel() and runSection()
+# adds the time of each step to times, returns seconds for the model
+def convertTimed(fileName, fileCsv, times):
+    timings = {}
+    start = time.perf_counter()
+    modelData, switches = jemoview.readModel(fileName, timings)
+    ctx = jemoview.ModelContext(jemoview.options, jemoview.swsettings)
+    ctx.timings = timings
+    jemoview.extractDict(ctx, modelData)
+    step1 = time.perf_counter()
+    jemoview.extractPat(ctx, switches)
+    step2 = time.perf_counter()
+    with open(fileCsv, 'w', encoding='utf-8', errors='replace') as fileout:
+        writer = csv.writer(fileout, delimiter=ctx.options['delimiter'], lineterminator='\n')
+        writer.writerow(jemoview.progrow)
+        writer.writerows(ctx.rows)
+    end = time.perf_counter()
+    timings['extractPat'] = step2 - step1
+    timings['write'] = end - step2
+    for name in timings:  # steps in the order of the conversion
+        times[name] = times.get(name, 0.0) + timings[name]
+    return end - start
+
+
+# value at percentage pct of the sorted list values
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def benchSections(args):
+    fileNames = sorted(glob.glob(os.path.join(glob.escape(args.folder), '*.jsn')))
+    if not fileNames:
+        print('no model files found:', args.folder)
+        return 1
+    best = None  # times of the fastest run
+    bestTotal = None
+    latency = len(fileNames) * [None]  # fastest conversion of each model
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fileCsv = os.path.join(tmpdir, 'model.csv')
+        for ii in range(args.repeat):
+            times = {}
+            total = 0.0
+            for jj, fileName in enumerate(fileNames):
+                seconds = convertTimed(fileName, fileCsv, times)
+                total += seconds
+                if latency[jj] is None or seconds < latency[jj]:
+                    latency[jj] = seconds
+            if best is None or total < bestTotal:
+                best = times
+                bestTotal = total
+        # separate run for memory, tracemalloc slows down the conversion
+        peak = 0
+        tracemalloc.start()
+        for fileName in fileNames:
+            tracemalloc.reset_peak()
+            convertTimed(fileName, fileCsv, {})
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    count = len(fileNames)
+    result = {'version': jemoview.progvers, 'models': count,
+              'models/s': count / bestTotal,
+              'p50 ms': percentile(latency, 50) * 1000, 'p95 ms': percentile(latency, 95) * 1000,
+              'peak memory KiB': peak / 1024,
+              'steps us/model': {name: best[name] * 1e6 / count for name in best}}
+    print(count, 'models, best of', args.repeat, 'runs')
+    print('%.1f models/s, latency p50 %.3f ms, p95 %.3f ms, peak memory per model %.0f KiB' %
+          (result['models/s'], result['p50 ms'], result['p95 ms'], result['peak memory KiB']))
+    for name in best:
+        print('%-20s %10.1f us/model %6.1f %%' % (name, result['steps us/model'][name], 100 * best[name] / bestTotal))
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as fileout:
+            json.dump(result, fileout, indent=1)
+        print('saved to', args.save)
+    if args.compare:
+        return compareSections(result, args.compare, args.threshold, args.min_us)
+    return 0
+
+
+def benchModel(args):
+    fileNames = sorted(glob.glob(os.path.join(glob.escape(args.folder), '*.jsn')))
+    if not fileNames:
+        print('no model files found:', args.folder)
+        return 1
+    decoded = []  # bytes of each decoded model
+    dicts = []    # bytes of each model as dicts of json
+    allocated = 0
+    best = None
+    for fileName in fileNames:
+        modelData = jemoview.readModel(fileName)[0]
+        ctx = jemoview.ModelContext(jemoview.options, jemoview.swsettings)
+        jemoview.parseSwitch.cache_clear()  # switches are counted for each model
+        tracemalloc.start()
+        jemoview.decodeModel(ctx, modelData)
+        allocated += tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        decoded.append(jemoview.getFootprint(ctx.model))
+        dicts.append(jemoview.getFootprint(modelData))
+    models = [jemoview.readModel(fileName)[0] for fileName in fileNames]
+    ctx = jemoview.ModelContext(jemoview.options, jemoview.swsettings)
+    for ii in range(args.repeat):
+        start = time.perf_counter()
+        for modelData in models:
+            jemoview.decodeModel(ctx, modelData)
+        total = time.perf_counter() - start
+        if best is None or total < best:
+            best = total
+    count = len(fileNames)
+    print(count, 'models')
+    # the decoded model refers to strings and lists of the dicts, they are included in its size but not allocated
+    print('decoded model  : %8.1f KiB/model  max %8.1f KiB  newly allocated %8.1f KiB/model' %
+          (sum(decoded) / count / 1024, max(decoded) / 1024, allocated / count / 1024))
+    print('json dicts     : %8.1f KiB/model  max %8.1f KiB' % (sum(dicts) / count / 1024, max(dicts) / 1024))
+    print('decodeModel    : %8.1f us/model (best of %d runs)' % (best * 1e6 / count, args.repeat))
+    return 0
+
+
+# functionspecs() of version 2023-08-27, reads Function-Specs twice and builds the rows by concatenation
+# only needed as reference for the speedup, ctx is a ModelContext filled by extractDict()
+def legacyFunctionspecs(ctx, modelData):
+    # collect headings at Flight-Mode 0
+    out_title_trim = [ctx.msg['flightMode']]
+    out_title_dr = [ctx.msg['flightMode']]
+    out_title_expo = [ctx.msg['flightMode']]
+    out_title_sw = [ctx.msg['flightMode']]
+    out_title_curve = [ctx.msg['flightMode']]
+    for item in modelData['Function-Specs']:  # is list of dicts
+        flm = int(item['Flight-Mode'])
+        if flm == 0:
+            fun = int(item['Function-Id'])
+            funt = ctx.functionlist[fun]
+            out_title_trim.append(funt + ' Trim')
+            out_title_dr.append(funt + ' DR')
+            out_title_expo.append(funt + ' Expo')
+            out_title_sw.append(ctx.msg['functionSwitch'].format(funt))
+            out_title_curve.append(ctx.msg['functionCurve'].format(funt))
+        else:
+            break
+
+    # collect data, each value is a list of rows (see writeEssence)
+    out_buf_l = []
+    out_trim_v = []
+    out_trim = []
+    out_dr_v = []
+    out_dr = []
+    out_expo_v = []
+    out_expo = []
+    out_drsw_v = []
+    out_drsw = []
+    out_curve_v = []
+    out_curve = []
+    out_curve2 = ['']
+    no_sw = True
+    flmold = -1
+    # store data
+    for item in modelData['Function-Specs']:  # is list of dicts
+        flm = int(item['Flight-Mode'])
+        flmt = ctx.flightmolist[flm]
+        fun = int(item['Function-Id'])
+        funt = ctx.functionlist[fun]
+        trim1 = item['Ph-Trim'][0]
+        trim2 = item['Ph-Trim'][1]
+        trim3 = item['Ph-Trim'][2]
+        trim4 = item['Ph-Trim'][3]
+        drneg = item['DR-Neg'][0]
+        drpos = item['DR-Pos'][0]
+        sw = jemoview.getSwitch(ctx, item['DR-Switch'])[1]
+        if sw != '-':
+            no_sw = False
+        exneg = item['Expo-Neg'][0]
+        expos = item['Expo-Pos'][0]
+        curve = jemoview.getCurve(ctx, item['Curve-Type'])[0]
+        curvedat = ''
+        curvepoints = ''
+        if item['Curve-Type'] == 1:  # constant
+            curvedat = '=' + str(item['Points-Out'][0])
+        if jemoview.getCurve(ctx, item['Curve-Type'])[1]: # is a ...-point curve
+            for jj in range(len(item['Points-In'])):
+                if curvepoints != '':
+                    curvepoints = curvepoints + '  '
+                curvepoints = curvepoints + str(item['Points-In'][jj]) + '|' + str(item['Points-Out'][jj])
+        delaya = jemoview.setDecPoint(1, item['Delay-Neg'])
+        delayb = jemoview.setDecPoint(1, item['Delay-Pos'])
+        curvedat = curvedat + '  -' + str(delaya) + ' +' + str(delayb) + '   ' + jemoview.getYesNo(ctx, item['FM-Delay'])
+        if flm != flmold:  # next flight mode with first function
+            if flmold != -1: # put data to buffer
+                out_trim_v.append([out_trim])
+                out_dr_v.append([out_dr])
+                out_expo_v.append([out_expo])
+                out_drsw_v.append([out_drsw])
+                if '|' in ''.join(out_curve2): # there are curve points, so write them
+                    out_curve_v.append([out_curve, out_curve2])
+                else:
+                    out_curve_v.append([out_curve])
+            flmold = flm
+            out_buf_l.append(flmt)
+            out_trim = []
+            out_dr = []
+            out_expo = []
+            out_drsw = []
+            out_curve = []
+            out_curve2 = ['']  # below the label
+        # continue within same flight mode
+        hit = False
+        for txt in jemoview.aferatg_txt:
+            if funt == txt:
+                hit = True
+                ii = jemoview.aferatg_txt.index(funt) % 7
+                trim = str(trim1)
+                if ctx.aferatgt[ii] == 2:
+                    trim = trim + ' / ' + str(trim2)
+                if ctx.aferatgt[ii] == 3:
+                    trim = trim + ' / ' + str(trim2) + ' / ' + str(trim3)
+                if ctx.aferatgt[ii] == 4:
+                    trim = trim + ' / ' + str(trim2) + ' / ' + str(trim3) + ' / ' + str(trim4)
+                out_trim.append(trim)
+        if not hit:
+            out_trim.append(str(trim1))
+        out_dr.append(str(drneg) + ' / ' + str(drpos))
+        out_expo.append(str(exneg) + ' / ' + str(expos))
+        out_drsw.append(sw)
+        out_curve.append(curve + curvedat)
+        out_curve2.append(curvepoints)
+    out_trim_v.append([out_trim])
+    out_dr_v.append([out_dr])
+    out_expo_v.append([out_expo])
+    out_drsw_v.append([out_drsw])
+    if '|' in ''.join(out_curve2): # we have curve points
+        out_curve_v.append([out_curve, out_curve2])
+    else:
+        out_curve_v.append([out_curve])
+
+    # write data
+    jemoview.writeTitle(ctx, ctx.msg['fmTrimTitle'])
+    jemoview.writeLine(ctx, out_title_trim)
+    jemoview.writeEssence(ctx, out_buf_l, out_trim_v)
+    jemoview.writeTitle(ctx, ctx.msg['dualRateTitle'])
+    jemoview.writeLine(ctx, out_title_dr)
+    jemoview.writeEssence(ctx, out_buf_l, out_dr_v)
+    jemoview.writeTitle(ctx, ctx.msg['dualRateSwitchesTitle'])
+    if no_sw:
+        jemoview.writeLine(ctx, ctx.msg['noSwitches'])
+    else:
+        jemoview.writeLine(ctx, out_title_sw)
+        jemoview.writeEssence(ctx, out_buf_l, out_drsw_v)
+    jemoview.writeTitle(ctx, ['Exponential'])
+    jemoview.writeLine(ctx, out_title_expo)
+    jemoview.writeEssence(ctx, out_buf_l, out_expo_v)
+    jemoview.writeTitle(ctx, ctx.msg['curvesTitle'])
+    jemoview.writeLine(ctx, out_title_curve)
+    jemoview.writeEssence(ctx, out_buf_l, out_curve_v)
+
+
+# time calling specsFunc for all models, returns seconds
+def timeSpecs(models, specsFunc, repeat):
+    best = None
+    for ii in range(repeat):
+        start = time.perf_counter()
+        for ctx, modelData in models:
+            ctx.rows = []
+            specsFunc(ctx, modelData)
+        total = time.perf_counter() - start
+        if best is None or total < best:
+            best = total
+    return best
+
+
+# memory allocated by specsFunc for all models: [sum of the peaks in bytes, number of blocks still allocated]
+def allocSpecs(models, specsFunc):
+    peak = 0
+    blocks = 0
+    tracemalloc.start()
+    for ctx, modelData in models:
+        ctx.rows = []
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        specsFunc(ctx, modelData)
+        peak += tracemalloc.get_traced_memory()[1] - start
+        blocks += sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename')) - before
+    tracemalloc.stop()
+    return [peak, blocks]
+
+
+def benchSpecs(args):
+    fileNames = sorted(glob.glob(os.path.join(glob.escape(args.folder), '*.jsn')))
+    if not fileNames:
+        print('no model files found:', args.folder)
+        return 1
+    # convert each model once to fill its context (and the cache of getSwitch), check that the rows are identical
+    models = []
+    specs = 0
+    for fileName in fileNames:
+        modelData = jemoview.readModel(fileName)[0]
+        ctx = jemoview.ModelContext(jemoview.options, jemoview.swsettings)
+        jemoview.extractDict(ctx, modelData)
+        ctx.rows = []
+        legacyFunctionspecs(ctx, modelData)
+        legacy = ctx.rows
+        ctx.rows = []
+        jemoview.functionspecs(ctx, modelData)
+        if ctx.rows != legacy:
+            print('different rows in', fileName)
+            return 1
+        models.append([ctx, modelData])
+        specs += len(modelData['Function-Specs'])
+    count = len(fileNames)
+    print(count, 'models,', specs // count, 'function specs per model (functions x flight modes)')
+    legacy = timeSpecs(models, legacyFunctionspecs, args.repeat)
+    single = timeSpecs(models, jemoview.functionspecs, args.repeat)
+    legacyPeak, legacyBlocks = allocSpecs(models, legacyFunctionspecs)
+    singlePeak, singleBlocks = allocSpecs(models, jemoview.functionspecs)
+    print('functionspecs 2023-08-27 : %8.1f us/model  peak %7.1f KiB/model  %6d blocks kept/model' %
+          (legacy * 1e6 / count, legacyPeak / count / 1024, legacyBlocks // count))
+    print('functionspecs one pass   : %8.1f us/model  peak %7.1f KiB/model  %6d blocks kept/model  speedup %.1fx' %
+          (single * 1e6 / count, singlePeak / count / 1024, singleBlocks // count, legacy / single))
+    return 0
+
+
+# telemdetect() of version 2023-08-27, stores each sensor as list of 256 parameters in sensordict
+# only needed as reference, ctx is a new ModelContext with decoded model
+def legacyTelemdetect(ctx, modelData):
+    jemoview.writeTitle(ctx, ctx.msg['sensorsTitle'])
+    jemoview.writeLine(ctx, ctx.msg['sensorsColumns'])
+    prio = ctx.msg['priorities']
+    # first extract U-Rx, A1 and A2 from Voice
+    voc = ['U-Rx', 'A1', 'A2']
+    voct = ctx.msg['receiverValues']
+    for ii in range(3):
+        rep = jemoview.getYesNo(ctx, modelData['Voice'][voc[ii]][0])
+        trig = jemoview.getYesNo(ctx, modelData['Voice'][voc[ii]][1])
+        priot = prio[modelData['Voice'][voc[ii]][2]]
+        jemoview.writeLine(ctx, [ctx.msg['receiver'], '', voct[ii], rep, trig, priot])
+    # now the others
+    if len(ctx.model.sensors) == 0:
+        return
+    key = ''
+    device = 256 * ['nix']
+    for sensor in ctx.model.sensors:
+        if sensor.label is not None:  # next device / sensor
+            if key != '':
+                ctx.sensordict[key] = device  # store parameter of previous device in dictionary
+            key = sensor.id
+            device = 256 * ['nix']
+            device[0] = sensor.label
+            jemoview.writeLine(ctx, [str(device[0]), 'ID  ' + jemoview.getDeviceID(key)])
+        for param in sensor.params:  # measurements
+            ind = param.index
+            if ind > len(device):
+                jemoview.zefix(ctx, 1)
+                return
+            device[ind] = param.label
+            header = ''
+            if key == param.sensorId:
+                name = str(device[0])
+            else:
+                name = 'ID  ' + str(param.sensorId)
+                header = ctx.msg['headerMissing']
+            rep = jemoview.getYesNo(ctx, param.repeat)
+            trig = jemoview.getYesNo(ctx, param.trigger)
+            priot = prio[param.prio]
+            if param.dataType == 9: # values of latitude or longitude etc cannot be spoken
+                out = [name, str(ind), str(device[ind]), '', '', '', header]
+            else:
+                out = [name, str(ind), str(device[ind]), rep, trig, priot, header]
+            jemoview.writeLine(ctx, out)
+    ctx.sensordict[key] = device  # store parameter of last device
+
+
+# time of calling detectFunc and looking up all parameters of all sensors with lookupFunc for all models
+# returns [seconds of detectFunc, seconds of the lookups]
+def timeSensors(models, detectFunc, lookupFunc, repeat):
+    bestDetect = None
+    bestLookup = None
+    for ii in range(repeat):
+        detect = 0.0
+        lookup = 0.0
+        for ctx, modelData, params in models:
+            ctx.sensordict = {}
+            ctx.rows = []
+            start = time.perf_counter()
+            detectFunc(ctx, modelData)
+            middle = time.perf_counter()
+            for key, param in params:
+                lookupFunc(ctx, key, param)
+            detect += middle - start
+            lookup += time.perf_counter() - middle
+        if bestDetect is None or detect < bestDetect:
+            bestDetect = detect
+        if bestLookup is None or lookup < bestLookup:
+            bestLookup = lookup
+    return [bestDetect, bestLookup]
+
+
+# lookup as done by the sections using sensordict up to version 2023-08-27
+def legacyLookup(ctx, key, param):
+    if key in ctx.sensordict:
+        return [ctx.sensordict[key][0], ctx.sensordict[key][param]]
+    return None
+
+
+def benchSensors(args):
+    fileNames = sorted(glob.glob(os.path.join(glob.escape(args.folder), '*.jsn')))
+    if not fileNames:
+        print('no model files found:', args.folder)
+        return 1
+    # the lookups are all parameters of all sensors (as done by alarms, vario, telemetry controls etc.)
+    # plus one unknown sensor per sensor
+    models = []
+    sizes = [0, 0]
+    sensors = 0
+    for fileName in fileNames:
+        modelData = jemoview.readModel(fileName)[0]
+        ctx = jemoview.ModelContext(jemoview.options, jemoview.swsettings)
+        jemoview.decodeModel(ctx, modelData)
+        params = []
+        for sensor in ctx.model.sensors:
+            params.append([-1, 0])
+            for param in sensor.params:
+                params.append([param.sensorId, param.index])
+        for ii, detectFunc in enumerate([legacyTelemdetect, jemoview.telemdetect]):
+            ctx.sensordict = {}
+            detectFunc(ctx, modelData)
+            sizes[ii] += jemoview.getFootprint(ctx.sensordict)
+        sensors += len(ctx.sensordict)
+        models.append([ctx, modelData, params])
+    count = len(fileNames)
+    lookups = sum(len(params) for ctx, modelData, params in models)
+    print(count, 'models,', sensors // count, 'sensors and', lookups // count, 'lookups per model')
+    legacy = timeSensors(models, legacyTelemdetect, legacyLookup, args.repeat)
+    sparse = timeSensors(models, jemoview.telemdetect, jemoview.getSensor, args.repeat)
+    print('256 slots 2023-08-27 : %8.1f KiB/model  telemdetect %7.1f us/model  lookups %6.3f us/lookup' %
+          (sizes[0] / count / 1024, legacy[0] * 1e6 / count, legacy[1] * 1e6 / lookups))
+    print('sparse dicts         : %8.1f KiB/model  telemdetect %7.1f us/model  lookups %6.3f us/lookup' %
+          (sizes[1] / count / 1024, sparse[0] * 1e6 / count, sparse[1] * 1e6 / lookups))
+    return 0
+
+
+# compare result with the saved run in fileName, returns 1 if a step is more than threshold percent slower
+# steps below minUs microseconds per model in both runs are too noisy and not compared
+def compareSections(result, fileName, threshold, minUs):
+    with open(fileName, 'r', encoding='utf-8') as filein:
+        saved = json.load(filein)
+    failed = 0
+    print('compared with', fileName, '(' + saved['version'] + ', ' + str(saved['models']) + ' models)')
+    for name in result['steps us/model']:
+        if name not in saved['steps us/model']:
+            continue
+        old = saved['steps us/model'][name]
+        new = result['steps us/model'][name]
+        if old < minUs and new < minUs:
+            continue
+        change = 100 * (new - old) / old if old > 0 else 100.0
+        if change > threshold:
+            print('REGRESSION %-20s %10.1f -> %10.1f us/model  %+.1f %%' % (name, old, new, change))
+            failed += 1
+    if failed > 0:
+        return 1
+    print('no step slower by more than %.1f %%' % threshold)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmarks for jemoview')
+    commands = parser.add_subparsers(dest='command', required=True)
+    parserRead = commands.add_parser('read', help='reading model files twice versus once')
+    parserRead.add_argument('folder', help='folder of model files (.jsn)')
+    parserRead.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported (default 5)')
+    parserRead.add_argument('--warm', action='store_true', help='do not drop the file cache before each read')
+    parserSwitch = commands.add_parser('switch', help='decoding of switches by getSwitch()')
+    parserSwitch.add_argument('folder', help='folder of model files (.jsn)')
+    parserSwitch.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported (default 5)')
+    parserSections = commands.add_parser('sections', help='time each step of the conversion')
+    parserSections.add_argument('folder', help='folder of model files (.jsn)')
+    parserSections.add_argument('--repeat', type=int, default=3, help='number of runs, the best one is reported (default 3)')
+    parserSections.add_argument('--save', metavar='FILE', help='store the result as json file')
+    parserSections.add_argument('--compare', metavar='FILE', help='fail if a step is slower than in this saved result')
+    parserSections.add_argument('--threshold', type=float, default=20.0, help='allowed slowdown in percent (default 20)')
+    parserSections.add_argument('--min-us', type=float, default=5.0, help='steps faster than this (us/model) are not compared (default 5)')
+    parserModel = commands.add_parser('model', help='memory and time of the decoded model')
+    parserModel.add_argument('folder', help='folder of model files (.jsn)')
+    parserModel.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported (default 5)')
+    parserSpecs = commands.add_parser('functionspecs', help='functionspecs() of version 2023-08-27 versus one pass')
+    parserSpecs.add_argument('folder', help='folder of model files (.jsn)')
+    parserSpecs.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported (default 5)')
+    parserSensors = commands.add_parser('sensors', help='sensordict of version 2023-08-27 (256 slots per sensor) versus sparse dicts')
+    parserSensors.add_argument('folder', help='folder of model files (.jsn)')
+    parserSensors.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported (default 5)')
+    args = parser.parse_args(argv)
+    if args.command == 'read':
+        return benchRead(args)
+    if args.command == 'switch':
+        return benchSwitch(args)
+    if args.command == 'sections':
+        return benchSections(args)
+    if args.command == 'model':
+        return benchModel(args)
+    if args.command == 'functionspecs':
+        return benchSpecs(args)
+    if args.command == 'sensors':
+        return benchSensors(args)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
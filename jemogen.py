@@ -0,0 +1,471 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# aufruf: python3 jemogen.py OUTDIR [--count N] [--size small|medium|huge] [--seed S]
+#
+# jeti model generator
+# program creates synthetic but valid jeti transmitter model files (.jsn) for load testing of jemoview
+# all top level sections read by jemoview are filled, the number of entries per section is configurable
+#
+# Copyright (c) 2020 - 2023, werinza (aka nikolausi / Klaus)
+# All Rights Reserved, Open Source MIT license applies to this program and related works
+#
+
+import argparse
+import json
+import os
+import random
+import sys
+
+# transmitter type codes as known by globalstr() of jemoview, 1 means transmitter version <5
+txTypes = [1, 652, 653, 674, 675, 676, 677, 678, 679, 680,
+           3857, 3858, 3859, 3860, 3861, 3862, 3863, 3864, 3865, 3866]
+txAccel = [653, 675, 676, 679, 680, 3858, 3860, 3862, 3864, 3865]
+
+# number of entries per section, keys are also the names of the command line options
+sizes = {
+    'small': {'functions': 6, 'servos': 6, 'flight-modes': 2, 'mixes': 2, 'logswitches': 4,
+              'sensors': 2, 'lua': 1, 'alarms': 3, 'sequences': 1, 'snaprolls': 1, 'timers': 2},
+    'medium': {'functions': 12, 'servos': 12, 'flight-modes': 5, 'mixes': 8, 'logswitches': 12,
+               'sensors': 6, 'lua': 4, 'alarms': 10, 'sequences': 4, 'snaprolls': 3, 'timers': 5},
+    'huge': {'functions': 30, 'servos': 24, 'flight-modes': 10, 'mixes': 40, 'logswitches': 24,
+             'sensors': 24, 'lua': 10, 'alarms': 40, 'sequences': 10, 'snaprolls': 10, 'timers': 10},
+}
+
+# standard functions with id, english and german labels as used by the transmitter
+stdFunctions = [(0, 'Ailerons', 'Quer'), (1, 'Elevator', 'Höhe'), (2, 'Rudder', 'Seite'),
+                (3, 'Throttle', 'Drossel'), (4, 'Gear', 'Fahrwerk'), (5, 'Airbrake.', 'Störkl.'),
+                (6, 'Flaps', 'Klappen'), (7, 'Mode', 'Mode'), (8, 'Gyro', 'Gyro'),
+                (9, 'Pitch', 'Pitch'), (10, 'Tow', 'Schlepp'), (11, 'Smoke', 'Rauch'),
+                (12, 'Light', 'Licht'), (13, 'Camera', 'Kamera')]
+userLabels = ['Bomb', 'Wheel', 'Hook', 'Door', 'Pump', 'Winch', 'Lamp', 'Spoil', 'Canopy',
+              'Horn', 'Chute', 'Retr', 'Tilt', 'Sound', 'Steer', 'Brake']
+# servo codes which are known to jemoview, 288 ... 299 are used for user defined functions
+servoCodes = [257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 271, 272, 273, 274,
+              275, 276, 277, 278, 279, 280, 281, 282, 283, 285, 287, 305, 306, 307, 308, 309, 310]
+flightModeLabels = ['Default', 'Speed', 'Thermal', 'Landing', 'Launch', 'Cruise', 'Acro',
+                    'Hover', 'Start', 'Reflex']
+sensorLabels = ['MUI 150', 'MVario 2', 'MGPS 2', 'MSpeed', 'RPM', 'Central Box', 'MT125',
+                'REX 10', 'Spirit', 'YGE 95', 'Temp', 'Fuel']
+paramLabels = ['Voltage', 'Current', 'Capacity', 'Altitude', 'Vario', 'Speed', 'Temp',
+               'Latitude', 'Longitude', 'Distance', 'Course', 'Rpm']
+# characters which need quoting in a csv file
+specialChars = [';', '"', '\n', 'ä', 'ß', '°']
+
+# sections not evaluated by jemoview but present in real model files
+extraSections = {
+    'Audio': {'Vol': 8, 'Order': 0},
+    'Commands': {'Cmd': 0},
+    'IQSData': {'Enabled': 0},
+    'Lua-Ctrl': {'Ctrl': [0, 0]},
+    'User-Menu': {'Items': 0},
+    'VoiceRec': {'Sens': 3},
+}
+
+
+class Generator:
+    __slots__ = ('rng', 'special', 'unknown', 'funcIds', 'servoIdx', 'timerIds', 'flightIds', 'sensors')
+
+    def __init__(self, seed, special=False, unknown=0.0):
+        self.rng = random.Random(seed)
+        self.special = special
+        self.unknown = unknown  # probability of values unknown to jemoview (counted as zefix)
+        self.funcIds = []
+        self.servoIdx = []
+        self.timerIds = []
+        self.flightIds = []
+        self.sensors = []  # list of [device id, number of parameters]
+
+    # a label, with special characters if requested
+    def label(self, base):
+        if self.special and self.rng.random() < 0.3:
+            return base + self.rng.choice(specialChars) + str(self.rng.randint(0, 9))
+        return base
+
+    # value unknown to jemoview with probability self.unknown, otherwise the known value
+    def odd(self, value, unknownValue):
+        if self.unknown and self.rng.random() < self.unknown:
+            return unknownValue
+        return value
+
+    # a switch as string of 8 integers, see getSwitch() of jemoview
+    def switch(self, allowEmpty=True):
+        rng = self.rng
+        if self.unknown and rng.random() < self.unknown:
+            return '0,0,0,0,0,0,' + str(rng.choice([24, 25, 31, 47, 72, 75, 98, 112, 126, 128])) + ',0'
+        kind = rng.randint(0, 9)
+        if allowEmpty and kind <= 2:
+            return '0,0,0,0,0,0,-1,0'
+        if kind <= 5:  # hardware control or switch
+            no = rng.randint(1, 26)
+            if no in [1, 2, 3, 4, 5, 6, 7, 8, 21, 22]:  # proportional control P
+                return ','.join(str(x) for x in [no, rng.randint(0, 1), 1, 0, rng.randint(0, 1),
+                                                 rng.randint(-4000, 4000), -1, rng.choice([0, -1])])
+            return ','.join(str(x) for x in [no, rng.randint(0, 1), 0, 0, 0,
+                                             rng.choice([-4000, 0, 4000]), -1, 0])
+        if kind == 6:  # logical switch, voice, telemetry control, accelerometer, sequencer, others
+            no7 = rng.choice(list(range(0, 24)) + list(range(32, 47)) + list(range(48, 64)) +
+                             list(range(64, 72)) + list(range(80, 90)) + list(range(90, 98)) +
+                             list(range(106, 112)) + list(range(116, 126)) + [127])
+            return '0,0,0,0,0,0,' + str(no7) + ',0'
+        if kind == 7 and self.timerIds:
+            return str(rng.choice(self.timerIds)) + ',0,0,0,0,0,76,0'
+        if kind == 8 and self.funcIds:
+            return str(rng.choice(self.funcIds)) + ',0,0,0,0,0,77,0'
+        if kind == 9 and self.flightIds:
+            return str(rng.choice(self.flightIds)) + ',0,0,0,0,0,79,0'
+        if self.servoIdx:
+            return str(rng.choice(self.servoIdx) - 1) + ',0,0,0,0,0,78,0'
+        return '0,0,0,0,0,0,-1,0'
+
+    def curve(self):
+        rng = self.rng
+        typ = self.odd(rng.choice([0, 0, 0, 1, 2, 5, 8, 9, 10, 11, 12]), 13)
+        points = {8: 3, 9: 5, 10: 7, 11: 9}.get(typ, 2)
+        pin = sorted(rng.sample(range(-100, 101), points))
+        pout = [rng.randint(-100, 100) for ii in range(points)]
+        return typ, pin, pout
+
+    def model(self, number, size, txType=None):
+        rng = self.rng
+        nfun = max(4, min(size['functions'], 30))
+        nservo = max(1, min(size['servos'], 24))
+        nfm = max(1, min(size['flight-modes'], 10))
+        ntim = min(size['timers'], 10)
+        nsens = size['sensors']
+        if txType is None:
+            txType = self.odd(rng.choice(txTypes), rng.choice([3867, 3868, 4000]))
+
+        # functions, standard functions first, then user defined functions starting at id 14
+        functions = []
+        self.funcIds = []
+        for ii in range(min(nfun, 14)):
+            fid, labEn, labDe = stdFunctions[ii]
+            functions.append({'ID': fid, 'Label': self.label(rng.choice([labEn, labEn, labDe])),
+                              'Control': self.switch(), 'Trim-Control': self.switch(),
+                              'Trim-Max': rng.randint(0, 100)})
+            self.funcIds.append(fid)
+        for ii in range(nfun - 14):
+            fid = 14 + ii
+            functions.append({'ID': fid, 'Label': self.label(userLabels[ii % len(userLabels)]),
+                              'Control': self.switch(), 'Trim-Control': self.switch(),
+                              'Trim-Max': rng.randint(0, 100)})
+            self.funcIds.append(fid)
+
+        # servos
+        servos = []
+        self.servoIdx = []
+        userfun = [fid for fid in self.funcIds if fid >= 14]
+        for ii in range(nservo):
+            if userfun and rng.random() < 0.3:
+                code = 288 + userfun.pop(0) - 14
+            else:
+                code = self.odd(rng.choice(servoCodes), rng.choice([269, 270, 284, 286]))
+            servos.append({'Index': ii, 'Servo-Code': code, 'Middle': rng.randint(-50, 50),
+                           'Max-Positive': rng.randint(50, 150), 'Max-Negative': rng.randint(50, 150),
+                           'Max-Positive-Limit': rng.randint(50, 150), 'Max-Negative-Limit': rng.randint(50, 150),
+                           'Servo-Reverse': rng.randint(0, 1), 'Delay-Positive': rng.randint(0, 50),
+                           'Delay-Negative': rng.randint(0, 50),
+                           'Curve': rng.choice([[0, 0, 0, 0, 0], [0, 3, -2, 0, 1]])})
+            self.servoIdx.append(ii + 1)
+
+        # timers
+        timers = []
+        self.timerIds = rng.sample(range(0, 10), ntim)
+        for tid in self.timerIds:
+            timers.append({'ID': tid, 'Label': self.label('Timer' + str(tid)),
+                           'Init-Time': rng.randint(0, 600) * 1000, 'Dest-Time': rng.randint(0, 900) * 1000,
+                           'Tim-Type': self.odd(rng.randint(0, 2), 3), 'Report-Type': self.odd(rng.randint(0, 4), 5),
+                           'Switch': self.switch(), 'Sw-Rst': self.switch()})
+
+        # flight modes, the first one is the default flight mode without switch
+        self.flightIds = rng.sample(range(0, 20), nfm)
+        trimfun = self.funcIds[:4]
+        flightmodes = []
+        for ii, fid in enumerate(self.flightIds):
+            typ, pin, pout = self.curve()
+            digitrim = []
+            for funcid in rng.sample(trimfun, 4):
+                digitrim.append({'FuncID': funcid, 'Value': rng.randint(-50, 50), 'Stored': rng.randint(-50, 50),
+                                 'Mode': self.odd(rng.randint(0, 4), 5), 'Step': rng.randint(1, 10),
+                                 'Max-Neg': rng.randint(0, 100), 'Max-Pos': rng.randint(0, 100)})
+            flightmodes.append({'ID': fid, 'Label': self.label(flightModeLabels[ii]),
+                                'Audio': rng.choice(['', 'fm' + str(ii) + '.wav']),
+                                'Delay': rng.randint(0, 30),
+                                'Switch': '0,0,0,0,0,0,-1,0' if ii == 0 else self.switch(False),
+                                'DigiTrim': digitrim,
+                                'VTail-Delta-Ailv': [rng.randint(-100, 100) for jj in range(6)],
+                                'ADiffSwitch': self.switch(), 'ADiffVal': rng.randint(-100, 100),
+                                'ADiffPos': [rng.randint(0, 100) for jj in range(4)],
+                                'ADiffNeg': [rng.randint(0, 100) for jj in range(4)],
+                                'BrakeSw': self.switch(), 'BkOffset': rng.randint(-100, 100),
+                                'BrakeMix': [rng.randint(-100, 100) for jj in range(10)],
+                                'BrakeDiff': [rng.randint(-100, 100) for jj in range(4)],
+                                'BrakeElevCurve': {'Curve-Type': typ, 'Points-In': pin, 'Points-Out': pout},
+                                'BkAdjustSwitch': self.switch(),
+                                'BrakeAdjust': [rng.randint(-100, 100) for jj in range(4)]})
+
+        # function specs, sorted by flight mode and function
+        funcspecs = []
+        for flm in range(nfm):
+            for fid in self.funcIds:
+                typ, pin, pout = self.curve()
+                funcspecs.append({'Flight-Mode': flm, 'Function-Id': fid,
+                                  'Ph-Trim': [rng.randint(-20, 20) for jj in range(4)],
+                                  'DR-Neg': [rng.randint(0, 125), rng.randint(0, 125)],
+                                  'DR-Pos': [rng.randint(0, 125), rng.randint(0, 125)],
+                                  'DR-Switch': self.switch(),
+                                  'Expo-Neg': [rng.randint(-100, 100), 0], 'Expo-Pos': [rng.randint(-100, 100), 0],
+                                  'Curve-Type': typ, 'Points-In': pin, 'Points-Out': pout,
+                                  'Delay-Neg': rng.randint(0, 20), 'Delay-Pos': rng.randint(0, 20),
+                                  'FM-Delay': rng.randint(0, 1)})
+
+        # free mixes, values are stored flight mode by flight mode
+        mixes = []
+        for ii in range(size['mixes']):
+            mixes.append([rng.choice(self.funcIds), rng.choice(self.funcIds), rng.randint(0, 1), rng.randint(0, 1)])
+        mixvalues = []
+        for flm in range(nfm):
+            for ii in range(len(mixes)):
+                typ, pin, pout = self.curve()
+                mixvalues.append({'Flight-Mode': flm, 'Intensity': rng.randint(-100, 100),
+                                  'Switch': self.switch(), 'Curve-Type': typ, 'Points-In': pin,
+                                  'Points-Out': pout, 'DelayN': rng.randint(0, 20), 'DelayP': rng.randint(0, 20),
+                                  'DelaySwN': rng.randint(0, 20), 'DelaySwP': rng.randint(0, 20),
+                                  'S-Output': [rng.randint(-100, 100) for jj in range(4)],
+                                  'S-OutputN': [rng.randint(-100, 100) for jj in range(4)],
+                                  'Direction': rng.randint(0, 1), 'M-Link': rng.randint(0, 2),
+                                  'S-Link': rng.randint(0, 2), 'M-Trim': rng.randint(0, 1), 'S-DR': rng.randint(0, 1)})
+
+        # logical switches, the transmitter always stores all 24 of them
+        logswitches = []
+        for ii in range(24):
+            if ii < size['logswitches']:
+                logswitches.append({'Index': ii, 'Enabled': rng.randint(0, 1), 'Label': self.label('L' + str(ii + 1)),
+                                    'Switch1': self.switch(False), 'Switch2': self.switch(),
+                                    'Log-Type': self.odd(rng.randint(0, 8), 9), 'Cond1': rng.randint(0, 6),
+                                    'Cond2': rng.randint(0, 6), 'Value1': rng.randint(-4000, 4000),
+                                    'Value2': rng.randint(-4000, 4000), 'Up-Type': rng.randint(0, 1),
+                                    'Dn-Type': rng.randint(0, 1), 'Up-Time': rng.randint(0, 50),
+                                    'Dn-Time': rng.randint(0, 50)})
+            else:
+                logswitches.append({'Index': ii, 'Enabled': 0, 'Label': '', 'Switch1': '0,0,0,0,0,0,-1,0',
+                                    'Switch2': '0,0,0,0,0,0,-1,0', 'Log-Type': 0, 'Cond1': 0, 'Cond2': 0,
+                                    'Value1': 0, 'Value2': 0, 'Up-Type': 0, 'Dn-Type': 0,
+                                    'Up-Time': 0, 'Dn-Time': 0})
+
+        # sensors, each device starts with a header (Param 0) followed by its measurements
+        telemdetect = []
+        self.sensors = []
+        for ii in range(nsens):
+            devid = rng.randint(-2**31, 2**31 - 1)
+            if abs(devid) < 65536:
+                devid += 2**20
+            npar = rng.randint(1, 8)
+            self.sensors.append([devid, npar])
+            telemdetect.append({'ID': devid, 'Param': 0, 'Label': self.label(sensorLabels[ii % len(sensorLabels)]),
+                                'Rep': 0, 'Trig': 0, 'Prio': 0, 'DataType': 0})
+            for jj in range(1, npar + 1):
+                telemdetect.append({'ID': devid, 'Param': jj, 'Label': self.label(paramLabels[(ii + jj) % len(paramLabels)]),
+                                    'Rep': rng.randint(0, 1), 'Trig': rng.randint(0, 1), 'Prio': rng.randint(0, 2),
+                                    'DataType': rng.choice([0, 1, 4, 9])})
+
+        def sensorRef():
+            if self.sensors and rng.random() < 0.9:
+                devid, npar = rng.choice(self.sensors)
+                return devid, rng.randint(1, npar)
+            return rng.randint(2**20, 2**30), 1  # missing sensor
+
+        telemvoice = []
+        for ii in range(min(nsens, 8)):
+            kind = rng.randint(0, 4)
+            if kind == 0:
+                key, parm = 0, rng.choice([0, 2, 3, 4, 12])
+            elif kind == 1 and self.timerIds:
+                key, parm = rng.choice(self.timerIds) + 1, 0
+                key = min(key, 10)
+            else:
+                key, parm = sensorRef()
+            telemvoice.append({'ID': key, 'Param': parm, 'Sw': self.switch()})
+
+        telctrl = []
+        for ii in range(16):
+            if ii < min(nsens, 16):
+                key, parm = sensorRef()
+                telctrl.append({'Index': ii, 'Enabled': rng.randint(0, 1), 'Label': self.label('MX' + str(ii + 1)),
+                                'Sensor-ID': key, 'Param': parm, 'Switch': self.switch(), 'Prop': rng.randint(0, 1),
+                                'Bin-Data': [rng.randint(0, 2), rng.randint(0, 50), rng.randint(-1000, 1000), rng.randint(0, 100)],
+                                'Prop-Data': [rng.randint(-1000, 0), rng.randint(-100, 100), rng.randint(0, 1000), rng.randint(0, 10)],
+                                'Decimals': rng.randint(0, 2), 'Default': rng.randint(-100, 100)})
+            else:
+                telctrl.append({'Index': ii, 'Enabled': 0, 'Label': '', 'Sensor-ID': 0, 'Param': 0,
+                                'Switch': '0,0,0,0,0,0,-1,0', 'Prop': 0, 'Bin-Data': [0, 0, 0, 0],
+                                'Prop-Data': [0, 0, 0, 0], 'Decimals': 0, 'Default': 0})
+
+        alarms = []
+        for ii in range(max(1, size['alarms'])):
+            if ii == 0:  # first alarm is always voltage of receiver
+                key, parm = 0, 0
+            else:
+                key, parm = sensorRef()
+            alarms.append({'Active': rng.randint(0, 1), 'Switch': self.switch(), 'Var-Greater': rng.randint(0, 1),
+                           'File': rng.choice(['', 'alarm.wav', 'beep.wav']), 'Sensor-ID': key,
+                           'Sensor-Param': parm, 'Decimals': rng.randint(0, 2), 'Value': rng.randint(0, 5000),
+                           'Repeat': self.odd(rng.randint(0, 2), 3), 'Voice': rng.randint(0, 1)})
+
+        vario = {'Mode': rng.randint(0, 3), 'Switch': self.switch(), 'Setting': []}
+        for ii in range(min(nsens, 3)):
+            key, parm = sensorRef()
+            vario['Setting'].append({'Sensor-ID': key, 'Sensor-Par': parm, 'Decimals': rng.randint(0, 2),
+                                     'DeadZPos': rng.randint(0, 50), 'DeadZNeg': rng.randint(-50, 0),
+                                     'Min': rng.randint(-500, 0), 'Center': 0, 'Max': rng.randint(0, 500),
+                                     'En': rng.randint(0, 1)})
+
+        lua = []
+        for ii in range(size['lua']):
+            data = []
+            for jj in range(rng.randint(1, 4)):
+                data.append('par' + str(jj))
+                for kk in range(2):
+                    choice = rng.randint(0, 2)
+                    if choice == 0:
+                        data.append(self.switch(False))
+                    elif choice == 1 and self.sensors:
+                        data.append(rng.choice(self.sensors)[0])
+                    else:
+                        data.append(rng.randint(0, 100))
+            lua.append({'appID': rng.randint(1, 60000), 'data': data})
+
+        displayed = []
+        for ii in range(rng.randint(0, 8)):
+            typ = rng.randint(0, 4)
+            item = {'Flight-Mode': 0, 'Item-Type': typ, 'ID': 0, 'Param': 0, 'DblSize': rng.randint(0, 1)}
+            if typ == 1 and self.timerIds:
+                item['ID'] = rng.choice(self.timerIds)
+            elif typ == 2:
+                item['ID'], item['Param'] = sensorRef()
+            elif typ == 3:
+                item['ID'] = rng.choice([1, 2, 4, 5, 7, 8, 9, 10, 11, 13])
+            elif typ == 4:
+                item['ID'] = lua[0]['appID'] if lua and rng.random() < 0.5 else rng.randint(1, 30)
+            else:
+                item['Item-Type'] = 0
+            displayed.append(item)
+        if nfm > 1:
+            displayed.append({'Flight-Mode': 1, 'Item-Type': 0, 'ID': 0, 'Param': 0, 'DblSize': 0})
+
+        sequences = []
+        for ii in range(10):
+            if ii < size['sequences']:
+                sequences.append({'ID': ii + 1, 'Switch': self.switch(False), 'Label': self.label('Seq' + str(ii + 1)),
+                                  'Override': rng.choice(self.servoIdx + [0]), 'Asymm': rng.randint(0, 1),
+                                  'Cycle': rng.randint(0, 1), 'Finish': rng.randint(0, 1)})
+            else:
+                sequences.append({'ID': ii + 1, 'Switch': '0,0,0,0,0,0,-1,0', 'Label': '', 'Override': 0,
+                                  'Asymm': 0, 'Cycle': 0, 'Finish': 0})
+
+        snaprolls = []
+        for ii in range(min(size['snaprolls'], nfm)):
+            snaprolls.append({'Flight-Mode': ii, 'Mode': rng.randint(0, 1), 'Master-Sw': self.switch(),
+                              'Switch': [self.switch() for jj in range(4)]})
+
+        controls = []
+        for no in rng.sample(range(1, 27), 6):
+            controls.append({'ID': no, 'Req-Pos': rng.randint(0, 3), 'Sw-On': rng.randint(-4000, 4000),
+                             'Sw-Off': rng.randint(-4000, 4000)})
+
+        name = 'Model' + str(number)
+        modelData = {
+            'Global': {'Version': txType, 'Type': 1, 'Name': self.label(name), 'Desc': self.label('synthetic'),
+                       'Model-Type': 1, 'Filename': str(number).zfill(4) + name[:4] + '.jsn',
+                       'Receiver-ID1': rng.randint(-2**31, 2**31 - 1), 'Receiver-ID2': 0,
+                       'TxVers': '5.0' + str(rng.randint(0, 9)), 'Rx-900': rng.randint(0, 1),
+                       'Rx-ID900': rng.randint(0, 2**31 - 1), 'Rx-900Sw': self.switch(),
+                       'txID': rng.randint(0, 2**31 - 1), 'Created': '2023-08-27'},
+            'Type-Specific': {'Type': 1, 'Model-Type': 'Aero', 'Wing-Type': rng.randint(0, 6),
+                              'Tail-Type': rng.randint(0, 5), 'Motor-Count': rng.randint(0, 2),
+                              'Gear-Servos': rng.randint(0, 3), 'Airbrake-Servos': rng.randint(0, 2),
+                              'Gyro1': rng.randint(0, 1), 'Gyro2': 0, 'Gyro3': 0},
+            'Common': {'Model-Time2': rng.randint(0, 360000), 'Time-Reset': rng.randint(0, 2),
+                       'ColorP': self.odd(rng.randint(0, 12), 13), 'Img': rng.choice(['', 'plane.png']), 'ImgBgPth': '',
+                       'Autotrim-Switch': self.switch(), 'Trainer-Switch': self.switch(),
+                       'Logging-Switch': self.switch(), 'Throtle-Cut-Switch': self.switch(),
+                       'Throtle-Idle-Switch': self.switch(), '24ch': rng.randint(0, 1),
+                       'Alrm-Enable-Morse': rng.randint(0, 1), 'RC-Switch': [self.switch()],
+                       'Log-Alms': rng.randint(0, 1), 'Save-Ctrl': [self.switch() for ii in range(4)],
+                       'Mnu-lft': self.switch(), 'Mnu-rgt': self.switch(), 'FM-Annonc': self.switch()},
+            'Functions': {'Data': functions},
+            'Servos': {'Data': servos},
+            'Flight-Modes': {'Data': flightmodes},
+            'Function-Specs': funcspecs,
+            'Timers': {'Data': timers},
+            'Controls': {'Data': controls},
+            'CtrlSound': {'Data': [[self.switch(False), rng.randint(0, 2)] for ii in range(3)]},
+            'Mixes-Main': {'Data': mixes},
+            'Mixes-Values': mixvalues,
+            'Sequence': sequences,
+            'SnapRolls': snaprolls,
+            'LogSwitch': {'Data': logswitches},
+            'Event-Sounds': {'Data': [{'Switch': self.switch(False), 'File': 'event' + str(ii) + '.wav',
+                                       'Repeat': rng.randint(0, 1)} for ii in range(rng.randint(0, 3))]},
+            'Voice': {'TimerSw': self.switch(), 'Timer-ID': rng.choice(self.timerIds or [0]),
+                      'RepeatSw': self.switch(), 'Timeout': rng.randint(5, 60), 'TrigSw': self.switch(),
+                      'U-Rx': [rng.randint(0, 1), rng.randint(0, 1), rng.randint(0, 2)],
+                      'A1': [rng.randint(0, 1), rng.randint(0, 1), rng.randint(0, 2)],
+                      'A2': [rng.randint(0, 1), rng.randint(0, 1), rng.randint(0, 2)]},
+            'Telem-Detect': {'Data': telemdetect},
+            'Telem-Voice': {'Data': telemvoice},
+            'Tel-Ctrl': {'Data': telctrl},
+            'Lua': lua,
+            'Displayed-Telemetry': displayed,
+            'Vario': vario,
+            'Alarms': {'Data': alarms},
+        }
+        if txType in txAccel:
+            modelData['Accel'] = {'NeutrZ': [rng.randint(-100, 100)], 'Filter': [rng.randint(0, 5) for ii in range(3)],
+                                  'Rate': [rng.randint(0, 100) for ii in range(3)],
+                                  'DeadZ': [rng.randint(0, 50) for ii in range(3)]}
+        else:
+            modelData['Accel'] = {}
+        modelData.update(extraSections)
+        return modelData
+
+
+# write count model files into folder outdir, returns list of file names
+def generateCorpus(outdir, count, size, seed=0, special=False, txType=None, unknown=0.0):
+    os.makedirs(outdir, exist_ok=True)
+    gen = Generator(seed, special, unknown)
+    names = []
+    for number in range(1, count + 1):
+        modelData = gen.model(number, size, txType)
+        fileName = os.path.join(outdir, modelData['Global']['Filename'])
+        with open(fileName, 'w', encoding='utf-8') as fileout:
+            # transmitter writes the whole model as one single line
+            json.dump(modelData, fileout, ensure_ascii=False, separators=(',', ':'))
+        names.append(fileName)
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='generate synthetic jeti model files (.jsn)')
+    parser.add_argument('outdir', help='folder for the generated model files')
+    parser.add_argument('--count', type=int, default=10, help='number of models (default 10)')
+    parser.add_argument('--size', choices=sorted(sizes), default='medium', help='preset of section sizes')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for reproducible corpora')
+    parser.add_argument('--tx', type=int, choices=txTypes, help='transmitter type code, default random')
+    parser.add_argument('--special', action='store_true', help='use csv special characters in labels')
+    parser.add_argument('--unknown', type=float, default=0.0, help='probability of values unknown to jemoview (default 0)')
+    for key in sizes['medium']:
+        parser.add_argument('--' + key, type=int, help='number of ' + key + ' (overrides --size)')
+    args = parser.parse_args(argv)
+    size = dict(sizes[args.size])
+    for key in size:
+        value = getattr(args, key.replace('-', '_'))
+        if value is not None:
+            size[key] = value
+    names = generateCorpus(args.outdir, args.count, size, args.seed, args.special, args.tx, args.unknown)
+    print(len(names), 'models written to', args.outdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,13 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 # aufruf: python3 jemoview.py oder python jemoview.py (je nachdem ob python V3 als python3 oder python installiert ist)
+# ohne GUI: python3 jemoview.py convert PATH... [--lang de|en] [--csvtarget samefolder|subfolder] [--jobs N] [--force]
+#           [--sections NAME,...] [--archive-out FILE], PATH may be a zip or tar archive
+# watch mode: python3 jemoview.py watch PATH... [--interval S] [--settle S]
+# sqlite export: python3 jemoview.py export PATH... --db FILE [--lang de|en] [--jobs N]
+# where-used index: python3 jemoview.py index PATH... [--index FILE], python3 jemoview.py lookup KEY... [--index FILE]
+# unknown data: python3 jemoview.py convert PATH... --report FILE, python3 jemoview.py unknown PATH... [--out FILE]
+# als Bibliothek / as library: import jemoview; jemoview.convert(model), jemoview.convertCsv(model), jemoview.decode(model)
 #
 # jeti model viewer
 # program extracts all relevant information from an input jeti transmitter file (.jsn)
@@ -10,63 +17,860 @@
 # All Rights Reserved, Open Source MIT license applies to this program and related works
 #
 
+from __future__ import annotations  # annotations like Switch | None of the dataclasses below for Python < 3.10
+import collections
+import csv
+import functools
+import glob
+import hashlib
+import io
 import json
 import os
 import re
 import sys
-import tkinter as tk
-from tkinter import filedialog, messagebox
+import time
+from dataclasses import dataclass
 
 progvers = 'jemoview;version 2023-08-27'
-# append a few extra columns as a hint for Excel (had problems with LUA details)
-progvers += ';3;4;5;6;7;8;9;10;11;12;13;14;15'
+# first row of csv file, append a few extra columns as a hint for Excel (had problems with LUA details)
+progrow = progvers.split(';') + [str(ii) for ii in range(3, 16)]
+# version of the content of the csv files, stored in the manifests (see getManifest), so csv files of an older
+# version are converted again. increase it with every change of the csv output, also if progvers stays the same
+csvFormat = 3
 
 aferatg_txt = ['Quer', 'Klappen', 'Höhe', 'Seite', 'Störkl.', 'Drossel', 'Fahrwerk',
                'Ailerons', 'Flaps', 'Elevator', 'Rudder', 'Airbrake.', 'Throttle', 'Gear']
+# index into ModelContext.aferatgt (number of servos) of the function labels above
+aferatg_ind = {txt: ii % 7 for ii, txt in enumerate(aferatg_txt)}
+
+# tables of switches, see getSwitch()
+# first position, but P3 and P4 are swapped due to a probable bug in transmitter, proportional and pyhysical switches
+switches1 = ('nix', 'P1', 'P2', 'P4', 'P3', 'P5', 'P6', 'P7', 'P8', 'SA', 'SB',
+             'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'P9',
+             'P10', 'SM', 'SN', 'SO', 'SP')
+switches7 = (
+    # seventh position, values from  0 to 31, logical switches
+    'Log1', 'Log2', 'Log3', 'Log4', 'Log5', 'Log6', 'Log7', 'Log8', 'Log9',
+    'Log10', 'Log11', 'Log12', 'Log13', 'Log14', 'Log15', 'Log16', 'Log17',
+    'Log18', 'Log19', 'Log20', 'Log21', 'Log22', 'Log23', 'Log24', '?zefix?',
+    '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
+    # seventh position, values from  32 to 47, voice commands
+    'V01', 'V02', 'V03', 'V04', 'V05', 'V06', 'V07', 'V08', 'V09', 'V10',
+    'V11', 'V12', 'V13', 'V14', 'V15', '?zefix?',
+    # seventh position, values from 48 to 63, telemetry controls
+    'MX1', 'MX2', 'MX3', 'MX4', 'MX5', 'MX6', 'MX7', 'MX8', 'MX9', 'MX10',
+    'MX11', 'MX12', 'MX13', 'MX14', 'MX15', 'MX16',
+    # seventh position, values from 64 to 79, accelerometers, special treatment in getSwitch for 76 -79
+    'GX', 'GY', 'GZ', 'G/L', 'G/R', 'GXL', 'GXR', 'GHi', '?zefix?', '?zefix?',
+    '?zefix?', '?zefix?', 'timer', 'function', 'servo', 'flight mode',
+    # seventh position, values from 80 to 89, sequencers
+    'Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6', 'Q7', 'Q8', 'Q9', 'Q10',
+    # seventh position, values from 90 to 129, CH = channels of ppm inputs, Tr = digital trims, C0 = Lua apps
+    'CH1', 'CH2', 'CH3', 'CH4', 'CH5', 'CH6', 'CH7', 'CH8', '?zefix?', '?zefix?',
+    '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Tr1', 'Tr2', 'Tr3',
+    'Tr4', 'Tr5', 'Tr6', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'C01', 'C02',
+    'C03', 'C04', 'C05', 'C06', 'C07', 'C08', 'C09', 'C10', '?zefix?',
+    'Log.MAX', '?zefix?', '?zefix?')
+# transmitter types, key is Version of Global
+txTyp = { # id: [transmitter-name, hasAccel (as boolean)]
+    652: ['DC-16 V2', False],
+    653: ['DS-16 V2', True],
+    674: ['DC-16', False],
+    675: ['DS-16', True],
+    676: ['DS-14', True],
+    677: ['DC-14', False],
+    678: ['DC-24', False],
+    679: ['DS-24', True],
+    680: ['DS-12', True],
+    3857: ['DC-14 V2', False],
+    3858: ['DS-14 V2', True],
+    3859: ['DC-24', False],
+    3860: ['DS-24', True],
+    3861: ['DC-16 V2', False],
+    3862: ['DS-16 V2', True],
+    3863: ['DC-14 V2', False],
+    3864: ['DS-14 V2', True],
+    3865: ['DS-12', True],
+    3866: ['DC-24 V2', False],
+}
+# list of hardware switches, needed for compensation read from settings
+swlist = ('SA', 'SB', 'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM', 'SN', 'SO', 'SP')
+# internal switch representation, 8 integers separated by commas
+switchpat = re.compile('[-+]?[0-9]+(?:,[-+]?[0-9]+){7}')
+
+
+# --------------------------------     message catalogs    --------------------------------------
+# all texts of the csv files, one catalog per language, the section functions use ctx.msg[key] only
+# texts with {} are completed by str.format(), lists are rows or tables indexed by a value of the model
+# further languages are read by loadCatalogs() from files jemoview-xx.json (xx = language code)
+# in the folder of jemoview.py, keys missing there are taken from the English catalog
+catalogs = {
+    'de': {
+        'accelTitle': ['Bewegungssensor:'],
+        'accelColumns': ['Achse', 'Glättung', 'Empfindlich.', 'Totzone', 'Pitch Offset'],
+        'alarmsTitle': ['Alarme:'],
+        'commandsTitle': ['Sprachkommandos:'],
+        'modelOptionsTitle': ['Spezielle Modelloptionen:'],
+        'loggingTitle': ['Aufzeichnung Senderstatus:'],
+        'logAlarms': 'Aufzeichnung Alarme',
+        'controlsTitle': ['Sticks/Schalter Setup:'],
+        'controlsColumns': ['Stick/Schalter', 'Vor-Flug Position', 'kompensiert mit settings', 'Schalter EIN', 'Schalter AUS'],
+        'ctrlSoundTitle': ['Proportionalgeber', 'Ton'],
+        'telemDisplayColumns': ['Nummer', 'Inhalt', 'Zoom'],
+        'eventSoundsTitle': ['Sprachausgabe/Ereignis:'],
+        'eventSoundsColumns': ['Schalter', 'Datei', 'Wiederholen'],
+        'flightModesTitle': ['Flugphasen: allgemeine Daten  '],
+        'aileronDiffTitle': ['Querruderdifferenzierung'],
+        'butterflyTitle': ['Butterfly'],
+        'functionsTitle': ['Funktions+Geberzuordnung:'],
+        'functionsColumns': ['Nummer', 'Funktion', 'Geber', 'Trim', 'Trim max'],
+        'fmTrimTitle': ['Flugphasentrimmung', '(Servos)'],
+        'dualRateTitle': ['Dual Rate', '(Werte für Position 1)'],
+        'dualRateSwitchesTitle': ['Dual Rate Schalter'],
+        'curvesTitle': ['Funktionskurven', 'Kurventyp   -Verzög+   FPVerzög'],
+        'globalTitle': ['Globale Einstellungen:'],
+        'logSwitchTitle': ['Logische Schalter:'],
+        'logSwitchColumns': ['Nummer', 'Titel', 'Aktiv', 'Geber1', 'Spezifkation1', 'Geber2', 'Spezifkation2', 'Zustand', 'Verzögerung'],
+        'mixesTitle': ['Freie Mischer: Übersicht'],
+        'mixesColumns': ['Von', 'Zu', 'Flugphasen', 'Asymetricher Gas Mischer'],
+        'mixesFmTitle': ['Freie Mischer: Flugphasen', '', '', '', '', 'Verzögerung'],
+        'mixesFmColumns': ['Mischer', 'Flugphase', 'Master-Wert', 'Schalter', 'Kurve', '-Basis+       -Schalter+', 'Mix-Ausgabe +', 'Mix-Ausgabe -', 'nur vorwärts', 'Master Link', 'Slave Link', 'Trim', 'Slave Dual-Rate'],
+        'mixesPivotTitle': ['Freie Mischer: Master-Wert je Flugphase'],
+        'mixesPivotColumn': 'Mischer',
+        'sequenceTitle': ['Sequenzer:'],
+        'servosTitle': ['Servozuordnung:'],
+        'servosColumns': ['Steckplatz', 'Servo', 'Mittenverstellung', 'Max. positiv', 'Max. negativ', 'Limit positiv', 'Limit negativ', 'Wegumkehr', 'Verzög. pos/neg', 'Servobalancer'],
+        'telCtrlTitle': ['Telemetriegeber:'],
+        'telCtrlColumns': ['Nummer', 'Titel', 'Sensor', 'Messwert', 'Gebertyp', 'X < = > / Min', 'Schwellwert / Mitte', 'Toleranz / Max', 'Dauer / Glättung', 'Standardw %', 'Switch', 'Aktiv'],
+        'sensorsTitle': ['Sensoren und Einstellungen:'],
+        'telemVoiceTitle': ['Einzelsprachansagen:'],
+        'telemVoiceColumns': ['Schalter', 'Sensor', 'Messwert'],
+        'timersTitle': ['Stoppuhren:'],
+        'timersColumns': ['Stoppuhr Nummer', 'Name', 'Startwert', 'Zielwert', 'Timer-Typ', 'Signalisierung', 'Schalter', 'Resetschalter'],
+        'typeTitle': ['Grundeinstellungen:'],
+        'userMenuTitle': ['Benutzermenü:'],
+        'voiceTitle': ['Sprachausgabe:'],
+        'telemetry': ['Telemetrie'],
+        'assignedTitle': ['zugewiesene Geber und Schalter:'],
+        'colorProfile': 'Farbprofil',
+        'autoTrimSwitch': 'Autotrimm-Schalter',
+        'trainerSwitch': 'Trainerschalter',
+        'startLoggingSwitch': 'Start-Logging Schalter',
+        'startLoggingAuto': ['Start-Logging Schalter', 'Auto'],
+        'throttleCutSwitch': 'Motor-AUS Schalter',
+        'throttleIdleSwitch': 'Leerlaufschalter',
+        'wirelessTitle': ['Drahtlosmodus/Trainer:'],
+        'multimode24': '24-Kanal Multimode aktiv',
+        'morseCodeAlarmsEnabled': 'Morsecode Alarme eingeschaltet',
+        'rcSwitch': 'RC Schalter',
+        'switchToPreviousPage': 'Wähle vorherige Seite',
+        'switchToFollowingPage': 'Wähle folgende Seite',
+        'noSounds': ['keine Töne'],
+        'noDisplay': ['keine Anzeige'],
+        'noEvent': ['kein Ereignis'],
+        'announceCurrentFlightMode': 'Ansage der gewählten Flugphase',
+        'noDigitalTrim': ['keine Digitaltrimmung'],
+        'aileronDiffColumns2': ['Flugphase', 'Geber', 'Wirkung', 'Pos S1 / S2', 'Neg S1 / S2'],
+        'aileronDiffColumns4': ['Flugphase', 'Geber', 'Wirkung', 'Pos S1 / S2 / S3 / S4', 'Neg S1 / S2 / S3 / S4'],
+        'noSwitches': ['keine Schalter'],
+        'txVersionOld': ['Sender Version', '< 3'],
+        'noLuaApp': ['keine Lua App'],
+        'noMixes': ['keine Mischer'],
+        'noSequencer': ['keine Sequenzer'],
+        'noSnapRolls': ['keine Snap Rolls'],
+        'noTelemetryControls': ['keine Telemetriegeber'],
+        'noVoiceAnnouncements': ['keine Sprachansagen'],
+        'modelTime': 'Flugzeit',
+        'noTimers': ['keine Stoppuhren'],
+        'varioDeprecated': ['Daten in veraltetem Format', 'Sender updaten'],
+        'noVario': ['kein Vario'],
+        'noVoiceOutput': ['keine Sprachausgabe'],
+        'imageTitle': ['Modellbild & Farbgebung'],
+        'modelImage': 'Modellbild',
+        'backgroundImage': 'Hintergrundbild',
+        'mainScreenTitle': ['Hauptseite:'],
+        'vtailColumns': ['Flugphase', 'Höhe S1 / S2', 'Seite S1 / S2'],
+        'deltaColumns': ['Flugphase', 'Höhe S1 / S2', 'Quer S1 / S2'],
+        'switch': 'Schalter',
+        'varioColumns': ['Sensor', 'Messwert', 'Totzone -', 'Totzone +', 'Weite -', 'Center', 'Weite +', 'Aktiv'],
+        'no': 'nein',
+        'yes': 'ja',
+        'curveTypes': ['Standard', 'konstant', 'x>0', 'x<0', '|x|', '+positiv', '-negativ', 'symmetrisch', '3-Punkt', '5-Punkt', '7-Punkt', '9-Punkt', 'Gyro'],
+        'alarmsColumns': ['Nummer', 'Sensor', 'Wert', 'X <= / >', 'Schwellwert', 'Audio', 'AktivierungSw', 'Wiederholen', 'Sprachausgabe', 'Aktiv'],
+        'receiver': 'Empfänger',
+        'voltageRx': 'RX-Spannung',
+        'logControls': 'Aufzeichnung Geber',
+        'none': 'keine',
+        'prefPositions': ['', 'Unten/AUS', 'Oben/EIN', 'Mitte'],
+        'center': 'Mitte',
+        'voice': 'Sprache',
+        'defaultFm': 'Standard',
+        'telemDisplay': 'Telemetrieanzeige',
+        'ofFm': '(der Flugphase  {})',
+        'ofDefaultFm': '(der Standard Flugphase  {})',
+        'telemDisplaySystem': ['?zefix?', 'Flugphasen', 'Antenne', '?zefix?', 'RX-Spannung', 'Besitzer', '?zefix?', 'Jetibox', 'Trim', 'Tx Akku', 'Flugzeit', 'Antenne 900MHz', '?zefix?', 'Modellbild', '?zefix?'],
+        'empty': 'leer',
+        'missing': '{} fehlt',
+        'flightModesColumns': ['Nummer', 'Titel', 'Verzögerung', 'Schalter', 'Audio'],
+        'isDefault': 'ist Standard',
+        'digitalTrim': 'Digitaltrimmung',
+        'digitalTrimColumns': ['Funktion', 'Wert', 'Gespeichert', 'Mode', 'Schritt', 'Weg -', ' Weg +'],
+        'digitalTrimModes': ['Zentriert', 'Linear', 'Dros-Min', 'Dros-50%', 'Dros-Voll'],
+        'flightModesOf': 'Flugphasen: {}',
+        'vtailMix': 'V-Leitwerksmischer',
+        'butterflyColumns': ['Flugphase', 'Geber', 'Offset'],
+        'butterflyAilerons2': ['Quer S1 / S2', 'Dif. Einst. S1 / S2'],
+        'butterflyAilerons4': ['Quer S1 / S2 / S3 / S4', 'Dif Einst. S1 / S2 / S3 / S4'],
+        'butterflyFlaps2': 'Klappen S1 / S2',
+        'butterflyFlaps4': 'Klappen S1 / S2 / S3 / S4',
+        'butterflyElevator1': 'Höhe S1',
+        'butterflyElevator2': 'Höhe S1 / S2',
+        'butterflyTuning': ['Höhe Kurve', 'Fein. Geber', 'Dif. Einst.', 'Quer', 'Klappen', 'Höhe'],
+        'flightMode': 'Flugphase',
+        'functionSwitch': '{} Schalter',
+        'functionCurve': '{} Kurve',
+        'txType': 'Sender Typ',
+        'isUnknown': 'ist unbekannt',
+        'txVersion': 'Sender Version',
+        'filename': 'Dateiname',
+        'modelType': 'Modelltyp',
+        'modelTypes': ['Flugzeug', 'Heli', 'Truck/Boat', 'X-Copter'],
+        'fmDependent': 'Flugphasen abhängig',
+        'mixFromTo': '{} zu {}',
+        'sequenceColumns': ['Nummer', 'Titel', 'Schalter', 'Beeinflusst Kanal', 'Sequenzertyp', 'Zyklisch wiederholt', 'Sequenz immer beenden'],
+        'symmetrical': 'symmetrisch',
+        'asymmetrical': 'asymmetrisch',
+        'servoNames': ['Querruder1', 'Querruder2', 'Querruder3', 'Querruder4', 'Klappe1', 'Klappe2', 'Klappe3', 'Klappe4', 'Seite1', 'Seite2', 'Höhe1', 'Höhe2', '?zefix?', '?zefix?', 'Drossel1', 'Drossel2', 'Drossel3', 'Drossel4', 'Fahrwerk1', 'Fahrwerk2', 'Fahrwerk3', 'Fahrwerk4', 'Störkl.1', 'Störkl.2', 'Roll', 'Nick', 'Pitch', '?zefix?', 'Heck', '?zefix?', 'Gyroempf.', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Gyroempf.2', 'Gyroempf.3', 'Gimbal R', 'Gimbal P', 'Gimbal Y', 'Mode', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?'],
+        'deltaMix': 'Delta/Elevon Mischer',
+        'snapRollsColumns': ['Flugphase', 'Mode', 'Master Switch', 'Schalter Höhe/rechts', 'Schalter Tiefe/rechts', 'Schalter Höhe/links', 'Schalter Tiefe/links'],
+        'sensorsColumns': ['Sensor', '', 'Messwert', 'Wiederholen', 'Trigger', 'Wichtigkeit'],
+        'priorities': ['Niedrig', 'Mittel', 'Hoch'],
+        'receiverValues': ['Rx-Spannung', 'Antenne 1', 'Antenne 2'],
+        'headerMissing': 'Kopfsatz fehlt',
+        'telemVoiceSystem': ['?zefix?', '?zefix?', 'Antenne 1', 'Antenne 2', 'RX-Spannung', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Q (Rx1)'],
+        'doesNotExist': 'existiert nicht',
+        'timersResetModes': ['Kein', 'kurz', 'Alle'],
+        'timersReset': ['Zurücksetzen-Timer', '(beim Start):'],
+        'timerTypes': ['Standard', 'durchlaufend', 'Rundenzeit'],
+        'timerReportTypes': ['Kein', 'Beep 1', 'Beep 2', 'Sprache', 'Sprache (Pos.)'],
+        'wingTypes': ['1 Querruder', '2 Querruder', '2 QR | 1 WK', '2 QR | 2 WK', '4 QR | 2 WK', '2 QR | 4 WK', '4 QR | 4 WK'],
+        'tailTypes': ['Kreuz- od T-LW: 1HR 1SR', 'V-LW 2 Servos', 'Ailvator 2HR 1SR', '2HR / 2SR', 'kein LW (Delta/Elevon)', 'Kein'],
+        'wingType': 'Tragfläche',
+        'tailType': 'Leitwerk',
+        'engineCount': 'Antrieb(e)',
+        'gearServos': 'Fahrwerk-Servos',
+        'airbrakeServos': 'Störklappenservos',
+        'varioModes': ['Aus', 'Alarm JB Profi', 'Wert EX', 'Lua'],
+        'repeatEvery': 'Wiederh. nach',
+        'triggerSwitch': 'Trigger Schalter',
+        'invalidModel': 'Datei {} ist kein gültiges Modell\n',
+        'unreadableFile': 'Datei {} nicht lesbar\n',
+        'noSubfolder': 'konnte Unterordner csv nicht anlegen\n',
+        'notModelFile': 'Datei {} ist keine Modell Datei (.jsn), nicht konvertiert\n',
+        'modelError': 'Fehler bei Modell\n{}\nGrund: ',
+        'unknownData': 'unbekannte Daten in Modell\n{}\nbitte Modell im jetiforum.de einstellen',
+        'reportSummary': '{} von {} Modellen konvertiert',
+        'reportUnreadable': 'nicht lesbar',
+        'reportInvalid': 'kein gültiges Modell',
+        'reportError': 'Fehler bei der Konvertierung',
+        'reportUnwritable': 'nicht schreibbar',
+        'reportUnknown': 'unbekannte Daten, bitte im jetiforum.de einstellen',
+    },
+    'en': {
+        'accelTitle': ['Accelerometer:'],
+        'accelColumns': ['Axis', 'Filtering', 'Sensitivity', 'Dead Zone', 'Pitch Offset'],
+        'alarmsTitle': ['Alarms:'],
+        'commandsTitle': ['Voice Commands :'],
+        'modelOptionsTitle': ['Other Model Options:'],
+        'loggingTitle': ['Logging transmitter status info:'],
+        'logAlarms': 'Log alarms',
+        'controlsTitle': ['Sticks/Switches Setup:'],
+        'controlsColumns': ['Stick/Switch', 'Required pre-fl. pos.', 'compensated with settings', 'Switch On', 'Switch Off'],
+        'ctrlSoundTitle': ['Proportional Controls', 'Sound'],
+        'telemDisplayColumns': ['Number', 'Content', 'Double'],
+        'eventSoundsTitle': ['Sounds on Event'],
+        'eventSoundsColumns': ['Switch', 'File', 'Repeat'],
+        'flightModesTitle': ['Flight Modes: general data  '],
+        'aileronDiffTitle': ['Aileron Differential'],
+        'butterflyTitle': ['Butterfly/Flaps'],
+        'functionsTitle': ['Functions Assignment:'],
+        'functionsColumns': ['Number', 'Function', 'Control', 'Trim', 'Trim max'],
+        'fmTrimTitle': ['Flight Mode Trim', '(Servos)'],
+        'dualRateTitle': ['Dual Rate', '(values of Position 1)'],
+        'dualRateSwitchesTitle': ['Dual Rate switches'],
+        'curvesTitle': ['Function Curves', 'Curve type   -Delay+   FM.Delay'],
+        'globalTitle': ['Global Settings:'],
+        'logSwitchTitle': ['Logical Switches:'],
+        'logSwitchColumns': ['Number', 'Label', 'Enabled', 'Control1', 'Specification1', 'Control2', 'Specification2', 'Condition', 'Delay'],
+        'mixesTitle': ['Free Mixes: Overview'],
+        'mixesColumns': ['From', 'To', 'Flight Mode', 'Throttle Asymmetric Mix'],
+        'mixesFmTitle': ['Free Mixes: Flight Modes', '', '', '', '', 'Delay'],
+        'mixesFmColumns': ['Mix', 'Flight Mode', 'Master Value', 'Switch', 'Curve', '-Source+    -Switch+', 'Mix Output +', 'Mix Output -', 'Single direction', 'Master Link', 'Slave Link', 'Trim', 'Slave Dual-Rate'],
+        'mixesPivotTitle': ['Free Mixes: Master Value per Flight Mode'],
+        'mixesPivotColumn': 'Mix',
+        'sequenceTitle': ['Sequencer:'],
+        'servosTitle': ['Servo Assignment:'],
+        'servosColumns': ['Slot', 'Servo', 'Subtrim', 'Max positive', 'Max negative', 'Max positive limit', 'Max negative limit', 'Reverse', 'Delay positive/negative', 'Servo balancer'],
+        'telCtrlTitle': ['Telemetry Controls:'],
+        'telCtrlColumns': ['Number', 'Label', 'Sensor', 'Measurement', 'Type of control', 'X < = > / Min', 'Decision level / Center', 'Hysteresis / Max', 'Duration / Filtering', 'Default %', 'Switch', 'Enabled'],
+        'sensorsTitle': ['Sensors & Variables:'],
+        'telemVoiceTitle': ['Single voice announcements'],
+        'telemVoiceColumns': ['Switch', 'Sensor', 'Measurement'],
+        'timersTitle': ['Timers:'],
+        'timersColumns': ['Timer Number', 'Label', 'Initial value', 'Target value', 'Timer type', 'Report type', 'Switch', 'Reset switch'],
+        'typeTitle': ['Basic Properties'],
+        'userMenuTitle': ['User-Menu:'],
+        'voiceTitle': ['Voice Output:'],
+        'telemetry': ['Telemetry'],
+        'assignedTitle': ['assigned controls and switches:'],
+        'colorProfile': 'Color profile',
+        'autoTrimSwitch': 'Auto-Trim switch',
+        'trainerSwitch': 'Trainer switch',
+        'startLoggingSwitch': 'Start-Logging switch',
+        'startLoggingAuto': ['Start-Logging switch', 'Auto'],
+        'throttleCutSwitch': 'Throttle-Cut switch',
+        'throttleIdleSwitch': 'Throttle-Idle switch',
+        'wirelessTitle': ['Wireless Modes/Trainer:'],
+        'multimode24': '24-Channels Multimode active',
+        'morseCodeAlarmsEnabled': 'Morse Code Alarms enabled',
+        'rcSwitch': 'RC-Switch',
+        'switchToPreviousPage': 'Switch to previous page',
+        'switchToFollowingPage': 'Switch to following page',
+        'noSounds': ['no sounds'],
+        'noDisplay': ['no display'],
+        'noEvent': ['no event'],
+        'announceCurrentFlightMode': 'Announce current flight mode',
+        'noDigitalTrim': ['no Digital Trim'],
+        'aileronDiffColumns2': ['Flight Mode', 'Control', 'Adjust', 'Up S1 / S2', 'Down S1 / S2'],
+        'aileronDiffColumns4': ['Flight Mode', 'Control', 'Adjust', 'Up S1 / S2 / S3 / S4', 'Down S1 / S2 / S3 / S4'],
+        'noSwitches': ['no switches'],
+        'txVersionOld': ['Transmitter Version', '< 3'],
+        'noLuaApp': ['no Lua App'],
+        'noMixes': ['no mixes'],
+        'noSequencer': ['no sequencer'],
+        'noSnapRolls': ['no snap rolls'],
+        'noTelemetryControls': ['no telemetry controls'],
+        'noVoiceAnnouncements': ['no voice announcements'],
+        'modelTime': 'Model Time',
+        'noTimers': ['no timers'],
+        'varioDeprecated': ['Deprecated data format', 'update transmitter'],
+        'noVario': ['no vario'],
+        'noVoiceOutput': ['no voice output'],
+        'imageTitle': ['Model Image & Colors'],
+        'modelImage': 'Model image',
+        'backgroundImage': 'Background image',
+        'mainScreenTitle': ['Main Screen:'],
+        'vtailColumns': ['Flight Mode', 'Elevator S1 / S2', 'Rudder S1 / S2'],
+        'deltaColumns': ['Flight Mode', 'Elevator S1 / S2', 'Ailerons S1 / S2'],
+        'switch': 'Switch',
+        'varioColumns': ['Sensor', 'Measurement', 'Dead Zone -', 'Dead Zone +', 'Range -', 'Center', 'Range +', 'Enabled'],
+        'no': 'no',
+        'yes': 'yes',
+        'curveTypes': ['Standard', 'Constant', 'x>0', 'x<0', '|x|', '+positive', '-negative', '±symmetric', '3-point', '5-point', '7-point', '9-point', 'Gyro'],
+        'alarmsColumns': ['Number', 'Sensor', 'Value', 'X <= / >', 'Threshold', 'Audio', 'ActivationSw', 'Repeat', 'Ann cur val by voice', 'Enabled'],
+        'receiver': 'Receiver',
+        'voltageRx': 'Voltage Rx',
+        'logControls': 'Log input controls',
+        'none': 'none',
+        'prefPositions': ['', 'Bottom/Off', 'Top/On', 'Center'],
+        'center': 'Center',
+        'voice': 'Voice',
+        'defaultFm': 'Default',
+        'telemDisplay': 'Displayed-Telemetry',
+        'ofFm': '(of Flight Mode  {})',
+        'ofDefaultFm': '(of Default Flight Mode  {})',
+        'telemDisplaySystem': ['?zefix?', 'Flight Modes', 'Antenna', '?zefix?', 'Voltage RX', 'User Name', '?zefix?', 'Jetibox', 'Trim', 'Tx Battery', 'Model Time', 'Antenna 900MHz', '?zefix?', 'Model Image', '?zefix?'],
+        'empty': 'empty',
+        'missing': '{} missing',
+        'flightModesColumns': ['Number', 'Label', 'Delay', 'Switch', 'Audio'],
+        'isDefault': 'is default',
+        'digitalTrim': 'Digital Trim',
+        'digitalTrimColumns': ['Function', 'Value', 'Stored', 'Mode', 'Step', 'Rate -', ' Rate +'],
+        'digitalTrimModes': ['Centered', 'Linear', 'Thro-Low', 'Thr-L 50%', 'Thro-High'],
+        'flightModesOf': 'Flight Modes: {}',
+        'vtailMix': 'V-Tail Mix',
+        'butterflyColumns': ['Flight Mode', 'Control', 'Offset'],
+        'butterflyAilerons2': ['Ailerons S1 / S2', 'Dif. adjust S1 / S2'],
+        'butterflyAilerons4': ['Ailerons S1 / S2 / S3 / S4', 'Dif. adjust S1 / S2 / S3 / S4'],
+        'butterflyFlaps2': 'Flaps S1 / S2',
+        'butterflyFlaps4': 'Flaps S1 / S2 / S3 / S4',
+        'butterflyElevator1': 'Elevator S1',
+        'butterflyElevator2': 'Elevator S1 / S2',
+        'butterflyTuning': ['Elevator Curve', 'Tuning Control', 'Dif. Adjust', 'Ailerons', 'Flaps', 'Elevator'],
+        'flightMode': 'Flight Mode',
+        'functionSwitch': '{} Switch',
+        'functionCurve': '{} Curve',
+        'txType': 'Transmitter type',
+        'isUnknown': 'is unknown',
+        'txVersion': 'Transmitter version',
+        'filename': 'Filename',
+        'modelType': 'Model type',
+        'modelTypes': ['Aero', 'Heli', 'General', 'X-Copter'],
+        'fmDependent': 'Flight Mode dependent',
+        'mixFromTo': '{} to {}',
+        'sequenceColumns': ['Number', 'Label', 'Switch', 'Overwrite channel', 'Type of path', 'Cycling', 'Always finish sequence'],
+        'symmetrical': 'symmetrical',
+        'asymmetrical': 'asymmetrical',
+        'servoNames': ['Aileron1', 'Aileron2', 'Aileron3', 'Aileron4', 'Flap1', 'Flap2', 'Flap3', 'Flap4', 'Rudder1', 'Rudder2', 'Elevator1', 'Elevator2', '?zefix?', '?zefix?', 'Throttle1', 'Throttle2', 'Throttle3', 'Throttle4', 'Gear1', 'Gear2', 'Gear3', 'Gear4', 'Airbrake1', 'Airbrake2', 'Roll', 'Elevator', 'Pitch', '?zefix?', 'Yaw', '?zefix?', 'Gyro sens.', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Gyro sens.2', 'Gyro sens.3', 'Gimbal R', 'Gimbal P', 'Gimbal Y', 'Mode', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?'],
+        'deltaMix': 'Delta/Elevon Mix',
+        'snapRollsColumns': ['Flight Mode', 'Mode', 'Master Switch', 'Sw up/right', 'Sw down/right', 'Sw up/left', 'Sw down/left'],
+        'sensorsColumns': ['Sensor', '', 'Measurement', 'Repeat', 'Trigger', 'Priority'],
+        'priorities': ['Low', 'Medium', 'High'],
+        'receiverValues': ['Voltage Rx', 'Antenna 1', 'Antenna 2'],
+        'headerMissing': 'header missing',
+        'telemVoiceSystem': ['?zefix?', '?zefix?', 'Antenna 1', 'Antenna 2', 'Voltage RX', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Q (Rx1)'],
+        'doesNotExist': 'does not exist',
+        'timersResetModes': ['None', 'Short reset', 'All'],
+        'timersReset': ['Timers reset', '(at power up):'],
+        'timerTypes': ['Standard', 'Free-Running', 'Laps'],
+        'timerReportTypes': ['None', 'Beep 1', 'Beep 2', 'Voice', 'Voice (Up)'],
+        'wingTypes': ['0 Flaps | 1 Ail', '0 Flaps | 2 Ail', '1 Flap | 2 Ail', '2 Flaps | 2 Ail', '4 Flaps | 2 Ail', '2 Flaps | 4 Ail', '4 Flaps | 4 Ail'],
+        'tailTypes': ['Normal   1H1V', 'V-Tail   2H', 'Ailvator 2H1V', 'Normal   2H2V', 'None - Elevon/Delta', 'None'],
+        'wingType': 'Wing type',
+        'tailType': 'Tail type',
+        'engineCount': 'Engine count',
+        'gearServos': 'Gear servos',
+        'airbrakeServos': 'Airbrake servos',
+        'varioModes': ['Off', 'JB Profi Alarm', 'EX Value', 'Lua'],
+        'repeatEvery': 'Repeat every',
+        'triggerSwitch': 'Trigger Switch',
+        'invalidModel': 'file {} is not a valid model\n',
+        'unreadableFile': 'file {} not readable\n',
+        'noSubfolder': 'could not create subfolder csv\n',
+        'notModelFile': 'file {} is not a model file (.jsn), not converted\n',
+        'modelError': 'error at model\n{}\nreason: ',
+        'unknownData': 'unknown data in model\n{}\nplease post model at jetiforum.de',
+        'reportSummary': '{} of {} models converted',
+        'reportUnreadable': 'not readable',
+        'reportInvalid': 'not a valid model',
+        'reportError': 'error at conversion',
+        'reportUnwritable': 'not writable',
+        'reportUnknown': 'unknown data, please post at jetiforum.de',
+    },
+}
+
+
+# load the catalog files jemoview-xx.json once at start, called from main()
+def loadCatalogs():
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for fileName in sorted(glob.glob(os.path.join(glob.escape(folder), 'jemoview-*.json'))):
+        lang = os.path.basename(fileName)[len('jemoview-'):-len('.json')]
+        try:
+            with open(fileName, 'r', encoding='utf-8') as filein:
+                msgData = json.load(filein)  # resulting msgData is a dict
+        except (OSError, json.decoder.JSONDecodeError) as e:
+            print(fileName, 'ignoriert / ignored')
+            print(str(e))
+            continue
+        if not isinstance(msgData, dict):
+            print(fileName, 'ignoriert / ignored')
+            continue
+        catalog = dict(catalogs.get(lang, catalogs['en']))
+        catalog.update(msgData)
+        catalogs[lang] = catalog
+
+
+# catalog of a language, English if the language is unknown
+def getCatalog(lang):
+    return catalogs.get(lang, catalogs['en'])
+
+
+# state of the conversion of one model, passed as ctx to all functions called by extractDict() and extractPat()
+# (there are no module globals for it, so several models can be converted at the same time in threads)
+class ModelContext:
+    __slots__ = ('aferatgt', 'functionlist', 'flightmolist', 'flightmoid', 'flightmoseq', 'luaid', 'sensordict',
+                 'servolist', 'stopwatch', 'stopwatchid', 'hasAccel', 'zefixmark', 'unknown', 'section', 'path', 'rows',
+                 'options', 'swsettings', 'generation', 'swcache', 'msg', 'timings', 'model')
+
+    def __init__(self, modelOptions, modelSwsettings):
+        # number of servos: aileron flaps elevator ruder airbrake throttle gear butterfly(1=needs butterfly) delta/v-lw
+        self.aferatgt = [0, 0, 0, 0, 0, 0, 0, 0, '']
+        self.functionlist = 51 * ['nix']   # list of labels of used functions
+        self.flightmolist = 11 * ['nix']   # list of labels of used flight modes
+        self.flightmoid = 11 * ['nix']     # list of id of used flight modes
+        self.flightmoseq = 11 * ['nix']    # list of flight modes as displayed by transmitter
+        self.luaid = 31 * [0]              # list of ids of lua apps
+        self.sensordict = {}               # dict of sensors: device ID -> {parameter: label}, 0 is the sensor, see getSensor()
+        self.servolist = 25 * ['nix']      # list of labels of used servos
+        self.stopwatch = 11 * ['nix']      # list of labels of used timers
+        self.stopwatchid = 11 * ['nix']    # list of id of used timers
+        self.hasAccel = False              # true if transmitter has accelerometer
+        self.zefixmark = 0                 # number of unknown data found, see zefix()
+        self.unknown = []                  # unknown data found, each [section, JSON path, value], see zefix()
+        self.section = None                # name of the section running, see runSection()
+        self.path = None                   # JSON path of the item evaluated by the section, e.g. Alarms.Data[2]
+        self.rows = []                     # rows of csv output, each a list of cells, see writeLine()
+        self.options = dict(modelOptions)  # copies, settings must not change during conversion
+        self.swsettings = list(modelSwsettings)
+        self.generation = 0                # incremented by newGeneration()
+        self.swcache = {}                  # results of getSwitch() of current generation
+        self.msg = getCatalog(self.options['language'])  # texts of the csv file, see catalogs
+        self.timings = None                # dict of seconds per step if profiling is enabled, see runSection()
+        self.model = None                  # decoded model, see decodeModel()
+
+    # must be called after functionlist, servolist, flightmolist, flightmoid, flightmoseq, stopwatch, stopwatchid
+    # or swsettings were changed, because the cached results of getSwitch() depend on them
+    def newGeneration(self):
+        self.generation += 1
+        self.swcache = {}
+
+
+# --------------------------------     decoded model    --------------------------------------
+# decodeModel() converts the dicts of the model file once into the following classes, the section
+# functions write the csv rows from them. Values are kept as stored by the transmitter (no labels,
+# no texts of the language), so other output formats can be built on the same data.
+# slots need Python 3.10, older versions use the classes without slots (more memory, same results)
+dataslots = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# a switch or control as stored in the model file (string of 8 integers), see parseSwitch() and decodeSwitch()
+# objects are shared by all models with the same switch string, so they must not be changed
+@dataclass(frozen=True, eq=False, **dataslots)
+class Switch:
+    number: int         # first position: switch, control or number of timer, function, servo, flight mode
+    inverted: bool
+    proportional: bool
+    value: int          # switch position or threshold of a control (4000 = 100%)
+    source: int         # seventh position: 76 timer, 77 function, 78 servo, 79 flight mode, else see switches7
+    interval: bool      # threshold of a control is an interval
+    text: str           # the string as stored in the model file
+
+
+@dataclass(**dataslots)
+class Function:
+    id: int
+    label: str
+    control: Switch | None
+    trimControl: Switch | None
+    trimMax: int
+
+
+@dataclass(**dataslots)
+class Servo:
+    index: int          # output number - 1
+    code: int           # 257... standard servo, 288...299 user defined function
+    middle: int
+    maxPositive: int
+    maxNegative: int
+    maxPositiveLimit: int
+    maxNegativeLimit: int
+    reverse: int
+    delayPositive: int  # 1/10 s
+    delayNegative: int
+    curve: list | None  # balancer, None if not stored
+
+
+@dataclass(**dataslots)
+class DigitalTrim:
+    function: int       # id of the function
+    value: int
+    stored: int
+    mode: int
+    step: int
+    maxNegative: int
+    maxPositive: int
+
+
+@dataclass(**dataslots)
+class FlightMode:
+    id: int
+    label: str
+    audio: str
+    delay: int          # 1/10 s
+    switch: Switch | None
+    trims: list         # of DigitalTrim
+
+
+# values of a mix in one flight mode (the first flight mode only if the mix is global)
+@dataclass(**dataslots)
+class MixValue:
+    flightMode: int
+    intensity: int
+    switch: Switch | None
+    curveType: int
+    pointsIn: list
+    pointsOut: list
+    delayN: int         # 1/10 s
+    delayP: int
+    delaySwN: int
+    delaySwP: int
+    outputP: list       # S-Output
+    outputN: list | None  # S-OutputN, None if transmitter version <3
+    direction: int
+    masterLink: int
+    slaveLink: int
+    masterTrim: int
+    slaveDr: int
+
+
+@dataclass(**dataslots)
+class Mix:
+    source: int         # id of the function
+    target: int
+    isGlobal: bool
+    asymmetric: int
+    values: list        # of MixValue, one per flight mode
+
+
+@dataclass(**dataslots)
+class LogicalSwitch:
+    index: int
+    label: str
+    enabled: int
+    switch1: Switch | None
+    cond1: int
+    value1: int
+    switch2: Switch | None
+    cond2: int
+    value2: int
+    logType: int
+    upType: int | None  # delays are None if not stored
+    dnType: int | None
+    upTime: int | None  # 1/10 s
+    dnTime: int | None
+
+
+# a measured value of a sensor, sensorId differs from the id of its sensor if the header of the sensor is missing
+@dataclass(**dataslots)
+class SensorParam:
+    index: int
+    label: str
+    sensorId: int
+    repeat: int
+    trigger: int
+    prio: int
+    dataType: int
+
+
+# a sensor (device) of Telem-Detect, label is None for parameters found before the first sensor
+@dataclass(**dataslots)
+class Sensor:
+    id: int | str
+    label: str | None
+    params: list        # of SensorParam
+
+
+@dataclass(**dataslots)
+class Timer:
+    id: int
+    label: str
+    initTime: int       # ms
+    destTime: int
+    type: int
+    reportType: int
+    switch: Switch | None
+    reset: Switch | None  # None also if transmitter version <3
+
+
+@dataclass(**dataslots)
+class Alarm:
+    active: int
+    switch: Switch | None
+    greater: int
+    file: str
+    sensorId: int
+    sensorParam: int
+    decimals: int
+    value: int
+    repeat: int
+    voice: int
+
+
+@dataclass(**dataslots)
+class LuaApp:
+    appId: int
+    data: list          # groups of 3: text, data, data
+
+
+@dataclass(**dataslots)
+class DecodedModel:
+    functions: list     # of Function
+    servos: list        # of Servo
+    flightModes: list   # of FlightMode
+    fmAnnounce: Switch | None
+    mixes: list         # of Mix
+    logSwitches: list   # of LogicalSwitch
+    sensors: list       # of Sensor
+    timers: list        # of Timer
+    alarms: list        # of Alarm
+    luaApps: list       # of LuaApp
+
+
+# decoders of the fields of DecodedModel, each gets the model as dict and returns the value of its field
+# they raise KeyError, IndexError etc. like the section functions if the model file lacks data
+def decodeFunctions(modelData):
+    return [Function(item['ID'], item['Label'], parseSwitch(item['Control']), parseSwitch(item['Trim-Control']),
+                     item['Trim-Max'])
+            for item in modelData['Functions']['Data']]
+
+
+def decodeServos(modelData):
+    return [Servo(int(item['Index']), int(item['Servo-Code']), item['Middle'], item['Max-Positive'], item['Max-Negative'],
+                  item['Max-Positive-Limit'], item['Max-Negative-Limit'], item['Servo-Reverse'],
+                  int(item['Delay-Positive']), int(item['Delay-Negative']), item.get('Curve'))
+            for item in modelData['Servos']['Data']]
+
+
+def decodeFlightModes(modelData):
+    return [FlightMode(int(item['ID']), item['Label'], item['Audio'], item['Delay'], parseSwitch(item['Switch']),
+                       [DigitalTrim(dt['FuncID'], dt['Value'], dt['Stored'], dt['Mode'], dt['Step'],
+                                    dt['Max-Neg'], dt['Max-Pos'])
+                        for dt in item['DigiTrim']])
+            for item in modelData['Flight-Modes']['Data']]
+
+
+def decodeFmAnnounce(modelData):
+    return parseSwitch(modelData['Common']['FM-Annonc'])
+
+
+# Mixes-Values is the matrix mix x flight mode stored by flight mode: the values of all mixes for the first
+# flight mode, then for the second etc. It is read in one pass, a global mix gets the values of the first flight mode only
+def decodeMixes(modelData):
+    anzFm = len(modelData['Flight-Modes']['Data'])
+    mixes = [Mix(item[0], item[1], item[2] == 1, item[3] if len(item) > 3 else 0, [])
+             for item in modelData['Mixes-Main']['Data']]  # is list of lists
+    values = modelData['Mixes-Values']
+    anzMix = len(mixes)
+    if anzFm > 0 and anzMix > 0:
+        # all values of a mix are needed, except the values of a global mix in other flight modes
+        needed = max([ii + 1 if mix.isGlobal else (anzFm - 1) * anzMix + ii + 1 for ii, mix in enumerate(mixes)])
+        if len(values) < needed:
+            raise IndexError('list index out of range')
+    for jj in range(anzFm):
+        for mix, dic in zip(mixes, values[jj * anzMix:(jj + 1) * anzMix]):
+            if jj > 0 and mix.isGlobal:
+                continue
+            mix.values.append(MixValue(int(dic['Flight-Mode']), dic['Intensity'], parseSwitch(dic['Switch']),
+                                       dic['Curve-Type'], dic['Points-In'], dic['Points-Out'],
+                                       int(dic['DelayN']), int(dic['DelayP']), int(dic['DelaySwN']), int(dic['DelaySwP']),
+                                       dic['S-Output'], dic.get('S-OutputN'), dic['Direction'],
+                                       dic['M-Link'], dic['S-Link'], dic['M-Trim'], dic['S-DR']))
+    return mixes
+
 
-# following globals are reset in extractDict() for each call
-aferatgt = []       # list of servo count for main functions defined by aferatg_txt, plus tail features at end
-functionlist = []   # list of labels of used functions
-flightmolist = []   # list of labels of used flight modes
-flightmoid = []     # list of id of used flight modes
-flightmoseq = []    # list of flight modes as displayed by transmitter
-luaid = []          # list of ids of lua apps
-sensordict = {}     # dict of sensors and their measurements
-servolist = []      # list of labels of used servos
-stopwatch = []      # list of labels of used timers
-stopwatchid = []    # list of id of used timers
-hasAccel = False    # true if transmitter has accelerometer
+def decodeLogSwitches(modelData):
+    logSwitches = []
+    for item in modelData['LogSwitch']['Data']:
+        if 'Up-Type' in item:
+            delays = [item['Up-Type'], item['Dn-Type'], int(item['Up-Time']), int(item['Dn-Time'])]
+        else:  # transmitter version <3
+            delays = 4 * [None]
+        logSwitches.append(LogicalSwitch(int(item['Index']), item['Label'], item['Enabled'],
+                                         parseSwitch(item['Switch1']), item['Cond1'], item['Value1'],
+                                         parseSwitch(item['Switch2']), item['Cond2'], item['Value2'],
+                                         item['Log-Type'], *delays))
+    return logSwitches
+
+
+def decodeSensors(modelData):
+    sensors = []
+    for item in modelData['Telem-Detect']['Data']:
+        if int(item['Param']) == 0:  # next device / sensor
+            sensors.append(Sensor(item['ID'], item['Label'], []))
+            continue
+        if not sensors:
+            sensors.append(Sensor('', None, []))
+        sensors[-1].params.append(SensorParam(int(item['Param']), item['Label'], item['ID'], item['Rep'], item['Trig'],
+                                              item['Prio'], int(item['DataType'])))
+    return sensors
+
+
+def decodeTimers(modelData):
+    return [Timer(int(item['ID']), item['Label'], int(item['Init-Time']), int(item['Dest-Time']), item['Tim-Type'],
+                  item['Report-Type'], parseSwitch(item['Switch']),
+                  parseSwitch(item['Sw-Rst']) if 'Sw-Rst' in item else None)
+            for item in modelData['Timers']['Data']]
+
+
+def decodeAlarms(modelData):
+    return [Alarm(item['Active'], parseSwitch(item['Switch']), item['Var-Greater'], item['File'], item['Sensor-ID'],
+                  item['Sensor-Param'], item['Decimals'], item['Value'], item['Repeat'], item['Voice'])
+            for item in modelData['Alarms']['Data']]
+
+
+def decodeLuaApps(modelData):
+    return [LuaApp(item['appID'], item['data']) for item in modelData.get('Lua', [])]
+
+
+# decoder of each field of DecodedModel, in the order of the fields
+modelDecoders = {'functions': decodeFunctions,
+                 'servos': decodeServos,
+                 'flightModes': decodeFlightModes,
+                 'fmAnnounce': decodeFmAnnounce,
+                 'mixes': decodeMixes,
+                 'logSwitches': decodeLogSwitches,
+                 'sensors': decodeSensors,
+                 'timers': decodeTimers,
+                 'alarms': decodeAlarms,
+                 'luaApps': decodeLuaApps}
+
+
+# decode the sections of the model which are used by several outputs, sets ctx.model
+# parts is a set of field names of DecodedModel (see sectionGraph), the other fields are set to None, None decodes all
+def decodeModel(ctx, modelData, parts=None):
+    ctx.model = DecodedModel(*[decoder(modelData) if parts is None or name in parts else None
+                               for name, decoder in modelDecoders.items()])
+
+
+# size in bytes of a decoded model including all lists, strings and numbers it refers to,
+# objects referred to more than once (e.g. cached switches) are counted once
+def getFootprint(obj, seen=None):
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        size += sum(getFootprint(item, seen) for item in obj)
+    elif isinstance(obj, dict):
+        size += sum(getFootprint(key, seen) + getFootprint(value, seen) for key, value in obj.items())
+    elif hasattr(obj, '__slots__'):
+        size += sum(getFootprint(getattr(obj, name), seen) for name in obj.__slots__)
+    elif hasattr(obj, '__dict__'):  # dataclasses without slots (Python < 3.10)
+        size += getFootprint(obj.__dict__, seen)
+    return size
 
 
 # --------------------------------     utility functions    --------------------------------------
 
 # check if servo balancer used
-def checkBala(aList):
+def checkBala(ctx, aList):
     # check all elements of alist if value == 0
     status = 0
     # variable counter is needed here as placeholder
     for counter, value in enumerate(aList):
         if value != 0:
             status = 1
-    return getYesNo(status)
+    return getYesNo(ctx, status)
 
 
-# evaluate curvetype
+# evaluate curvetype, key is the JSON key of aInt for zefix()
 # returns a list [curvetype as string, True if type = ...-point]
-def getCurve(aInt):
-    if options['language'] == 'de':
-        curvetypes = ['Standard', 'konstant', 'x>0', 'x<0', '|x|', '+positiv', '-negativ',
-                      'symmetrisch', '3-Punkt', '5-Punkt', '7-Punkt', '9-Punkt', 'Gyro']
-    else:
-        curvetypes = ['Standard', 'Constant', 'x>0', 'x<0', '|x|', '+positive', '-negative',
-                      '±symmetric', '3-point', '5-point', '7-point', '9-point', 'Gyro']
+def getCurve(ctx, aInt, key=None):
+    curvetypes = ctx.msg['curveTypes']
     if aInt < len(curvetypes):
         if aInt in [8, 9, 10, 11]: # is a ...-point curve
             return [curvetypes[aInt], True]
         else:
             return [curvetypes[aInt], False]
     else:
-        return [zefix(1), False]
+        return [zefix(ctx, 1, key, aInt), False]
+
+
+# number of servos of a function label as set by typespecific(), None if it is not a function of aferatg_txt
+def getServoCount(ctx, label):
+    if label in aferatg_ind:
+        return ctx.aferatgt[aferatg_ind[label]]
+    return None
+
+
+# labels of a sensor and one of its parameters as stored by telemdetect()
+# returns a list [label of sensor, label of parameter or 'nix' if not detected] or None if the sensor was not detected
+def getSensor(ctx, key, param):
+    device = ctx.sensordict.get(key)
+    if device is None:
+        return None
+    return [device[0], device.get(param, 'nix')]
 
 
 # evaluate device and return it as Jeti device id (as couple of 2 integers, "device type : kind of serial")
@@ -97,119 +901,98 @@ def getDeviceID(aInt):
 # pos 6 : value where active in range (-4000, +4000)
 # pos 7 : other switch
 # pos 8 : 0 normal, -1 interval
-# returns a list [the_switch, the_switch plus its value as string, the_switch plus its value as string if S switch otherwise the_switch, True if proportional
-def getSwitch(aString):
-    # first position, but P3 and P4 are swapped due to a probable bug in transmitter, proportional and pyhysical switches
-    switches1 = ['nix', 'P1', 'P2', 'P4', 'P3', 'P5', 'P6', 'P7', 'P8', 'SA', 'SB',
-                 'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'P9',
-                 'P10', 'SM', 'SN', 'SO', 'SP']
-    # seventh position, values from  0 to 31, logical switches
-    log = ['Log1', 'Log2', 'Log3', 'Log4', 'Log5', 'Log6', 'Log7', 'Log8', 'Log9',
-           'Log10', 'Log11', 'Log12', 'Log13', 'Log14', 'Log15', 'Log16', 'Log17',
-           'Log18', 'Log19', 'Log20', 'Log21', 'Log22', 'Log23', 'Log24', '?zefix?',
-           '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?']
-    # seventh position, values from  32 to 47, voice commands
-    voi = ['V01', 'V02', 'V03', 'V04', 'V05', 'V06', 'V07', 'V08', 'V09', 'V10',
-           'V11', 'V12', 'V13', 'V14', 'V15', '?zefix?']
-    # seventh position, values from 48 to 63, telemetry controls
-    mx = ['MX1', 'MX2', 'MX3', 'MX4', 'MX5', 'MX6', 'MX7', 'MX8', 'MX9', 'MX10',
-          'MX11', 'MX12', 'MX13', 'MX14', 'MX15', 'MX16']
-    # seventh position, values from 64 to 79, accelerometers, special treatment in getSwitch for 76 -79
-    gx = ['GX', 'GY', 'GZ', 'G/L', 'G/R', 'GXL', 'GXR', 'GHi', '?zefix?', '?zefix?',
-          '?zefix?', '?zefix?', 'timer', 'function', 'servo', 'flight mode']
-    # seventh position, values from 80 to 89, sequencers
-    seq = ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6', 'Q7', 'Q8', 'Q9', 'Q10']
-    # seventh position, values from 90 to 129, CH = channels of ppm inputs, Tr = digital trims, C0 = Lua apps
-    others = ['CH1', 'CH2', 'CH3', 'CH4', 'CH5', 'CH6', 'CH7', 'CH8', '?zefix?', '?zefix?',
-              '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Tr1', 'Tr2', 'Tr3',
-              'Tr4', 'Tr5', 'Tr6', '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'C01', 'C02',
-              'C03', 'C04', 'C05', 'C06', 'C07', 'C08', 'C09', 'C10', '?zefix?',
-              'Log.MAX', '?zefix?', '?zefix?']
-    switches7 = log + voi + mx + gx + seq + others
-
-    # list of hardware switches, needed for compensation read from settings
-    swlist = ['SA', 'SB', 'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM', 'SN', 'SO', 'SP']
+# returns a tuple (the_switch, the_switch plus its value as string, the_switch plus its value as string if S switch otherwise the_switch, True if proportional)
+# aSwitch is the string or the Switch returned by parseSwitch() (None if no switch)
+# results are cached in ctx.swcache, ctx.newGeneration() must be called whenever a list used here is changed
+# key is the JSON key of aSwitch for zefix()
+def getSwitch(ctx, aSwitch, key=None):
+    hit = ctx.swcache.get(aSwitch)
+    if hit is None:
+        if isinstance(aSwitch, str):
+            hit = decodeSwitch(ctx, parseSwitch(aSwitch))
+        else:
+            hit = decodeSwitch(ctx, aSwitch)
+        ctx.swcache[aSwitch] = hit
+    if hit[1]:  # unknown data must be counted at each call, also if cached
+        zefix(ctx, 1, key, aSwitch if isinstance(aSwitch, str) else aSwitch.text)
+    return hit[0]
+
 
+# parse the internal switch representation once, returns a Switch or None if it is not a switch
+@functools.lru_cache(maxsize=4096)
+def parseSwitch(aString):
     # check if aString has exactly 7 commas und 8 integers
-    xx = aString.split(',')  # is a list of strings
-    if len(xx) != 8:
-        return ['-', '-', '-', False]
-    for ss in xx:  # ss is a string
-        if ss[0] in ('-', '+'):
-            if not ss[1:].isdigit():
-                return ['-', '-', '-', False]
-        elif not ss.isdigit():
-            return ['-', '-', '-', False]
+    if not switchpat.fullmatch(aString):
+        return None
+    xx = [int(ss) for ss in aString.split(',')]
+    return Switch(xx[0], xx[1] == 1, xx[2] == 1, xx[5], xx[6], xx[7] == -1, aString)
 
-    # switch number is at first or seventh position
-    switchNo1 = int(aString.split(',')[0])
-    switchNo7 = int(aString.split(',')[6])
 
+# decode a Switch for getSwitch(), returns a list [result of getSwitch, True if unknown data found]
+def decodeSwitch(ctx, aSwitch):
+    if aSwitch is None:
+        return [('-', '-', '-', False), False]
+    # switch number is at first or seventh position
+    switchNo1 = aSwitch.number
+    switchNo7 = aSwitch.source
     # check if switch is proportional
-    proport = False
-    if int(aString.split(',')[2]) == 1:
-        proport = True
+    proport = aSwitch.proportional
 
     # if seventh position is between 76 and 79 then it has priority over first position
     if switchNo7 == 76:  # is a timer, transmitter displays T + number
-        if stopwatch[switchNo1] == 'nix':
-            return ['??', '??', '??', False]
-        jj = stopwatchid.index(switchNo1)
+        if ctx.stopwatch[switchNo1] == 'nix':
+            return [('??', '??', '??', False), False]
+        jj = ctx.stopwatchid.index(switchNo1)
         if switchNo1 < 10:
-            out = 'T0' + str(jj) + '  (' + stopwatch[switchNo1] + ')'
-            return [out, out, out, proport]
+            out = 'T0' + str(jj) + '  (' + ctx.stopwatch[switchNo1] + ')'
         else:
-            out = 'T' + str(jj) + '  (' + stopwatch[switchNo1] + ')'
-            return [out, out, out, proport]
+            out = 'T' + str(jj) + '  (' + ctx.stopwatch[switchNo1] + ')'
+        return [(out, out, out, proport), False]
     if switchNo7 == 77:  # is a function, transmitter displays 3 chars if standard function, and U + number if user defined (function >= 14)
-        if switchNo1 >= len(functionlist):
-            zefix(1)
-            return ['?zefix?', '?zefix?', '?zefix?', False]
+        if switchNo1 >= len(ctx.functionlist):
+            return [('?zefix?', '?zefix?', '?zefix?', False), True]
         if switchNo1 <= 13: # standard function
-            if functionlist[switchNo1] != 'nix':
-                out = functionlist[switchNo1]
+            if ctx.functionlist[switchNo1] != 'nix':
+                out = ctx.functionlist[switchNo1]
             else:
                 out = '??'
         else:
             out = 'U' + str(switchNo1 - 13)
-            if functionlist[switchNo1] != 'nix':
-                if functionlist[switchNo1] == 'Butterfly':
+            if ctx.functionlist[switchNo1] != 'nix':
+                if ctx.functionlist[switchNo1] == 'Butterfly':
                     out = 'Butterfly'
                 else:
-                    out = out + '  (' + functionlist[switchNo1]  + ')'
-        return [out, out, out, proport]
+                    out = out + '  (' + ctx.functionlist[switchNo1]  + ')'
+        return [(out, out, out, proport), False]
     if switchNo7 == 78:  # is a servo, transmitter displays O + number
         out = 'O' + str(switchNo1 + 1)
-        if servolist[switchNo1 + 1] != 'nix':
-            out = out + '  (' + servolist[switchNo1 + 1]  + ')'
-        return [out, out, out, proport]
+        if ctx.servolist[switchNo1 + 1] != 'nix':
+            out = out + '  (' + ctx.servolist[switchNo1 + 1]  + ')'
+        return [(out, out, out, proport), False]
     if switchNo7 == 79:  # is a flight mode, transmitter displays FM + number
-        if switchNo1 not in flightmoid:
-            return ['??', '??', '??', False]
-        jj = flightmoid.index(switchNo1)
-        kk = flightmoseq.index(switchNo1) + 1
-        out = 'FM' + str(kk) + '  (' + flightmolist[jj]  + ')'
-        return [out, out, out, proport]
+        if switchNo1 not in ctx.flightmoid:
+            return [('??', '??', '??', False), False]
+        jj = ctx.flightmoid.index(switchNo1)
+        kk = ctx.flightmoseq.index(switchNo1) + 1
+        out = 'FM' + str(kk) + '  (' + ctx.flightmolist[jj]  + ')'
+        return [(out, out, out, proport), False]
     # if first position empty, take seventh position
     if switchNo1 == 0:
         if switchNo7 >= 0:
-            if switches7[switchNo7] == '?zefix?':
-                zefix(1)
-                return ['?zefix?', '?zefix?', '?zefix?', False]
             out = switches7[switchNo7]
-            return [out, out, out, proport]
+            if out == '?zefix?':
+                return [('?zefix?', '?zefix?', '?zefix?', False), True]
+            return [(out, out, out, proport), False]
         else:
-            return ['-', '-', '-', False]
+            return [('-', '-', '-', False), False]
     else: # it is genuine switch Sx or control Px
-        inverted = False
-        if int(aString.split(',')[1]) == 1:
-            inverted = True
-        val = int(aString.split(',')[5])
+        inverted = aSwitch.inverted
+        val = aSwitch.value
         valstr = ''
         valstr2 = ''
-        if switches1[switchNo1][0] == 'P':
-            if int(aString.split(',')[7]) == -1: # is interval, so do not invert value
-                comp = ''
+        out = switches1[switchNo1]
+        if out[0] == 'P':
+            if aSwitch.interval: # is interval, so do not invert value
                 if inverted:
                     comp = '≤'
                 else:
@@ -220,15 +1003,13 @@ def getSwitch(aString):
                     val *= -1
                 valstr = '  ' + str(int(round(100.*(val/4000.)))) + '%'
         else: # it is a genuine switch S
-            xx = switches1[switchNo1]
-            if xx in swlist:
-                jj = swlist.index(xx)
-                valset = swsettings[jj]
+            if out in swlist:
+                jj = swlist.index(out)
+                valset = ctx.swsettings[jj]
                 if valset == 0:
                     val *= -1
             else:
-                zefix(1)
-                return ['?zefix?', '?zefix?', '?zefix?', False]
+                return [('?zefix?', '?zefix?', '?zefix?', False), True]
             if inverted:
                 val *= -1
             if val < 0:
@@ -238,8 +1019,7 @@ def getSwitch(aString):
             else:
                 valstr = '  ↑'
             valstr2 = valstr # separate variable needed which is not filled by control Px
-        out = switches1[switchNo1]
-        return [out, out + valstr, out + valstr2, proport]
+        return [(out, out + valstr, out + valstr2, proport), False]
 
 
 # format integer als time string h:mm:ss
@@ -268,28 +1048,21 @@ def getTime(aInt):
     return timeout
 
 
-# getYesNo translates 0 into no and 1 into yes
-def getYesNo(aInt):
+# getYesNo translates 0 into no and 1 into yes, key is the JSON key of aInt for zefix()
+def getYesNo(ctx, aInt, key=None):
     if aInt == 0:
-        if options['language'] == 'de':
-            return 'nein'
-        else:
-            return 'no'
+        return ctx.msg['no']
     if aInt == 1:
-        if options['language'] == 'de':
-            return 'ja'
-        else:
-            return 'yes'
+        return ctx.msg['yes']
     else:
-        return zefix(1)
+        return zefix(ctx, 1, key, aInt)
 
 
-# print a dictionary, fileout is current output file as set in selectInput
-def printDict(aDict):
+# print a dictionary, one row per key
+def printDict(ctx, aDict):
     for key in aDict:
         value = aDict[key]
-        out = '\n' + str(key) + ';' + str(value) + ';'
-        fileout.write(out)
+        ctx.rows.append([str(key), str(value), ''])
 
 
 # set decimal point, divide aValue by 10 for aInt times to get intended float value (internal values are int only)
@@ -300,16 +1073,21 @@ def setDecPoint(aInt, aValue):
     return aValue
 
 
-# write one of two strings using appropriate language, fileout is current output file as set in selectInput
-def writeLine(deStr, enStr):
-    if options['language'] == 'de':
-        fileout.write(deStr)
-    else:
-        fileout.write(enStr)
+# write a row, i.e. a list of cells, texts are taken from ctx.msg (catalog of the current language)
+# rows are collected in ctx.rows and written at once by convertModel()
+def writeLine(ctx, row):
+    ctx.rows.append(row)
+
+
+# write an empty line followed by a title row
+def writeTitle(ctx, row):
+    ctx.rows.append([])
+    ctx.rows.append(row)
 
 
 # write the essence of valueslist (global or specific)
-def writeEssence(labelslist, valueslist):
+# each value is a list of rows, the label is put in front of the first row
+def writeEssence(ctx, labelslist, valueslist):
     # check if all items of valuelist are identical
     # if yes then print first item as global, otherwise print all items
     glob = True
@@ -317,107 +1095,107 @@ def writeEssence(labelslist, valueslist):
         if valueslist[0] != value:
             glob = False
     if glob:
-        fileout.write('\n' + 'Global')
-        fileout.write(valueslist[0])
+        ctx.rows.append(['Global'] + valueslist[0][0])
+        ctx.rows.extend(valueslist[0][1:])
     else:
         for counter, value in enumerate(valueslist):
-            fileout.write(labelslist[counter])
-            fileout.write(value)
+            ctx.rows.append([labelslist[counter]] + value[0])
+            ctx.rows.extend(value[1:])
 
 
 # handle zefix marker
-def zefix(aInt):
-    global zefixmark  # global statement just needed to make it static
+# for aInt 1 the unknown value is recorded in ctx.unknown with the running section and its JSON path,
+# which is key appended to ctx.path (key like 'Switch' or '[3]', None if ctx.path is the path of value)
+def zefix(ctx, aInt, key=None, value=None):
     if aInt == 0:
-        zefixmark = 0
+        ctx.zefixmark = 0
+        ctx.unknown = []
     if aInt == 1:
-        zefixmark += 1
+        ctx.zefixmark += 1
+        path = ctx.path
+        if key is not None:
+            if path is None:
+                path = key
+            elif key.startswith('['):
+                path = path + key
+            else:
+                path = path + '.' + key
+        ctx.unknown.append([ctx.section, path, value])
         return '?zefix?'
     if aInt == 2:
-        return zefixmark
+        return ctx.zefixmark
 
 
 # following functions are called by extractDict()
 # ----------------------------------  one function per dictionary at top level, sorted alphabetically     -----------------
 
-def accel(modelData):
-    if not hasAccel:
+def accel(ctx, modelData):
+    if not ctx.hasAccel:
         return
     if not modelData['Accel']:
         return
-    writeLine('\n\nBewegungssensor:', '\n\nAccelerometer:')
-    writeLine('\nAchse;Glättung;Empfindlich.;Totzone;Pitch Offset', '\nAxis;Filtering;Sensitivity;Dead Zone;Pitch Offset')
+    writeTitle(ctx, ctx.msg['accelTitle'])
+    writeLine(ctx, ctx.msg['accelColumns'])
     pitchoff = str(modelData['Accel']['NeutrZ'][0])
     ii = -1
     for key in ['X', 'Y', 'Z']:
         ii += 1
-        out = '\n' + key + ';' + str(modelData['Accel']['Filter'][ii]) + ';' + str(modelData['Accel']['Rate'][ii]) + ';' + str(modelData['Accel']['DeadZ'][ii])
+        out = [key, str(modelData['Accel']['Filter'][ii]), str(modelData['Accel']['Rate'][ii]), str(modelData['Accel']['DeadZ'][ii])]
         if key == 'Y':
-            out = out + ';' + pitchoff
+            out.append(pitchoff)
         else:
-            out = out + ';-'
-        writeLine(out, out)
+            out.append('-')
+        writeLine(ctx, out)
 
 
-def alarms(modelData):
-    writeLine('\n\nAlarme:', '\n\nAlarms:')
-    outDe = '\nNummer;Sensor;Wert;X <= / >;Schwellwert;Audio;AktivierungSw;Wiederholen;Sprachausgabe;Aktiv'
-    outEn = '\nNumber;Sensor;Value;X <= / >;Threshold;Audio;ActivationSw;Repeat;Ann cur val by voice;Enabled'
-    writeLine(outDe, outEn)
-    if options['language'] == 'de':
-        rept = ['nein', 'ja', '3x']
-    else:
-        rept = ['no', 'yes', '3x']
+def alarms(ctx, modelData):
+    writeTitle(ctx, ctx.msg['alarmsTitle'])
+    writeLine(ctx, ctx.msg['alarmsColumns'])
+    rept = [ctx.msg['no'], ctx.msg['yes'], '3x']
     ind = 0
-    for item in modelData['Alarms']['Data']:  # is list of dicts
+    for alarm in ctx.model.alarms:
         ind += 1
-        activt = getYesNo(item['Active'])
-        sw = getSwitch(item['Switch'])[1]
+        ctx.path = 'Alarms.Data[%d]' % (ind - 1)
+        activt = getYesNo(ctx, alarm.active, 'Active')
+        sw = getSwitch(ctx, alarm.switch, 'Switch')[1]
         gt = '<='
-        if item['Var-Greater'] == 1:
+        if alarm.greater == 1:
             gt = '>'
-        audiof = item['File']
-        key = item['Sensor-ID']
-        param = item['Sensor-Param']
-        dec = item['Decimals']
-        value = setDecPoint(dec, item['Value'])
-        if item['Repeat'] < len(rept):
-            rep = rept[item['Repeat']]
+        key = alarm.sensorId
+        value = setDecPoint(alarm.decimals, alarm.value)
+        if alarm.repeat < len(rept):
+            rep = rept[alarm.repeat]
         else:
-            rep = zefix(1)
-        voi = getYesNo(item['Voice'])
+            rep = zefix(ctx, 1, 'Repeat', alarm.repeat)
+        voi = getYesNo(ctx, alarm.voice, 'Voice')
         sensor = ''
         parm = ''
-        if key in sensordict:
-            sensor = sensordict[key][0]
-            parm = sensordict[key][param]
+        found = getSensor(ctx, key, alarm.sensorParam)
+        if found is not None:
+            sensor, parm = found
         if ind == 1:
-            if options['language'] == 'de':
-                sensor = 'Empfänger'
-                parm = 'RX-Spannung'
-            else:
-                sensor = 'Receiver'
-                parm = 'Voltage Rx'
-        out = '\n' + str(ind) + ';' + sensor + ';' + parm + ';' + gt + ';' + str(value) + ';' + audiof + ';' + sw + ';' + rep + ';' + voi + ';' + activt
-        writeLine(out, out)
-
+            sensor = ctx.msg['receiver']
+            parm = ctx.msg['voltageRx']
+        out = [str(ind), sensor, parm, gt, str(value), alarm.file, sw, rep, voi, activt]
+        writeLine(ctx, out)
 
-def audio(modelData):
-    writeLine('\n\nAudio Player:', '\n\nAudio Player:')
-    printDict(modelData['Audio'])
+def audio(ctx, modelData):
+    writeTitle(ctx, ['Audio Player:'])
+    printDict(ctx, modelData['Audio'])
 
 
-def commands(modelData):
-    writeLine('\n\nSprachkommandos:', '\n\nVoice Commands :')
-    printDict(modelData['Commands'])
+def commands(ctx, modelData):
+    writeTitle(ctx, ctx.msg['commandsTitle'])
+    printDict(ctx, modelData['Commands'])
 
 
-def common(modelData):
+def common(ctx, modelData):
     # hint: model time and its reset mode will be evaluated by function timers()
     # FM-Annonc: Announce current flight mode, will be evaluated by flightmodes()
     # Marker-Switch and Telemetry-Voice-Switch probably old relics and never used
     
     # check image and colors
+    ctx.path = 'Common'
     empty = True
     colors = ['Black&White', 'Light Red', 'Light Green', 'Light Blue', 'Light Yellow', 'Light Violet', 'Light Pink',
               'Blue&Orange', 'Warm Red', 'Dark Red', 'Dark Indigo', 'Dark Green', 'Light Orange']
@@ -426,115 +1204,103 @@ def common(modelData):
         if val < len(colors):
             col = colors[val]
         else:
-            zefix(1)
+            zefix(ctx, 1, 'ColorP', val)
             col = '??'
         if empty:
-            writeLine('\n\nModellbild & Farbgebung', '\n\nModel Image & Colors')
+            writeTitle(ctx, ctx.msg['imageTitle'])
             empty = False
-        outDe = '\n' + 'Farbprofil' + ';' + col
-        outEn = '\n' + 'Color profile' + ';' + col
-        writeLine(outDe, outEn)
+        writeLine(ctx, [ctx.msg['colorProfile'], col])
     if 'Img' in modelData['Common']:
         txt = modelData['Common']['Img']
         if len(txt) > 0:
             if empty:
-                writeLine('\n\nModellbild & Farbgebung', '\n\nModel Image & Colors')
+                writeTitle(ctx, ctx.msg['imageTitle'])
                 empty = False
-            outDe = '\n' + 'Modellbild' + ';' + txt
-            outEn = '\n' + 'Model image' + ';' + txt
-            writeLine(outDe, outEn)
+            writeLine(ctx, [ctx.msg['modelImage'], txt])
     if 'ImgBgPth' in modelData['Common']:
         txt = modelData['Common']['ImgBgPth']
         if len(txt) > 0:
             if empty:
-                writeLine('\n\nModellbild & Farbgebung', '\n\nModel Image & Colors')
+                writeTitle(ctx, ctx.msg['imageTitle'])
                 empty = False
-            outDe = '\n' + 'Hintergrundbild' + ';' + txt
-            outEn = '\n' + 'Background image' + ';' + txt
-            writeLine(outDe, outEn)
-
-    writeLine('\n\nSpezielle Modelloptionen:', '\n\nOther Model Options:')
-    switch = getSwitch(modelData['Common']['Autotrim-Switch'])[1]
+            writeLine(ctx, [ctx.msg['backgroundImage'], txt])
+    writeTitle(ctx, ctx.msg['modelOptionsTitle'])
+    switch = getSwitch(ctx, modelData['Common']['Autotrim-Switch'], 'Autotrim-Switch')[1]
     if switch != '-':
-        writeLine('\nAutotrimm-Schalter;' + switch, '\nAuto-Trim switch;' + switch)
-    switch = getSwitch(modelData['Common']['Trainer-Switch'])[1]
+        writeLine(ctx, [ctx.msg['autoTrimSwitch'], switch])
+    switch = getSwitch(ctx, modelData['Common']['Trainer-Switch'], 'Trainer-Switch')[1]
     if switch != '-':
-        writeLine('\nTrainerschalter;' + switch, '\nTrainer switch;' + switch)
-    switch = getSwitch(modelData['Common']['Logging-Switch'])[1]
+        writeLine(ctx, [ctx.msg['trainerSwitch'], switch])
+    switch = getSwitch(ctx, modelData['Common']['Logging-Switch'], 'Logging-Switch')[1]
     if switch != '-':
-        writeLine('\nStart-Logging Schalter;' + switch, '\nStart-Logging switch;' + switch)
+        writeLine(ctx, [ctx.msg['startLoggingSwitch'], switch])
     else:
-        writeLine('\nStart-Logging Schalter;Auto', '\nStart-Logging switch;Auto')
-    switch = getSwitch(modelData['Common']['Throtle-Cut-Switch'])[1]
+        writeLine(ctx, ctx.msg['startLoggingAuto'])
+    switch = getSwitch(ctx, modelData['Common']['Throtle-Cut-Switch'], 'Throtle-Cut-Switch')[1]
     if switch != '-':
-        writeLine('\nMotor-AUS Schalter;' + switch, '\nThrottle-Cut switch;' + switch)
-    switch = getSwitch(modelData['Common']['Throtle-Idle-Switch'])[1]
+        writeLine(ctx, [ctx.msg['throttleCutSwitch'], switch])
+    switch = getSwitch(ctx, modelData['Common']['Throtle-Idle-Switch'], 'Throtle-Idle-Switch')[1]
     if switch != '-':
-        writeLine('\nLeerlaufschalter;' + switch, '\nThrottle-Idle switch;' + switch)
+        writeLine(ctx, [ctx.msg['throttleIdleSwitch'], switch])
 
     # check if 24 channels used
     if '24ch' in modelData['Common']:
-        switch = getYesNo(modelData['Common']['24ch'])
-        writeLine('\n\nDrahtlosmodus/Trainer:', '\n\nWireless Modes/Trainer:')
-        writeLine('\n24-Kanal Multimode aktiv;' + switch, '\n24-Channels Multimode active;' + switch)
+        switch = getYesNo(ctx, modelData['Common']['24ch'], '24ch')
+        writeTitle(ctx, ctx.msg['wirelessTitle'])
+        writeLine(ctx, [ctx.msg['multimode24'], switch])
         
     # check if Morse Code Alarms used
     if 'Alrm-Enable-Morse' in modelData['Common']:
-        switch = getYesNo(modelData['Common']['Alrm-Enable-Morse'])
-        writeLine('\n\nMorsecode Alarme eingeschaltet;' + switch, '\n\nMorse Code Alarms enabled;' + switch)
+        switch = getYesNo(ctx, modelData['Common']['Alrm-Enable-Morse'], 'Alrm-Enable-Morse')
+        writeTitle(ctx, [ctx.msg['morseCodeAlarmsEnabled'], switch])
 
-    switch = getSwitch(modelData['Common']['RC-Switch'][0])[1]
+    switch = getSwitch(ctx, modelData['Common']['RC-Switch'][0], 'RC-Switch[0]')[1]
     if switch != '-':
-        writeLine('\n\nRC Schalter;' + switch, '\n\nRC-Switch;' + switch)
+        writeTitle(ctx, [ctx.msg['rcSwitch'], switch])
 
-    writeLine('\n\nAufzeichnung Senderstatus:', '\n\nLogging transmitter status info:')
-    switch = getYesNo(modelData['Common']['Log-Alms'])
-    writeLine('\nAufzeichnung Alarme;' + switch, '\nLog alarms;' + switch)
-    outDe = '\nAufzeichnung Geber'
-    outEn = '\nLog input controls'
+    writeTitle(ctx, ctx.msg['loggingTitle'])
+    switch = getYesNo(ctx, modelData['Common']['Log-Alms'], 'Log-Alms')
+    writeLine(ctx, [ctx.msg['logAlarms'], switch])
+    out = [ctx.msg['logControls']]
     empty = True
-    for item in modelData['Common']['Save-Ctrl']:
-        geber = getSwitch(item)[0]
+    for ii, item in enumerate(modelData['Common']['Save-Ctrl']):
+        geber = getSwitch(ctx, item, 'Save-Ctrl[%d]' % ii)[0]
         if geber != '-':
-            outDe = outDe + ';' + geber
-            outEn = outEn + ';' + geber
+            out.append(geber)
             empty = False
     if empty:
-        outDe = outDe + ';keine'
-        outEn = outEn + ';none'
-    writeLine(outDe, outEn)
+        out.append(ctx.msg['none'])
+    writeLine(ctx, out)
 
     empty = True
-    switch = getSwitch(modelData['Common']['Mnu-lft'])[1]
+    switch = getSwitch(ctx, modelData['Common']['Mnu-lft'], 'Mnu-lft')[1]
     if switch != '-':
         if empty:
             empty = False
-            writeLine('\n\nHauptseite:', '\n\nMain Screen:')
-        writeLine('\nWähle vorherige Seite;' + switch, '\nSwitch to previous page;' + switch)
-    switch = getSwitch(modelData['Common']['Mnu-rgt'])[1]
+            writeTitle(ctx, ctx.msg['mainScreenTitle'])
+        writeLine(ctx, [ctx.msg['switchToPreviousPage'], switch])
+    switch = getSwitch(ctx, modelData['Common']['Mnu-rgt'], 'Mnu-rgt')[1]
     if switch != '-':
         if empty:
             empty = False
-            writeLine('\n\nHauptseite:', '\n\nMain Screen:')
-        writeLine('\nWähle folgende Seite;' + switch, '\nSwitch to following page;' + switch)
+            writeTitle(ctx, ctx.msg['mainScreenTitle'])
+        writeLine(ctx, [ctx.msg['switchToFollowingPage'], switch])
 
 
-def controls(modelData):  # Sticks/Switches setup
-    writeLine('\n\nSticks/Schalter Setup:', '\n\nSticks/Switches Setup:')
-    writeLine('\nStick/Schalter;Vor-Flug Position;kompensiert mit settings;Schalter EIN;Schalter AUS', '\nStick/Switch;Required pre-fl. pos.;compensated with settings;Switch On;Switch Off')
+def controls(ctx, modelData):  # Sticks/Switches setup
+    writeTitle(ctx, ctx.msg['controlsTitle'])
+    writeLine(ctx, ctx.msg['controlsColumns'])
     # controls, P3 and P4 are swapped due to a probable bug in transmitter
     switches1 = ['nix', 'P1', 'P2', 'P4', 'P3', 'P5', 'P6', 'P7', 'P8', 'SA', 'SB',
                  'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'P9',
                  'P10', 'SM', 'SN', 'SO', 'SP']
     # list of genuine switches, needed for compensation read from settings
     swlist = ['SA', 'SB', 'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM', 'SN', 'SO', 'SP']
-    if options['language'] == 'de':
-        posstr = ['', 'Unten/AUS', 'Oben/EIN', 'Mitte']
-    else:
-        posstr = ['', 'Bottom/Off', 'Top/On', 'Center']
+    posstr = ctx.msg['prefPositions']
     posarr1 = ['', '  ↓', '  ↑', '  —']
     posarr0 = ['', '  ↑', '  ↓', '  —']
-    for item in modelData['Controls']['Data']:  # is liste of dicts
+    for ii, item in enumerate(modelData['Controls']['Data']):  # is liste of dicts
+        ctx.path = 'Controls.Data[%d]' % ii
         ind = int(item['ID'])
         pos = int(item['Req-Pos'])
         onval = int(round(100.*(int(item['Sw-On']) / 4000.)))
@@ -544,242 +1310,203 @@ def controls(modelData):  # Sticks/Switches setup
         if pos < 4:
             posout = posstr[pos]
         else:
-            zefix(1)
+            zefix(ctx, 1, 'Req-Pos', pos)
             return
         if switches1[ind][0] == 'P':
-            out = '\n' + switches1[ind] + ';' + posout + ';' + ';' + str(onval) + '%;' + str(offval) + '%;'
-            writeLine(out, out)
+            out = [switches1[ind], posout, '', str(onval) + '%', str(offval) + '%', '']
+            writeLine(ctx, out)
         else: # it is a genuine switch Sx
             if pos > 0: # has required pre-flight position
                 jj = swlist.index(switches1[ind])
-                valset = swsettings[jj]
+                valset = ctx.swsettings[jj]
                 if valset == 0:
                     arrow = posarr0[pos]
                 else:
                     arrow = posarr1[pos]
-                out = '\n' + switches1[ind] + ';' + posout + ';' + arrow
-                writeLine(out, out)
+                out = [switches1[ind], posout, arrow]
+                writeLine(ctx, out)
 
 
-def ctrlsound(modelData):
+def ctrlsound(ctx, modelData):
     if 'CtrlSound' not in modelData:  # transmitter version <3
         return
-    writeLine('\n\nProportionalgeber;Ton', '\n\nProportional Controls;Sound')
+    writeTitle(ctx, ctx.msg['ctrlSoundTitle'])
     empty = True
-    for item in modelData['CtrlSound']['Data']:  # is list of dicts
-        sw = getSwitch(item[0])[0]
+    for ii, item in enumerate(modelData['CtrlSound']['Data']):  # is list of lists
+        ctx.path = 'CtrlSound.Data[%d]' % ii
+        sw = getSwitch(ctx, item[0], '[0]')[0]
         if sw != '-' and item[1] > 0:
             if item[1] == 1:
-                tonDe = 'Mitte'
-                tonEn = 'Center'
+                ton = ctx.msg['center']
             else:
-                tonDe = 'Sprache'
-                tonEn = 'Voice'
-            writeLine('\n' + sw + ';' + tonDe, '\n' + sw + ';' + tonEn)
+                ton = ctx.msg['voice']
+            writeLine(ctx, [sw, ton])
             empty = False
     if empty:
-        writeLine('\nkeine Töne', '\nno sounds')
+        writeLine(ctx, ctx.msg['noSounds'])
 
 
-def displayedtelemetry(modelData):
-    if (options['language'] == 'de'and flightmolist[0] == 'Standard') or (options['language'] == 'en'and flightmolist[0] == 'Default'):
-        writeLine('\n\nTelemetrieanzeige;(der Flugphase  ' + flightmolist[0] + ')', '\n\nDisplayed-Telemetry;(of Flight Mode  ' + flightmolist[0] + ')')
+def displayedtelemetry(ctx, modelData):
+    if ctx.flightmolist[0] == ctx.msg['defaultFm']:
+        writeTitle(ctx, [ctx.msg['telemDisplay'], ctx.msg['ofFm'].format(ctx.flightmolist[0])])
     else:
-        writeLine('\n\nTelemetrieanzeige;(der Standard Flugphase  ' + flightmolist[0] + ')', '\n\nDisplayed-Telemetry;(of Default Flight Mode  ' + flightmolist[0] + ')')
+        writeTitle(ctx, [ctx.msg['telemDisplay'], ctx.msg['ofDefaultFm'].format(ctx.flightmolist[0])])
     if len(modelData['Displayed-Telemetry']) == 0:
-        writeLine('\nkeine Anzeige', '\nno display')
+        writeLine(ctx, ctx.msg['noDisplay'])
         return
-    writeLine('\nNummer;Inhalt;Zoom', '\nNumber;Content;Double')
-    systemDe = ['?zefix?', 'Flugphasen', 'Antenne', '?zefix?', 'RX-Spannung', 'Besitzer',
-                '?zefix?', 'Jetibox', 'Trim', 'Tx Akku', 'Flugzeit', 'Antenne 900MHz', '?zefix?',
-                'Modellbild', '?zefix?']
-    systemEn = ['?zefix?', 'Flight Modes', 'Antenna', '?zefix?', 'Voltage RX', 'User Name',
-                '?zefix?', 'Jetibox', 'Trim', 'Tx Battery', 'Model Time', 'Antenna 900MHz', '?zefix?',
-                'Model Image', '?zefix?']
+    writeLine(ctx, ctx.msg['telemDisplayColumns'])
+    system = ctx.msg['telemDisplaySystem']
     ind = 0
     for item in modelData['Displayed-Telemetry']:  # is list of dicts
         if int(item['Flight-Mode']) > 0:
             return
+        ctx.path = 'Displayed-Telemetry[%d]' % ind
         ind += 1
         typ = int(item['Item-Type'])
         if typ == 0:  # empty display
-            zoom = getYesNo(item['DblSize'])
-            outDe = str(ind) + ';' + 'leer' + ';' + zoom
-            outEn = str(ind) + ';' + 'empty' + ';' + zoom
+            zoom = getYesNo(ctx, item['DblSize'], 'DblSize')
+            out = [str(ind), ctx.msg['empty'], zoom]
         elif typ == 1:  # timers
             key = int(item['ID'])
-            zoom = getYesNo(item['DblSize'])
-            outDe = str(ind) + ';Timer: ' + stopwatch[key] + ';' + zoom
-            outEn = outDe
+            zoom = getYesNo(ctx, item['DblSize'], 'DblSize')
+            out = [str(ind), 'Timer: ' + ctx.stopwatch[key], zoom]
         elif typ == 2:  # sensors
             key = int(item['ID'])
-            if key in sensordict:
-                sensor = sensordict[key][0]
-                parm = int(item['Param'])
-                wertDe = ': ' + sensordict[key][parm]
-                wertEn = wertDe
+            found = getSensor(ctx, key, int(item['Param']))
+            if found is not None:
+                sensor = found[0]
+                wert = ': ' + found[1]
             else:
                 sensor = 'Sensor '
-                wertDe = getDeviceID(key) + ' fehlt'
-                wertEn = getDeviceID(key) + ' missing'
-            zoom = getYesNo(item['DblSize'])
-            outDe = str(ind) + ';' + sensor + wertDe + ';' + zoom
-            outEn = str(ind) + ';' + sensor + wertEn + ';' + zoom
+                wert = ctx.msg['missing'].format(getDeviceID(key))
+            zoom = getYesNo(ctx, item['DblSize'], 'DblSize')
+            out = [str(ind), sensor + wert, zoom]
         elif typ == 3:  # system
             key = int(item['ID'])
-            zoom = getYesNo(item['DblSize'])
-            if key < len(systemDe):
-                txtDe = systemDe[key]
-                txtEn = systemEn[key]
-                if txtDe == '?zefix?' or txtEn == '?zefix?':
-                    zefix(1)
+            zoom = getYesNo(ctx, item['DblSize'], 'DblSize')
+            if key < len(system):
+                txt = system[key]
+                if txt == '?zefix?':
+                    zefix(ctx, 1, 'ID', key)
             else:
-                txtDe = zefix(1)
-                txtEn = zefix(1)
+                txt = zefix(ctx, 1, 'ID', key)
             if key == 7:
                 zoom = '-'
-            outDe = str(ind) + ';' + txtDe + ';' + zoom
-            outEn = str(ind) + ';' + txtEn + ';' + zoom
+            out = [str(ind), txt, zoom]
         elif typ == 4:  # Lua App
             key = int(item['ID'])
-            if key in luaid:
+            if key in ctx.luaid:
                 sensor = 'Lua App  ' + str(key)
             else:
                 sensor = '-'
             zoom = '-'
-            outDe = str(ind) + ';' + sensor + ';' + zoom
-            outEn = outDe
-        writeLine('\n' + outDe, '\n' + outEn)
+            out = [str(ind), sensor, zoom]
+        writeLine(ctx, out)
 
 
-def eventsounds(modelData):
-    writeLine('\n\nSprachausgabe/Ereignis:', '\n\nSounds on Event')
+def eventsounds(ctx, modelData):
+    writeTitle(ctx, ctx.msg['eventSoundsTitle'])
     if len(modelData['Event-Sounds']['Data']) == 0:
-        writeLine('\nkein Ereignis', '\nno event')
+        writeLine(ctx, ctx.msg['noEvent'])
         return
-    writeLine('\nSchalter;Datei;Wiederholen', '\nSwitch;File;Repeat')
-    for item in modelData['Event-Sounds']['Data']:  # is list of dicts
-        sw = getSwitch(item['Switch'])[1]
+    writeLine(ctx, ctx.msg['eventSoundsColumns'])
+    for ii, item in enumerate(modelData['Event-Sounds']['Data']):  # is list of dicts
+        ctx.path = 'Event-Sounds.Data[%d]' % ii
+        sw = getSwitch(ctx, item['Switch'], 'Switch')[1]
         audiof = item['File']
-        rep = getYesNo(item['Repeat'])
-        out = '\n' + sw + ';' + audiof + ';' + rep
-        writeLine(out, out)
+        rep = getYesNo(ctx, item['Repeat'], 'Repeat')
+        out = [sw, audiof, rep]
+        writeLine(ctx, out)
 
 
-def flightmodes1(modelData):  # sets flightmolist[] flightmoid[] flightmoseq[]
+def flightmodes1(ctx, modelData):  # sets flightmolist[] flightmoid[] flightmoseq[]
     ind = -1
-    for item in modelData['Flight-Modes']['Data']:  # is list of dicts
+    for fm in ctx.model.flightModes:
         ind += 1
-        flightmolist[ind] = item['Label']
-        flightmoid[ind] = item['ID']
-    flightmolist[10] = ind  # save last index of flight modes (i.e. = number of flight modes -1)
+        ctx.flightmolist[ind] = fm.label
+        ctx.flightmoid[ind] = fm.id
+    ctx.flightmolist[10] = ind  # save last index of flight modes (i.e. = number of flight modes -1)
     if ind >= 1:
         for jj in range(1, ind + 1):
-            flightmoseq[jj - 1] = flightmoid[jj]
-    flightmoseq[ind] = flightmoid[0]
-
+            ctx.flightmoseq[jj - 1] = ctx.flightmoid[jj]
+    ctx.flightmoseq[ind] = ctx.flightmoid[0]
 
-def flightmodes2(modelData):
-    writeLine('\n\nFlugphasen: allgemeine Daten  ', '\n\nFlight Modes: general data  ')
-    switch = getSwitch(modelData['Common']['FM-Annonc'])[1]
+def flightmodes2(ctx, modelData):
+    writeTitle(ctx, ctx.msg['flightModesTitle'])
+    ctx.path = 'Common'
+    switch = getSwitch(ctx, ctx.model.fmAnnounce, 'FM-Annonc')[1]
     if switch != '-':
-        writeLine('\nAnsage der gewählten Flugphase;' + switch, '\nAnnounce current flight mode;' + switch)
+        writeLine(ctx, [ctx.msg['announceCurrentFlightMode'], switch])
 
-    outDe = '\nNummer;Titel;Verzögerung;Schalter;Audio'
-    outEn = '\nNumber;Label;Delay;Switch;Audio'
+    out = ctx.msg['flightModesColumns'].copy()
     trimseq = 4 * [0]
-    item = modelData['Flight-Modes']['Data'][0]  # all flight modes have same digitrim funcids
-    digitrim = item['DigiTrim']  # is list of dicts
+    digitrim = ctx.model.flightModes[0].trims  # all flight modes have same digitrim funcids
     for ii in range(4):
-        trimseq[ii] = digitrim[ii]['FuncID']
+        trimseq[ii] = digitrim[ii].function
     trimseq.sort()
     for ii in range(4):
-        if functionlist[trimseq[ii]] != 'nix':
-            outDe = outDe + ';' + 'Trim ' + functionlist[trimseq[ii]]
-            outEn = outEn + ';' + 'Trim ' + functionlist[trimseq[ii]]
-    writeLine(outDe, outEn)
-    for item in modelData['Flight-Modes']['Data']:  # is list of dicts
+        if ctx.functionlist[trimseq[ii]] != 'nix':
+            out.append('Trim ' + ctx.functionlist[trimseq[ii]])
+    writeLine(ctx, out)
+    for ind, fm in enumerate(ctx.model.flightModes):
+        ctx.path = 'Flight-Modes.Data[%d]' % ind
         trim = 4 * ['nix']
-        key = int(item['ID'])
-        seq = flightmoseq.index(key) + 1
-        label = item['Label']
-        aud = item['Audio']
-        delay = setDecPoint(1, item['Delay'])
+        key = fm.id
+        seq = ctx.flightmoseq.index(key) + 1
+        delay = setDecPoint(1, fm.delay)
         delayout = str(delay) + 's'
-        sw = getSwitch(item['Switch'])[1]
-        if sw == '-' and key == flightmoid[0]:
-            swDe = 'ist Standard'
-            swEn = 'is default'
+        sw = getSwitch(ctx, fm.switch, 'Switch')[1]
+        if sw == '-' and key == ctx.flightmoid[0]:
+            sw = ctx.msg['isDefault']
             stdkey = key
-        else:
-            swDe = sw
-            swEn = sw
-        outDe = '\n' + str(seq) + ';' + label + ';' + delayout  + ';' + swDe + ';' + aud
-        outEn = '\n' + str(seq) + ';' + label + ';' + delayout + ';' + swEn + ';' + aud
-        digitrim = item['DigiTrim']  # is list of dicts
+        out = [str(seq), fm.label, delayout, sw, fm.audio]
         for ii in range(4):
-            funcid = digitrim[ii]['FuncID']
+            funcid = fm.trims[ii].function
             jj = trimseq.index(funcid)
-            if functionlist[funcid] != 'nix':
-                trim[jj] = str(digitrim[ii]['Value'])
+            if ctx.functionlist[funcid] != 'nix':
+                trim[jj] = str(fm.trims[ii].value)
             else:
                 trim[jj] = 'nix'
         for ii in range(4):
             if trim[ii] != 'nix':
-                outDe = outDe + ';' + trim[ii]
-                outEn = outEn + ';' + trim[ii]
-        writeLine(outDe, outEn)
-
-    writeLine('\n\nDigitaltrimmung;(der Standard Flugphase  ' + flightmolist[0] + ')', '\n\nDigital Trim;(of Default Flight Mode  ' + flightmolist[0] + ')')
-    outDe = '\nFunktion;Wert;Gespeichert;Mode;Schritt;Weg -; Weg +'
-    outEn = '\nFunction;Value;Stored;Mode;Step;Rate -; Rate +'
-    writeLine(outDe, outEn)
-    modesDe = ['Zentriert', 'Linear', 'Dros-Min', 'Dros-50%', 'Dros-Voll']
-    modesEn = ['Centered', 'Linear', 'Thro-Low', 'Thr-L 50%', 'Thro-High']
+                out.append(trim[ii])
+        writeLine(ctx, out)
+
+    writeTitle(ctx, [ctx.msg['digitalTrim'], ctx.msg['ofDefaultFm'].format(ctx.flightmolist[0])])
+    writeLine(ctx, ctx.msg['digitalTrimColumns'])
+    modes = ctx.msg['digitalTrimModes']
     empty = True
-    for item in modelData['Flight-Modes']['Data']:  # is list of dicts
-        key = int(item['ID'])
-        if key == stdkey: # is default flight mode
-            digitrim = item['DigiTrim']  # is list of dicts
+    for ind, fm in enumerate(ctx.model.flightModes):
+        if fm.id == stdkey: # is default flight mode
+            ctx.path = 'Flight-Modes.Data[%d]' % ind
+            digitrim = fm.trims
             for ii in range(4):
-                trimseq[ii] = digitrim[ii]['FuncID']
+                trimseq[ii] = digitrim[ii].function
             funcseq = trimseq.copy()
             trimseq.sort()
             for ii in range(4):
-                if functionlist[trimseq[ii]] != 'nix':
+                if ctx.functionlist[trimseq[ii]] != 'nix':
                     empty = False
-                    outDe = '\n' + functionlist[trimseq[ii]]
-                    outEn = outDe
+                    func = ctx.functionlist[trimseq[ii]]
                     # get data of corresponding funcid
                     jj = funcseq.index(trimseq[ii])
-                    value = digitrim[jj]['Value']
-                    stored = digitrim[jj]['Stored']
-                    mode = digitrim[jj]['Mode']
-                    if mode < len(modesDe):
-                        modeDe = modesDe[mode]
-                        modeEn = modesEn[mode]
+                    dt = digitrim[jj]
+                    if dt.mode < len(modes):
+                        mode = modes[dt.mode]
                     else:
-                        modeDe = '?zefix?'
-                        modeEn = '?zefix?'
-                        zefix(1)
-                    step = digitrim[jj]['Step']
-                    rate1 = digitrim[jj]['Max-Neg']
-                    rate2 = digitrim[jj]['Max-Pos']
-                    outDe = outDe + ';' + str(value) + ';' + str(stored) + ';' + modeDe + ';' + str(step) + ';' + str(rate1) + ';' + str(rate2)
-                    outEn = outEn + ';' + str(value) + ';' + str(stored) + ';' + modeEn + ';' + str(step) + ';' + str(rate1) + ';' + str(rate2)
-                    writeLine(outDe, outEn)
+                        mode = zefix(ctx, 1, 'DigiTrim[%d].Mode' % jj, dt.mode)
+                    writeLine(ctx, [func, str(dt.value), str(dt.stored), mode, str(dt.step), str(dt.maxNegative), str(dt.maxPositive)])
     if empty:
-        writeLine('\nkeine Digitaltrimmung', '\nno Digital Trim')
-
+        writeLine(ctx, ctx.msg['noDigitalTrim'])
 
-def flightmodes3(modelData):
+def flightmodes3(ctx, modelData):
     # Vtail-Delta-Ailvator
-    if aferatgt[8] != '':
-        writeLine('\n\nFlugphasen: ' + aferatgt[8], '\n\nFlight Modes: ' + aferatgt[8])
-        if aferatgt[8] == 'V-Leitwerksmischer' or aferatgt[8] == 'V-Tail Mix':
-            writeLine('\nFlugphase;Höhe S1 / S2;Seite S1 / S2', '\nFlight Mode;Elevator S1 / S2;Rudder S1 / S2')
+    if ctx.aferatgt[8] != '':
+        writeTitle(ctx, [ctx.msg['flightModesOf'].format(ctx.aferatgt[8])])
+        if ctx.aferatgt[8] == ctx.msg['vtailMix']:
+            writeLine(ctx, ctx.msg['vtailColumns'])
         else:
-            writeLine('\nFlugphase;Höhe S1 / S2;Quer S1 / S2', '\nFlight Mode;Elevator S1 / S2;Ailerons S1 / S2')
+            writeLine(ctx, ctx.msg['deltaColumns'])
         out_buf_l = []
         out_buf_v = []
         for item in modelData['Flight-Modes']['Data']:  # is list of dicts
@@ -788,26 +1515,25 @@ def flightmodes3(modelData):
             w2 = str(item['VTail-Delta-Ailv'][1])
             w5 = str(item['VTail-Delta-Ailv'][4])
             w6 = str(item['VTail-Delta-Ailv'][5])
-            outl = '\n' + label
-            outv = ';' + w1 + ' / ' + w2 + ';' + w5 + ' / ' + w6
-            out_buf_l.append(outl)
-            out_buf_v.append(outv)
-        writeEssence(out_buf_l, out_buf_v)
+            outv = [w1 + ' / ' + w2, w5 + ' / ' + w6]
+            out_buf_l.append(label)
+            out_buf_v.append([outv])
+        writeEssence(ctx, out_buf_l, out_buf_v)
 
     # Aileron Differential
-    if aferatgt[0] < 2:
+    if ctx.aferatgt[0] < 2:
         return
-    writeLine('\n\nQuerruderdifferenzierung', '\n\nAileron Differential')
-    if aferatgt[0] == 2:
-        writeLine('\nFlugphase;Geber;Wirkung;Pos S1 / S2;Neg S1 / S2', '\nFlight Mode;Control;Adjust;Up S1 / S2;Down S1 / S2')
-    if aferatgt[0] == 4:
-        writeLine('\nFlugphase;Geber;Wirkung;Pos S1 / S2 / S3 / S4;Neg S1 / S2 / S3 / S4',
-                  '\nFlight Mode;Control;Adjust;Up S1 / S2 / S3 / S4;Down S1 / S2 / S3 / S4')
+    writeTitle(ctx, ctx.msg['aileronDiffTitle'])
+    if ctx.aferatgt[0] == 2:
+        writeLine(ctx, ctx.msg['aileronDiffColumns2'])
+    if ctx.aferatgt[0] == 4:
+        writeLine(ctx, ctx.msg['aileronDiffColumns4'])
     out_buf_l = []
     out_buf_v = []
-    for item in modelData['Flight-Modes']['Data']:  # is list of dicts
+    for ii, item in enumerate(modelData['Flight-Modes']['Data']):  # is list of dicts
+        ctx.path = 'Flight-Modes.Data[%d]' % ii
         label = item['Label']
-        qd_sw = getSwitch(item['ADiffSwitch'])[0]
+        qd_sw = getSwitch(ctx, item['ADiffSwitch'], 'ADiffSwitch')[0]
         wirk = str(item['ADiffVal'])
         qd_neg_s1 = str(item['ADiffPos'][0])
         qd_neg_s2 = str(item['ADiffPos'][1])
@@ -817,53 +1543,37 @@ def flightmodes3(modelData):
         qd_pos_s2 = str(item['ADiffNeg'][1])
         qd_pos_s3 = str(item['ADiffNeg'][2])
         qd_pos_s4 = str(item['ADiffNeg'][3])
-        outl = '\n' + label
-        outv = ';' + qd_sw + ';' + wirk + ';' + qd_neg_s1 + ' / ' + qd_neg_s2 + ';' + qd_pos_s1 + ' / ' + qd_pos_s2
-        if aferatgt[0] == 4:
-            outv = ';' + qd_sw + ';' + wirk + ';' + qd_neg_s1 + ' / ' + qd_neg_s2 + ' / ' + qd_neg_s3 + ' / ' + qd_neg_s4 + ';' + qd_pos_s1 + ' / ' + qd_pos_s2 + ' / ' + qd_pos_s3 + ' / ' + qd_pos_s4
-        out_buf_l.append(outl)
-        out_buf_v.append(outv)
-    writeEssence(out_buf_l, out_buf_v)
+        outv = [qd_sw, wirk, qd_neg_s1 + ' / ' + qd_neg_s2, qd_pos_s1 + ' / ' + qd_pos_s2]
+        if ctx.aferatgt[0] == 4:
+            outv = [qd_sw, wirk, qd_neg_s1 + ' / ' + qd_neg_s2 + ' / ' + qd_neg_s3 + ' / ' + qd_neg_s4, qd_pos_s1 + ' / ' + qd_pos_s2 + ' / ' + qd_pos_s3 + ' / ' + qd_pos_s4]
+        out_buf_l.append(label)
+        out_buf_v.append([outv])
+    writeEssence(ctx, out_buf_l, out_buf_v)
 
     # Butterfly/Flaps
-    writeLine('\n\nButterfly', '\n\nButterfly/Flaps')
-    if options['language'] == 'de':
-        out_title = '\nFlugphase;Geber;Offset'
-        if aferatgt[0] == 2:
-            out_title = out_title + ';' + 'Quer S1 / S2' + ';' + 'Dif. Einst. S1 / S2'
-        if aferatgt[0] == 4:
-            out_title = out_title + ';' + 'Quer S1 / S2 / S3 / S4' + ';' + 'Dif Einst. S1 / S2 / S3 / S4'
-        if aferatgt[1] == 2:
-            out_title = out_title + ';' + 'Klappen S1 / S2'
-        if aferatgt[1] == 4:
-            out_title = out_title + ';' + 'Klappen S1 / S2 / S3 / S4'
-        if aferatgt[2] == 1:
-            out_title = out_title + ';' + 'Höhe S1'
-        if aferatgt[2] == 2:
-            out_title = out_title + ';' + 'Höhe S1 / S2'
-        out_title = out_title + ';' + 'Höhe Kurve' + ';' + 'Fein. Geber' + ';' + 'Dif. Einst.' + ';' + 'Quer' + ';' + 'Klappen' + ';' + 'Höhe'
-    else:
-        out_title = '\nFlight Mode;Control;Offset'
-        if aferatgt[0] == 2:
-            out_title = out_title + ';' + 'Ailerons S1 / S2' + ';' + 'Dif. adjust S1 / S2'
-        if aferatgt[0] == 4:
-            out_title = out_title + ';' + 'Ailerons S1 / S2 / S3 / S4' + ';' + 'Dif. adjust S1 / S2 / S3 / S4'
-        if aferatgt[1] == 2:
-            out_title = out_title + ';' + 'Flaps S1 / S2'
-        if aferatgt[1] == 4:
-            out_title = out_title + ';' + 'Flaps S1 / S2 / S3 / S4'
-        if aferatgt[2] == 1:
-            out_title = out_title + ';' + 'Elevator S1'
-        if aferatgt[2] == 2:
-            out_title = out_title + ';' + 'Elevator S1 / S2'
-        out_title = out_title + ';' + 'Elevator Curve' + ';' + 'Tuning Control' + ';' + 'Dif. Adjust' + ';' + 'Ailerons' + ';' + 'Flaps' + ';' + 'Elevator'
-    writeLine(out_title, out_title)
+    writeTitle(ctx, ctx.msg['butterflyTitle'])
+    out_title = ctx.msg['butterflyColumns'].copy()
+    if ctx.aferatgt[0] == 2:
+        out_title += ctx.msg['butterflyAilerons2']
+    if ctx.aferatgt[0] == 4:
+        out_title += ctx.msg['butterflyAilerons4']
+    if ctx.aferatgt[1] == 2:
+        out_title.append(ctx.msg['butterflyFlaps2'])
+    if ctx.aferatgt[1] == 4:
+        out_title.append(ctx.msg['butterflyFlaps4'])
+    if ctx.aferatgt[2] == 1:
+        out_title.append(ctx.msg['butterflyElevator1'])
+    if ctx.aferatgt[2] == 2:
+        out_title.append(ctx.msg['butterflyElevator2'])
+    out_title += ctx.msg['butterflyTuning']
+    writeLine(ctx, out_title)
     # Ailerons max 4 values, Dif max 4 values, Flaps max 4 values, Elevator max 2 values, Curve yes if not Standard
     out_buf_l = []
     out_buf_v = []
-    for item in modelData['Flight-Modes']['Data']:  # is list of dicts
+    for ii, item in enumerate(modelData['Flight-Modes']['Data']):  # is list of dicts
+        ctx.path = 'Flight-Modes.Data[%d]' % ii
         label = item['Label']
-        butt_sw = getSwitch(item['BrakeSw'])[0]
+        butt_sw = getSwitch(ctx, item['BrakeSw'], 'BrakeSw')[0]
         offset = str(item['BkOffset'])
         butt_qr_s1 = str(item['BrakeMix'][0])
         butt_qr_s2 = str(item['BrakeMix'][1])
@@ -879,268 +1589,143 @@ def flightmodes3(modelData):
         butt_qr_d2 = str(item['BrakeDiff'][1])
         butt_qr_d3 = str(item['BrakeDiff'][2])
         butt_qr_d4 = str(item['BrakeDiff'][3])
-        curve = getCurve(item['BrakeElevCurve']['Curve-Type'])[0]
+        curve = getCurve(ctx, item['BrakeElevCurve']['Curve-Type'], 'BrakeElevCurve.Curve-Type')[0]
         curvedat = ''
         curvepoints = ''
-        if curve in ['konstant', 'Constant']:
+        if item['BrakeElevCurve']['Curve-Type'] == 1:  # constant
             curvedat = '=' + str(item['BrakeElevCurve']['Points-Out'][0])
-        butt_tun_sw = getSwitch(item['BkAdjustSwitch'])[0]
+        butt_tun_sw = getSwitch(ctx, item['BkAdjustSwitch'], 'BkAdjustSwitch')[0]
         butt_tun_dif = str(item['BrakeAdjust'][3])
         butt_tun_qr = str(item['BrakeAdjust'][0])
         butt_tun_wk = str(item['BrakeAdjust'][1])
         butt_tun_hr = str(item['BrakeAdjust'][2])
-        outl = '\n' + label
-        outv = ';' + butt_sw + ';' + offset
-        if aferatgt[0] == 2:
-            outv = outv + ';' + butt_qr_s1 + ' / ' + butt_qr_s2 + ';' + butt_qr_d1 + ' / ' + butt_qr_d2
-        if aferatgt[0] == 4:
-            outv = outv + ';' + butt_qr_s1 + ' / ' + butt_qr_s2 + ' / ' + butt_qr_s3 + ' / ' + butt_qr_s4 + ';' + butt_qr_d1 + ' / ' + butt_qr_d2 + ' / ' + butt_qr_d3 + ' / ' + butt_qr_d4
-        if aferatgt[1] == 2:
-            outv = outv + ';' + butt_wk_s1 + ' / ' + butt_wk_s2
-        if aferatgt[1] == 4:
-            outv = outv + ';' + butt_wk_s1 + ' / ' + butt_wk_s2 + ' / ' + butt_wk_s3 + ' / ' + butt_wk_s4
-        if aferatgt[2] == 1:
-            outv = outv + ';' + butt_hr_s1
-        if aferatgt[2] == 2:
-            outv = outv + ';' + butt_hr_s1 + ' / ' + butt_hr_s2
-        outv2 = outv.count(';') * ';' # prepare second line for curve points
-        outv = outv + ';' + curve + curvedat + ';' + butt_tun_sw + ';' + butt_tun_dif + ';' + butt_tun_qr + ';' + butt_tun_wk + ';' + butt_tun_hr
-        if getCurve(item['BrakeElevCurve']['Curve-Type'])[1]: # is a ...-point curve
+        outv = [butt_sw, offset]
+        if ctx.aferatgt[0] == 2:
+            outv += [butt_qr_s1 + ' / ' + butt_qr_s2, butt_qr_d1 + ' / ' + butt_qr_d2]
+        if ctx.aferatgt[0] == 4:
+            outv += [butt_qr_s1 + ' / ' + butt_qr_s2 + ' / ' + butt_qr_s3 + ' / ' + butt_qr_s4, butt_qr_d1 + ' / ' + butt_qr_d2 + ' / ' + butt_qr_d3 + ' / ' + butt_qr_d4]
+        if ctx.aferatgt[1] == 2:
+            outv.append(butt_wk_s1 + ' / ' + butt_wk_s2)
+        if ctx.aferatgt[1] == 4:
+            outv.append(butt_wk_s1 + ' / ' + butt_wk_s2 + ' / ' + butt_wk_s3 + ' / ' + butt_wk_s4)
+        if ctx.aferatgt[2] == 1:
+            outv.append(butt_hr_s1)
+        if ctx.aferatgt[2] == 2:
+            outv.append(butt_hr_s1 + ' / ' + butt_hr_s2)
+        outv2 = (len(outv) + 1) * [''] # prepare second line for curve points, in column of curve
+        outv += [curve + curvedat, butt_tun_sw, butt_tun_dif, butt_tun_qr, butt_tun_wk, butt_tun_hr]
+        if getCurve(ctx, item['BrakeElevCurve']['Curve-Type'], 'BrakeElevCurve.Curve-Type')[1]: # is a ...-point curve
             for jj in range(len(item['BrakeElevCurve']['Points-In'])):
                 if curvepoints != '':
                     curvepoints = curvepoints + '  '
                 curvepoints = curvepoints + str(item['BrakeElevCurve']['Points-In'][jj]) + '|' + str(item['BrakeElevCurve']['Points-Out'][jj])
-            outv2 = outv2 + ';' + curvepoints
-        out_buf_l.append(outl)
-        if '|' in outv2: # there are curve points, so write them
-            out_buf_v.append(outv  + '\n' + outv2)
+            outv2.append(curvepoints)
+        out_buf_l.append(label)
+        if '|' in curvepoints: # there are curve points, so write them
+            out_buf_v.append([outv, outv2])
         else:
-            out_buf_v.append(outv)
-    writeEssence(out_buf_l, out_buf_v)
+            out_buf_v.append([outv])
+    writeEssence(ctx, out_buf_l, out_buf_v)
 
 
-def functions1(modelData): # set functionlist[]
-    for item in modelData['Functions']['Data']:  # is list of dicts
-        key = item['ID']
-        functionlist[key] = item['Label']
-
+def functions1(ctx, modelData): # set functionlist[]
+    for func in ctx.model.functions:
+        ctx.functionlist[func.id] = func.label
 
-def functions2(modelData):
-    writeLine('\n\nFunktions+Geberzuordnung:', '\n\nFunctions Assignment:')
-    writeLine('\nNummer;Funktion;Geber;Trim;Trim max', '\nNumber;Function;Control;Trim;Trim max')
+def functions2(ctx, modelData):
+    writeTitle(ctx, ctx.msg['functionsTitle'])
+    writeLine(ctx, ctx.msg['functionsColumns'])
     ii = 0
-    for item in modelData['Functions']['Data']:  # is list of dicts
+    for func in ctx.model.functions:
+        ctx.path = 'Functions.Data[%d]' % ii
         ii += 1
-        label = item['Label']
-        control = getSwitch(item['Control'])[0]
-        trimcontrol = getSwitch(item['Trim-Control'])[0]
-        trimmax = item['Trim-Max']
-        out = str(ii) + ';' + label + ';' + control
+        control = getSwitch(ctx, func.control, 'Control')[0]
+        trimcontrol = getSwitch(ctx, func.trimControl, 'Trim-Control')[0]
+        out = [str(ii), func.label, control]
         if trimcontrol != '-':
-            out = out + ';' + trimcontrol + ';' + str(trimmax)
-        writeLine('\n' + out, '\n' + out)
+            out += [trimcontrol, str(func.trimMax)]
+        writeLine(ctx, out)
     # butterfly automatically added as virtual function since Jeti V5.0
-    if aferatgt[0] >= 2:
-        functionlist[31] = 'Butterfly'
+    if ctx.aferatgt[0] >= 2:
+        ctx.functionlist[31] = 'Butterfly'
         # add Brk and Flp if missing in standard functions (standard functions could be deleted before Jeti V5)
-        if functionlist[5] == 'nix':
-            functionlist[5] = 'Brk'
-        if functionlist[6] == 'nix':
-            functionlist[6] = 'Flp'
-
-
-def functionspecs(modelData):
-    # collect headings at Flight-Mode 0
-    if options['language'] == 'de':
-        out_title_trim = 'Flugphase'
-        out_title_dr = 'Flugphase'
-        out_title_expo = 'Flugphase'
-        out_title_sw = 'Flugphase'
-        out_title_curve = 'Flugphase'
-        for item in modelData['Function-Specs']:  # is list of dicts
-            flm = int(item['Flight-Mode'])
-            if flm == 0:
-                flmt = flightmolist[flm]
-                fun = int(item['Function-Id'])
-                funt = functionlist[fun]
-                out_title_trim = out_title_trim + ';' + funt + ' Trim'
-                out_title_dr = out_title_dr + ';' + funt + ' DR'
-                out_title_expo = out_title_expo + ';' + funt + ' Expo'
-                out_title_sw = out_title_sw + ';' + funt + ' Schalter'
-                out_title_curve = out_title_curve + ';' + funt + ' Kurve'
-            else:
-                break
-    else:
-        out_title_trim = 'Flight Mode'
-        out_title_dr = 'Flight Mode'
-        out_title_expo = 'Flight Mode'
-        out_title_sw = 'Flight Mode'
-        out_title_curve = 'Flight Mode'
-        for item in modelData['Function-Specs']:  # is list of dicts
-            flm = int(item['Flight-Mode'])
-            if flm == 0:
-                flmt = flightmolist[flm]
-                fun = int(item['Function-Id'])
-                funt = functionlist[fun]
-                out_title_trim = out_title_trim + ';' + funt + ' Trim'
-                out_title_dr = out_title_dr + ';' + funt + ' DR'
-                out_title_expo = out_title_expo + ';' + funt + ' Expo'
-                out_title_sw = out_title_sw + ';' + funt + ' Switch'
-                out_title_curve = out_title_curve + ';' + funt + ' Curve'
-            else:
-                break
-
-    # collect data
-    out_buf_l = []
-    out_trim_v = []
-    out_trim = ''
-    out_dr_v = []
-    out_dr = ''
-    out_expo_v = []
-    out_expo = ''
-    out_drsw_v = []
-    out_drsw = ''
-    out_curve_v = []
-    out_curve = ''
-    out_curve2 = ''
-    no_sw = True
+        if ctx.functionlist[5] == 'nix':
+            ctx.functionlist[5] = 'Brk'
+        if ctx.functionlist[6] == 'nix':
+            ctx.functionlist[6] = 'Flp'
+
+def functionspecs(ctx, modelData):
+    # Function-Specs is read in one pass into a table with one entry per flight mode (as sorted by the transmitter):
+    # [label of flight mode, trims, dual rates, expos, dual rate switches, curves, points of curves],
+    # each property a list with one cell per function, points of curves start with the cell below the label
+    funcs = []  # labels of the functions of the first flight mode, used for the headings
+    table = []
+    row = None
     flmold = -1
-    # store data
-    for item in modelData['Function-Specs']:  # is list of dicts
+    no_sw = True
+    delays = {}  # text of each delay, most functions have the same delays
+    for ii, item in enumerate(modelData['Function-Specs']):  # is list of dicts
+        ctx.path = 'Function-Specs[%d]' % ii
         flm = int(item['Flight-Mode'])
-        flmt = flightmolist[flm]
-        fun = int(item['Function-Id'])
-        funt = functionlist[fun]
-        trim1 = item['Ph-Trim'][0]
-        trim2 = item['Ph-Trim'][1]
-        trim3 = item['Ph-Trim'][2]
-        trim4 = item['Ph-Trim'][3]
-        drneg = item['DR-Neg'][0]
-        drpos = item['DR-Pos'][0]
-        sw = getSwitch(item['DR-Switch'])[1]
+        funt = ctx.functionlist[int(item['Function-Id'])]
+        if flm != flmold:  # next flight mode with first function
+            flmold = flm
+            row = [ctx.flightmolist[flm], [], [], [], [], [], ['']]
+            table.append(row)
+        if flm == 0 and len(table) == 1:
+            funcs.append(funt)
+        servos = getServoCount(ctx, funt)
+        if servos in [2, 3, 4]:
+            row[1].append(' / '.join([str(trim) for trim in item['Ph-Trim'][:servos]]))
+        else:
+            row[1].append(str(item['Ph-Trim'][0]))
+        row[2].append(str(item['DR-Neg'][0]) + ' / ' + str(item['DR-Pos'][0]))
+        row[3].append(str(item['Expo-Neg'][0]) + ' / ' + str(item['Expo-Pos'][0]))
+        sw = getSwitch(ctx, item['DR-Switch'], 'DR-Switch')[1]
         if sw != '-':
             no_sw = False
-        exneg = item['Expo-Neg'][0]
-        expos = item['Expo-Pos'][0]
-        curve = getCurve(item['Curve-Type'])[0]
-        curvedat = ''
-        curvepoints = ''
-        if curve in ['konstant', 'Constant']:
-            curvedat = '=' + str(item['Points-Out'][0])
-        if getCurve(item['Curve-Type'])[1]: # is a ...-point curve
-            for jj in range(len(item['Points-In'])):
-                if curvepoints != '':
-                    curvepoints = curvepoints + '  '
-                curvepoints = curvepoints + str(item['Points-In'][jj]) + '|' + str(item['Points-Out'][jj])
-        delaya = setDecPoint(1, item['Delay-Neg'])
-        delayb = setDecPoint(1, item['Delay-Pos'])
-        curvedat = curvedat + '  -' + str(delaya) + ' +' + str(delayb) + '   ' + getYesNo(item['FM-Delay'])
-        if flm == flmold:  # continue within same flight mode
-            hit = False
-            for txt in aferatg_txt:
-                if funt == txt:
-                    hit = True
-                    ii = aferatg_txt.index(funt) % 7
-                    out_trim = out_trim + ';' + str(trim1)
-                    if aferatgt[ii] == 2:
-                        out_trim = out_trim + ' / ' + str(trim2)
-                    if aferatgt[ii] == 3:
-                        out_trim = out_trim + ' / ' + str(trim2) + ' / ' + str(trim3)
-                    if aferatgt[ii] == 4:
-                        out_trim = out_trim + ' / ' + str(trim2) + ' / ' + str(trim3) + ' / ' + str(trim4)
-            if not hit:
-                out_trim = out_trim + ';' + str(trim1)
-            out_dr = out_dr + ';' + str(drneg) + ' / ' + str(drpos)
-            out_expo = out_expo + ';' + str(exneg) + ' / ' + str(expos)
-            out_drsw = out_drsw + ';' + sw
-            out_curve = out_curve + ';' + curve + curvedat
-            out_curve2 = out_curve2 + ';' + curvepoints
-        else:  # next flight mode with first function
-            if flmold != -1: # put data to buffer
-                out_trim_v.append(out_trim)
-                out_dr_v.append(out_dr)
-                out_expo_v.append(out_expo)
-                out_drsw_v.append(out_drsw)
-                if '|' in out_curve2: # there are curve points, so write them
-                    out_curve_v.append(out_curve + '\n' + out_curve2)
-                else:
-                    out_curve_v.append(out_curve)
-            flmold = flm
-            out_buf_l.append('\n' + flmt)
-            hit = False
-            for txt in aferatg_txt:
-                if funt == txt:
-                    hit = True
-                    ii = aferatg_txt.index(funt) % 7
-                    out_trim = ';' + str(trim1)
-                    if aferatgt[ii] == 2:
-                        out_trim = out_trim + ' / ' + str(trim2)
-                    if aferatgt[ii] == 3:
-                        out_trim = out_trim + ' / ' + str(trim2) + ' / ' + str(trim3)
-                    if aferatgt[ii] == 4:
-                        out_trim = out_trim + ' / ' + str(trim2) + ' / ' + str(trim3) + ' / ' + str(trim4)
-            if not hit:
-                out_trim = ';' + str(trim1)
-            out_dr = ';' + str(drneg) + ' / ' + str(drpos)
-            out_expo = ';' + str(exneg) + ' / ' + str(expos)
-            out_drsw = ';' + sw
-            out_curve = ';' + curve + curvedat
-            out_curve2 = ';' + curvepoints
-    out_trim_v.append(out_trim)
-    out_dr_v.append(out_dr)
-    out_expo_v.append(out_expo)
-    out_drsw_v.append(out_drsw)
-    if '|' in out_curve2: # we have curve points
-        out_curve_v.append(out_curve + '\n' + out_curve2)
-    else:
-        out_curve_v.append(out_curve)
-
-    # write data
-    writeLine('\n\nFlugphasentrimmung;(Servos)', '\n\nFlight Mode Trim;(Servos)')
-    writeLine('\n' + out_title_trim, '\n' + out_title_trim)
-    writeEssence(out_buf_l, out_trim_v)
-    writeLine('\n\nDual Rate;(Werte für Position 1)',
-              '\n\nDual Rate;(values of Position 1)')
-    writeLine('\n' + out_title_dr, '\n' + out_title_dr)
-    writeEssence(out_buf_l, out_dr_v)
-    writeLine('\n\nDual Rate Schalter', '\n\nDual Rate switches')
+        row[4].append(sw)
+        curve, points = getCurve(ctx, item['Curve-Type'], 'Curve-Type')
+        if item['Curve-Type'] == 1:  # constant
+            curve = curve + '=' + str(item['Points-Out'][0])
+        for delay in [item['Delay-Neg'], item['Delay-Pos']]:
+            if delay not in delays:
+                delays[delay] = str(setDecPoint(1, delay))
+        row[5].append(curve + '  -' + delays[item['Delay-Neg']] + ' +' + delays[item['Delay-Pos']] + '   '
+                      + getYesNo(ctx, item['FM-Delay'], 'FM-Delay'))
+        if points:  # is a ...-point curve
+            row[6].append('  '.join([str(pin) + '|' + str(pout) for pin, pout in zip(item['Points-In'], item['Points-Out'])]))
+        else:
+            row[6].append('')
+    if not table:  # written as global rows without values
+        table.append(['', [], [], [], [], [], ['']])
+
+    # write data, each value of writeEssence() is a list of rows
+    labels = [row[0] for row in table]
+    writeTitle(ctx, ctx.msg['fmTrimTitle'])
+    writeLine(ctx, [ctx.msg['flightMode']] + [funt + ' Trim' for funt in funcs])
+    writeEssence(ctx, labels, [[row[1]] for row in table])
+    writeTitle(ctx, ctx.msg['dualRateTitle'])
+    writeLine(ctx, [ctx.msg['flightMode']] + [funt + ' DR' for funt in funcs])
+    writeEssence(ctx, labels, [[row[2]] for row in table])
+    writeTitle(ctx, ctx.msg['dualRateSwitchesTitle'])
     if no_sw:
-        writeLine('\nkeine Schalter', '\nno switches')
+        writeLine(ctx, ctx.msg['noSwitches'])
     else:
-        writeLine('\n' + out_title_sw, '\n' + out_title_sw)
-        writeEssence(out_buf_l, out_drsw_v)
-    writeLine('\n\nExponential', '\n\nExponential')
-    writeLine('\n' + out_title_expo, '\n' + out_title_expo)
-    writeEssence(out_buf_l, out_expo_v)
-    writeLine('\n\nFunktionskurven;Kurventyp   -Verzög+   FPVerzög', '\n\nFunction Curves;Curve type   -Delay+   FM.Delay')
-    writeLine('\n' + out_title_curve, '\n' + out_title_curve)
-    writeEssence(out_buf_l, out_curve_v)
-
-
-def globalstr(modelData):
-    writeLine('\n\nGlobale Einstellungen:', '\n\nGlobal Settings:')
-    global hasAccel
-    txTyp = { # id: [transmitter-name, hasAccel (as boolean)]
-        652: ['DC-16 V2', False],
-        653: ['DS-16 V2', True],
-        674: ['DC-16', False],
-        675: ['DS-16', True],
-        676: ['DS-14', True],
-        677: ['DC-14', False],
-        678: ['DC-24', False],
-        679: ['DS-24', True],
-        680: ['DS-12', True],
-        3857: ['DC-14 V2', False],
-        3858: ['DS-14 V2', True],
-        3859: ['DC-24', False],
-        3860: ['DS-24', True],
-        3861: ['DC-16 V2', False],
-        3862: ['DS-16 V2', True],
-        3863: ['DC-14 V2', False],
-        3864: ['DS-14 V2', True],
-        3865: ['DS-12', True],
-        3866: ['DC-24 V2', False],
-    }
+        writeLine(ctx, [ctx.msg['flightMode']] + [ctx.msg['functionSwitch'].format(funt) for funt in funcs])
+        writeEssence(ctx, labels, [[row[4]] for row in table])
+    writeTitle(ctx, ['Exponential'])
+    writeLine(ctx, [ctx.msg['flightMode']] + [funt + ' Expo' for funt in funcs])
+    writeEssence(ctx, labels, [[row[3]] for row in table])
+    writeTitle(ctx, ctx.msg['curvesTitle'])
+    writeLine(ctx, [ctx.msg['flightMode']] + [ctx.msg['functionCurve'].format(funt) for funt in funcs])
+    # the points of the curves are written as second row if there are any
+    writeEssence(ctx, labels, [[row[5], row[6]] if '|' in ''.join(row[6]) else [row[5]] for row in table])
+
+
+def globalstr(ctx, modelData):
+    writeTitle(ctx, ctx.msg['globalTitle'])
+    ctx.path = 'Global'
     TxVers = False
     for item in modelData['Global']:
         if item == 'Version':
@@ -1148,424 +1733,335 @@ def globalstr(modelData):
             if value == 1:  # transmitter version <5, no type
                 continue
             if value in txTyp:
-                outDe = '\nSender Typ' + ';' + txTyp[value][0]
-                outEn = '\nTransmitter type' + ';' + txTyp[value][0]
-                hasAccel = txTyp[value][1]
+                out = [ctx.msg['txType'], txTyp[value][0]]
+                ctx.hasAccel = txTyp[value][1]
             else:
-                outDe = '\nSender Typ' + ';' + str(value) + ';' + 'ist unbekannt' + ';' + '?zefix?'
-                outEn = '\nTransmitter type' + ';' + str(value) + ';' + 'is unknown' + ';' + '?zefix?'
-                zefix(1)
-            writeLine(outDe, outEn)
+                out = [ctx.msg['txType'], str(value), ctx.msg['isUnknown'], zefix(ctx, 1, item, value)]
+            writeLine(ctx, out)
             continue
         if item == 'TxVers':
             TxVers = True
             txt = modelData['Global'][item]
-            outDe = '\nSender Version' + ';' + txt
-            outEn = '\nTransmitter version'  + ';' + txt
-            writeLine(outDe, outEn)
+            writeLine(ctx, [ctx.msg['txVersion'], txt])
             continue
         if item == 'Filename':
             txt = modelData['Global'][item]
-            outDe = '\nDateiname' + ';' + txt
-            outEn = '\nFilename' + ';' + txt
-            writeLine(outDe, outEn)
+            writeLine(ctx, [ctx.msg['filename'], txt])
             continue
         if item == 'Model-Type':
-            typDe = ['Flugzeug', 'Heli', 'Truck/Boat', 'X-Copter']
-            typEn = ['Aero', 'Heli', 'General', 'X-Copter']
+            typ = ctx.msg['modelTypes']
             ind = int(modelData['Global'][item]) - 1
-            if ind >= 0 and ind < len(typDe):
-                outDe = '\nModelltyp' + ';' + typDe[ind]
-                outEn = '\nModel type' + ';' + typEn[ind]
+            if ind >= 0 and ind < len(typ):
+                out = [ctx.msg['modelType'], typ[ind]]
             else:
-                outDe = '\nModelltyp' + ';' + '?zefix?'
-                outEn = '\nModel type' + ';' + '?zefix?'
-                zefix(1)
-            writeLine(outDe, outEn)
+                out = [ctx.msg['modelType'], zefix(ctx, 1, item, ind + 1)]
+            writeLine(ctx, out)
             continue
         if item in ['Receiver-ID1', 'Receiver-ID2']:
-            if options['language'] == 'de':
-                itemt = item.replace('Receiver', 'Empfänger')
-            else:
-                itemt = item
+            itemt = item.replace('Receiver', ctx.msg['receiver'])
             value = int(modelData['Global'][item])
-            out = itemt + ';' + getDeviceID(value)
-            writeLine('\n' + out, '\n' + out)
+            out = [itemt, getDeviceID(value)]
+            writeLine(ctx, out)
             continue
         if item in ['Name', 'Desc']:
             txt = modelData['Global'][item]
-            out = '\n' + item + ';' + txt
-            writeLine(out, out)
+            out = [item, txt]
+            writeLine(ctx, out)
             continue
         if item == 'Rx-900':
             value = int(modelData['Global'][item])
-            out = '900Mhz backup' + ';' + getYesNo(value)
-            writeLine('\n' + out, '\n' + out)
+            out = ['900Mhz backup', getYesNo(ctx, value, item)]
+            writeLine(ctx, out)
             continue
         if item == 'Rx-ID900':
             value = int(modelData['Global'][item])
-            out = item + ';' + getDeviceID(value)
-            writeLine('\n' + out, '\n' + out)
+            out = [item, getDeviceID(value)]
+            writeLine(ctx, out)
             continue
         if item == 'Rx-900Sw':
             value = str(modelData['Global'][item])
-            sw = getSwitch(value)[1]
-            out = '\n' + item + ';' + sw
-            writeLine(out, out)
+            sw = getSwitch(ctx, value, item)[1]
+            out = [item, sw]
+            writeLine(ctx, out)
             continue
         if item == 'Type':
             continue
         if item == 'txID':
             value = int(modelData['Global'][item])
-            out = 'txID' + ';' + getDeviceID(value)
-            writeLine('\n' + out, '\n' + out)
+            out = ['txID', getDeviceID(value)]
+            writeLine(ctx, out)
             continue
-        outDe = str(item) + ';' + str(modelData['Global'][item])
-        outEn = str(item) + ';' + str(modelData['Global'][item])
-        writeLine('\n' + outDe, '\n' + outEn)
+        writeLine(ctx, [str(item), str(modelData['Global'][item])])
     if not TxVers:
-        writeLine('\nSender Version;< 3', '\nTransmitter Version;< 3')
+        writeLine(ctx, ctx.msg['txVersionOld'])
 
 
-def iqsdata(modelData):
-    writeLine('\n\nIQSData:', '\n\nIQSData:')
-    printDict(modelData['IQSData'])
+def iqsdata(ctx, modelData):
+    writeTitle(ctx, ['IQSData:'])
+    printDict(ctx, modelData['IQSData'])
 
 
-def logswitch(modelData):
-    writeLine('\n\nLogische Schalter:', '\n\nLogical Switches:')
+def logswitch(ctx, modelData):
+    writeTitle(ctx, ctx.msg['logSwitchTitle'])
     logtyp = ['...', 'AND', 'OR', 'Multi', 'XOR', 'A▲B▼', 'A>B', 'A<B', 'A=B']
     cond = ['x<', 'x>', 'Lin', '|x|<', '|x|>', '|x|=', 'x~']
     # search the last logical switch which is not equal to default
-    last = len(modelData['LogSwitch']['Data'])
+    last = len(ctx.model.logSwitches)
     empty = True
     for ii in range(last - 1, -1, -1):
-        item = modelData['LogSwitch']['Data'][ii]
-        enabled = item['Enabled']
-        label = item['Label']
-        sw1 = getSwitch(item['Switch1'])[0]
-        if item['Log-Type'] < len(logtyp):
-            zutxt = logtyp[item['Log-Type']]
+        logsw = ctx.model.logSwitches[ii]
+        ctx.path = 'LogSwitch.Data[%d]' % ii
+        sw1 = getSwitch(ctx, logsw.switch1, 'Switch1')[0]
+        if logsw.logType < len(logtyp):
+            zutxt = logtyp[logsw.logType]
         else:
-            zutxt = zefix(1)
-        sw2 = getSwitch(item['Switch2'])[0]
-        if enabled != 0 or label != '' or sw1 != '-' or zutxt != '...' or sw2 != '-':
+            zutxt = zefix(ctx, 1, 'Log-Type', logsw.logType)
+        sw2 = getSwitch(ctx, logsw.switch2, 'Switch2')[0]
+        if logsw.enabled != 0 or logsw.label != '' or sw1 != '-' or zutxt != '...' or sw2 != '-':
             empty = False
             last = ii
             break
     if empty:
-        writeLine('\nkeine Schalter', '\nno switches')
+        writeLine(ctx, ctx.msg['noSwitches'])
         return
-    writeLine('\nNummer;Titel;Aktiv;Geber1;Spezifkation1;Geber2;Spezifkation2;Zustand;Verzögerung',
-              '\nNumber;Label;Enabled;Control1;Specification1;Control2;Specification2;Condition;Delay')
-    for item in modelData['LogSwitch']['Data']:  # is list of dicts
-        ind = int(item['Index'])
+    writeLine(ctx, ctx.msg['logSwitchColumns'])
+    for ii, logsw in enumerate(ctx.model.logSwitches):
+        ind = logsw.index
         if ind > last:
             return
-        enabled = getYesNo(item['Enabled'])
-        label = item['Label']
-        cond1 = item['Cond1']
-        if cond1 < len(cond):
-            prop = getSwitch(item['Switch1'])[3]
-            if prop:
-                sw1 = getSwitch(item['Switch1'])[0]
-                if cond1 == 2: # Lin is displayed without value
-                    spec1 = cond[cond1]
+        ctx.path = 'LogSwitch.Data[%d]' % ii
+        enabled = getYesNo(ctx, logsw.enabled, 'Enabled')
+        if logsw.cond1 < len(cond):
+            if getSwitch(ctx, logsw.switch1, 'Switch1')[3]: # is proportional
+                sw1 = getSwitch(ctx, logsw.switch1, 'Switch1')[0]
+                if logsw.cond1 == 2: # Lin is displayed without value
+                    spec1 = cond[logsw.cond1]
                 else:
-                    spec1 = cond[cond1] + ' ' + str(int(round(100.*(item['Value1']/4000.)))) + '%'
+                    spec1 = cond[logsw.cond1] + ' ' + str(int(round(100.*(logsw.value1/4000.)))) + '%'
             else:
-                sw1 = getSwitch(item['Switch1'])[1]
+                sw1 = getSwitch(ctx, logsw.switch1, 'Switch1')[1]
                 spec1 = ''
         else:
-            spec1 = zefix(1)
-        cond2 = item['Cond2']
-        if cond2 < len(cond):
-            prop = getSwitch(item['Switch2'])[3]
-            if prop:
-                sw2 = getSwitch(item['Switch2'])[0]
-                if cond2 == 2: # Lin is displayed without value
-                    spec2 = cond[cond2]
+            spec1 = zefix(ctx, 1, 'Cond1', logsw.cond1)
+        if logsw.cond2 < len(cond):
+            if getSwitch(ctx, logsw.switch2, 'Switch2')[3]: # is proportional
+                sw2 = getSwitch(ctx, logsw.switch2, 'Switch2')[0]
+                if logsw.cond2 == 2: # Lin is displayed without value
+                    spec2 = cond[logsw.cond2]
                 else:
-                    spec2 = cond[cond2] + ' ' + str(int(round(100.*(item['Value2']/4000.)))) + '%'
+                    spec2 = cond[logsw.cond2] + ' ' + str(int(round(100.*(logsw.value2/4000.)))) + '%'
             else:
-                sw2 = getSwitch(item['Switch2'])[1]
+                sw2 = getSwitch(ctx, logsw.switch2, 'Switch2')[1]
                 spec2 = ''
         else:
-            spec2 = zefix(1)
-        if item['Log-Type'] < len(logtyp):
-            zutxt = logtyp[item['Log-Type']]
+            spec2 = zefix(ctx, 1, 'Cond2', logsw.cond2)
+        if logsw.logType < len(logtyp):
+            zutxt = logtyp[logsw.logType]
         else:
-            zutxt = zefix(1)
-        if 'Up-Type' in item:
+            zutxt = zefix(ctx, 1, 'Log-Type', logsw.logType)
+        if logsw.upType is not None:
             uptyp = '/'
-            if item['Up-Type'] == 1:
+            if logsw.upType == 1:
                 uptyp = '|'
             dntyp = '\\'
-            if item['Dn-Type'] == 1:
+            if logsw.dnType == 1:
                 dntyp = '|'
-            delaya = setDecPoint(1, int(item['Up-Time']))
-            delayd = setDecPoint(1, int(item['Dn-Time']))
-            delayout = ';' + uptyp + '  ' + str(delaya) + 's   ' + dntyp + '  ' + str(delayd) + 's'
+            delaya = setDecPoint(1, logsw.upTime)
+            delayd = setDecPoint(1, logsw.dnTime)
+            delayout = uptyp + '  ' + str(delaya) + 's   ' + dntyp + '  ' + str(delayd) + 's'
         else:
-            delayout = ';' + r'/  0.0s   \  0.0s'
-        out = '\nLog' + str(ind + 1) + ';' + label + ';' + enabled + ';' + sw1 + ';' + spec1 + ';' + sw2 + ';' + spec2 + ';' + zutxt + delayout
-        writeLine(out, out)
-
+            delayout = r'/  0.0s   \  0.0s'
+        out = ['Log' + str(ind + 1), logsw.label, enabled, sw1, spec1, sw2, spec2, zutxt, delayout]
+        writeLine(ctx, out)
 
-def lua1(modelData):
+def lua1(ctx, modelData):
     # fill luaid for display of telemetry screens
-    if 'Lua' not in modelData:
-        return
-    anz = len(modelData['Lua'])
-    if anz == 0:
-        return
     ind = 1
-    for item in modelData['Lua']:  # is list of dicts
-        luaid[ind] = item['appID']
+    for app in ctx.model.luaApps:
+        ctx.luaid[ind] = app.appId
         ind += 1
 
-
-def lua2(modelData):
-    writeLine('\n\nLua:', '\n\nLua:')
-    if 'Lua' not in modelData:
-        writeLine('\nkeine Lua App', '\nno Lua App')
-        return
-    anz = len(modelData['Lua'])
-    if anz == 0:
-        writeLine('\nkeine Lua App', '\nno Lua App')
+def lua2(ctx, modelData):
+    writeTitle(ctx, ['Lua:'])
+    if len(ctx.model.luaApps) == 0:
+        writeLine(ctx, ctx.msg['noLuaApp'])
         return
     ind = 1
-    for item in modelData['Lua']:  # is list of dicts
-        luaid[ind] = item['appID']
-        out = '\n' + str(ind) + ';Lua App ID;' + str(luaid[ind])
+    for app in ctx.model.luaApps:
+        ctx.path = 'Lua[%d].data' % (ind - 1)
+        ctx.luaid[ind] = app.appId
+        out = [str(ind), 'Lua App ID', str(ctx.luaid[ind])]
         # assumption: luadata come in groups of 3 elements, first element is a string followed by 2 data elements
         # we display only those groups which contain a switch or a sensor and ignore all others
-        luadata = item['data']
         counter = 0
         out2 = ''
-        out3 = ''
-        for dat in luadata:
-            if len(out3) > 0:
-                out = out + ';' + out2 + ';' + out3
-            out3 = ''
+        out3 = []  # cells, empty as long as there is no text
+        for dat in app.data:
+            if any(out3):
+                out += [out2] + out3
+            out3 = []
             if counter % 3 == 0:
                 out2 = str(dat)
             else:
                 # display switch with direction only if genuine switch
-                sw = getSwitch(str(dat))[2]
+                sw = getSwitch(ctx, str(dat), '[%d]' % counter)[2]
                 if sw != '-':
-                    if len(out3) == 0:
-                        out3 = sw
+                    if not any(out3):
+                        out3 = [sw]
                     else:
-                        out3 = out3 + ';' + sw
+                        out3.append(sw)
                 # display sensor
                 if isinstance(dat, int):
-                    if dat in sensordict:
-                        if len(out3) == 0:
-                            out3 = sensordict[dat][0]
+                    if dat in ctx.sensordict:
+                        if not any(out3):
+                            out3 = [ctx.sensordict[dat][0]]
                         else:
-                            out3 = out3 + ';' + sensordict[dat][0]
+                            out3.append(ctx.sensordict[dat][0])
                 # display first parameter of each app if not yet done
-                if counter == 2 and len(out3) == 0:
-                    out3 = str(dat)
+                if counter == 2 and not any(out3):
+                    out3 = [str(dat)]
             counter += 1
-        if len(out3) > 0:
-            out = out + ';' + out2 + ';' + out3
-        writeLine(out, out)
+        if any(out3):
+            out += [out2] + out3
+        writeLine(ctx, out)
         ind += 1
 
-
-def luactrl(modelData):
-    writeLine('\n\nLua-Ctrl:', '\n\nLua-Ctrl:')
-    printDict(modelData['Lua-Ctrl'])
+def luactrl(ctx, modelData):
+    writeTitle(ctx, ['Lua-Ctrl:'])
+    printDict(ctx, modelData['Lua-Ctrl'])
 
 
-def mixesmain(modelData):
-    writeLine('\n\nFreie Mischer: Übersicht', '\n\nFree Mixes: Overview')
-    if len(modelData['Mixes-Main']['Data']) == 0:
-        writeLine('\nkeine Mischer', '\nno mixes')
+def mixesmain(ctx, modelData):
+    writeTitle(ctx, ctx.msg['mixesTitle'])
+    if len(ctx.model.mixes) == 0:
+        writeLine(ctx, ctx.msg['noMixes'])
         return
-    writeLine('\nVon;Zu;Flugphasen;Asymetricher Gas Mischer', '\nFrom;To;Flight Mode;Throttle Asymmetric Mix')
-    anz_mix = 0
-    for item in modelData['Mixes-Main']['Data']:  # is list of lists
-        anz_mix += 1
-        fromfu = functionlist[item[0]]
-        tofu = functionlist[item[1]]
-        wirkDe = 'Flugphasen abhängig'
-        wirkEn = 'Flight Mode dependent'
-        if item[2] == 1:
-            wirkDe = 'Global'
-            wirkEn = 'Global'
-        asymDe = 'nein'
-        asymEn = 'no'
-        if fromfu in ['Drossel', 'Throttle']:
-            asymDe = getYesNo(item[3])
-            asymEn = getYesNo(item[3])
-        outDe = '\n' + fromfu + ';' + tofu + ';' + wirkDe + ';' + asymDe
-        outEn = '\n' + fromfu + ';' + tofu + ';' + wirkEn + ';' + asymEn
-        writeLine(outDe, outEn)
-
-    writeLine('\n\nFreie Mischer: Flugphasen;;;;;Verzögerung', '\n\nFree Mixes: Flight Modes;;;;;Delay')
-    writeLine('\nMischer;Flugphase;Master-Wert;Schalter;Kurve;-Basis+       -Schalter+;Mix-Ausgabe +;Mix-Ausgabe -;nur vorwärts;Master Link;Slave Link;Trim;Slave Dual-Rate',
-              '\nMix;Flight Mode;Master Value;Switch;Curve;-Source+    -Switch+;Mix Output +;Mix Output -;Single direction;Master Link;Slave Link;Trim;Slave Dual-Rate')
-    if options['language'] == 'de':
-        links = ['nein', '+  ja', '-  ja']
-    else:
-        links = ['no', '+  yes', '-  yes']
-    for ii in range(anz_mix):
-        for jj in range(flightmolist[10] + 1):
-            item = modelData['Mixes-Main']['Data'][ii]
-            if options['language'] == 'de':
-                out = functionlist[item[0]] + ' zu ' + functionlist[item[1]]
-            else:
-                out = functionlist[item[0]] + ' to ' + functionlist[item[1]]
-            kk = jj * anz_mix + ii
-            dic = modelData['Mixes-Values'][kk]
-            flugphase = flightmolist[int(dic['Flight-Mode'])]
-            wert = dic['Intensity']
-            sw = getSwitch(dic['Switch'])[1]
-            curve = getCurve(dic['Curve-Type'])[0]
+    writeLine(ctx, ctx.msg['mixesColumns'])
+    for ii, mix in enumerate(ctx.model.mixes):
+        ctx.path = 'Mixes-Main.Data[%d]' % ii
+        fromfu = ctx.functionlist[mix.source]
+        tofu = ctx.functionlist[mix.target]
+        wirk = ctx.msg['fmDependent']
+        if mix.isGlobal:
+            wirk = 'Global'
+        asym = ctx.msg['no']
+        if fromfu in ['Drossel', 'Throttle']:  # function label as stored by the transmitter
+            asym = getYesNo(ctx, mix.asymmetric, '[3]')
+        writeLine(ctx, [fromfu, tofu, wirk, asym])
+
+    writeTitle(ctx, ctx.msg['mixesFmTitle'])
+    writeLine(ctx, ctx.msg['mixesFmColumns'])
+    links = [ctx.msg['no'], '+  ' + ctx.msg['yes'], '-  ' + ctx.msg['yes']]
+    anzMix = len(ctx.model.mixes)
+    for ii, mix in enumerate(ctx.model.mixes):
+        # same for all flight modes of the mix
+        out = ctx.msg['mixFromTo'].format(ctx.functionlist[mix.source], ctx.functionlist[mix.target])
+        servos = getServoCount(ctx, ctx.functionlist[mix.target])
+        if servos not in [2, 3, 4]:  # mix outputs are only shown for functions with several servos
+            servos = 0
+        for jj, mv in enumerate(mix.values):
+            ctx.path = 'Mixes-Values[%d]' % (jj * anzMix + ii)  # stored by flight mode, see decodeMixes()
+            flugphase = ctx.flightmolist[mv.flightMode]
+            sw = getSwitch(ctx, mv.switch, 'Switch')[1]
+            curve, points = getCurve(ctx, mv.curveType, 'Curve-Type')
             curvedat = ''
-            curvepoints = ''
-            if curve in ['konstant', 'Constant']:
-                curvedat = '=' + str(dic['Points-Out'][0])
-            delay1 = setDecPoint(1, int(dic['DelayN']))
-            delay2 = setDecPoint(1, int(dic['DelayP']))
-            delay3 = setDecPoint(1, int(dic['DelaySwN']))
-            delay4 = setDecPoint(1, int(dic['DelaySwP']))
-            delayout = str(delay1) + 's  ' + str(delay2) + 's   ' + str(delay3) + 's  ' + str(delay4) + 's'
-            mp1 = str(dic['S-Output'][0])
-            mp2 = str(dic['S-Output'][1])
-            mp3 = str(dic['S-Output'][2])
-            mp4 = str(dic['S-Output'][3])
-            if 'S-OutputN' in dic:
-                mn1 = str(dic['S-OutputN'][0])
-                mn2 = str(dic['S-OutputN'][1])
-                mn3 = str(dic['S-OutputN'][2])
-                mn4 = str(dic['S-OutputN'][3])
-            else:  # transmitter version <3
-                mn1 = 0
-                mn2 = 0
-                mn3 = 0
-                mn4 = 0
+            if mv.curveType == 1:  # constant
+                curvedat = '=' + str(mv.pointsOut[0])
+            delayout = (str(setDecPoint(1, mv.delayN)) + 's  ' + str(setDecPoint(1, mv.delayP)) + 's   '
+                        + str(setDecPoint(1, mv.delaySwN)) + 's  ' + str(setDecPoint(1, mv.delaySwP)) + 's')
             mixpo = '-'
             mixno = '-'
-            for txt in aferatg_txt:
-                if functionlist[item[1]] == txt:
-                    ll = aferatg_txt.index(txt) % 7
-                    if aferatgt[ll] == 1:
-                        mixpo = '-'
-                        mixno = '-'
-                    if aferatgt[ll] == 2:
-                        mixpo = mp1 + ' / ' + mp2
-                        mixno = mn1 + ' / ' + mn2
-                    if aferatgt[ll] == 3:
-                        mixpo = mp1 + ' / ' + mp2 + ' / ' + mp3
-                        mixno = mn1 + ' / ' + mn2 + ' / ' + mn3
-                    if aferatgt[ll] == 4:
-                        mixpo = mp1 + ' / ' + mp2 + ' / ' + mp3 + ' / ' + mp4
-                        mixno = mn1 + ' / ' + mn2 + ' / ' + mn3 + ' / ' + mn4
-            vorw = getYesNo(dic['Direction'])
-            if dic['M-Link'] < len(links):
-                ml = links[dic['M-Link']]
+            if servos > 0:
+                mixpo = ' / '.join([str(value) for value in mv.outputP[:servos]])
+                if mv.outputN is not None:
+                    mixno = ' / '.join([str(value) for value in mv.outputN[:servos]])
+                else:  # transmitter version <3
+                    mixno = ' / '.join(servos * ['0'])
+            vorw = getYesNo(ctx, mv.direction, 'Direction')
+            if mv.masterLink < len(links):
+                ml = links[mv.masterLink]
             else:
-                ml = zefix(1)
-            if dic['S-Link'] < len(links):
-                sl = links[dic['S-Link']]
+                ml = zefix(ctx, 1, 'M-Link', mv.masterLink)
+            if mv.slaveLink < len(links):
+                sl = links[mv.slaveLink]
             else:
-                sl = zefix(1)
-            trim = getYesNo(dic['M-Trim'])
-            sdr = getYesNo(dic['S-DR'])
-            if item[2] == 1:  # is global
+                sl = zefix(ctx, 1, 'S-Link', mv.slaveLink)
+            trim = getYesNo(ctx, mv.masterTrim, 'M-Trim')
+            sdr = getYesNo(ctx, mv.slaveDr, 'S-DR')
+            if mix.isGlobal:
                 flugphase = 'Global'
-            out = out + ';' + flugphase + ';' + str(wert) + ';' + sw + ';' + curve + curvedat + ';' + delayout + ';' + mixpo + ';' + mixno + ';' + vorw + ';' + ml + ';' + sl + ';' + trim + ';' + sdr
-            if getCurve(dic['Curve-Type'])[1]: # is a ...-point curve
-                for kk in range(len(dic['Points-In'])):
-                    if curvepoints != '':
-                        curvepoints = curvepoints + '  '
-                    curvepoints = curvepoints + str(dic['Points-In'][kk]) + '|' + str(dic['Points-Out'][kk])
-                out = out + '\n' + ';' + ';' + ';' + ';' + curvepoints
-            writeLine('\n' + out, '\n' + out)
-            if item[2] == 1:  # is global
-                break
-
-
-def mixesvalues(modelData):
-    writeLine('\n\nMixes-Values:', '\n\nMixes-Values:')
+            writeLine(ctx, [out, flugphase, str(mv.intensity), sw, curve + curvedat, delayout, mixpo, mixno, vorw, ml, sl, trim, sdr])
+            if points: # is a ...-point curve
+                curvepoints = '  '.join([str(pin) + '|' + str(pout) for pin, pout in zip(mv.pointsIn, mv.pointsOut)])
+                writeLine(ctx, ['', '', '', '', curvepoints])  # second line in column of curve
+
+
+# pivot table of the mixes: one row per mix, one column per flight mode with the master value of the mix,
+# a global mix has the same value in all flight modes, only written if selected by option --sections
+def mixespivot(ctx, modelData):
+    writeTitle(ctx, ctx.msg['mixesPivotTitle'])
+    if len(ctx.model.mixes) == 0:
+        writeLine(ctx, ctx.msg['noMixes'])
+        return
+    anzFm = len(ctx.model.flightModes)
+    writeLine(ctx, [ctx.msg['mixesPivotColumn']] + ctx.flightmolist[:anzFm])
+    for mix in ctx.model.mixes:
+        cells = anzFm * ['']
+        for mv in mix.values:
+            if mix.isGlobal:
+                cells = anzFm * [str(mv.intensity)]
+            elif mv.flightMode < anzFm:
+                cells[mv.flightMode] = str(mv.intensity)
+        writeLine(ctx, [ctx.msg['mixFromTo'].format(ctx.functionlist[mix.source], ctx.functionlist[mix.target])] + cells)
+
+
+def mixesvalues(ctx, modelData):
+    writeTitle(ctx, ['Mixes-Values:'])
     for item in modelData['Mixes-Values']:  # is list of dicts
-        printDict(item)
+        printDict(ctx, item)
 
 
-def sequence(modelData):
-    writeLine('\n\nSequenzer:', '\n\nSequencer:')
-    out_titleDe = '\nNummer;Titel;Schalter;Beeinflusst Kanal;Sequenzertyp;Zyklisch wiederholt;Sequenz immer beenden'
-    out_titleEn = '\nNumber;Label;Switch;Overwrite channel;Type of path;Cycling;Always finish sequence'
+def sequence(ctx, modelData):
+    writeTitle(ctx, ctx.msg['sequenceTitle'])
     empty = True
     done = False
-    for item in modelData['Sequence']:  # is list of dicts
+    for ii, item in enumerate(modelData['Sequence']):  # is list of dicts
+        ctx.path = 'Sequence[%d]' % ii
         leer = True
         key = item['ID']
-        sw = getSwitch(item['Switch'])[1]
+        sw = getSwitch(ctx, item['Switch'], 'Switch')[1]
         label = item['Label']
         servo = item['Override']
-        serout = servolist[servo]
+        serout = ctx.servolist[servo]
         if serout == 'nix':
             serout = '-'
         if sw != '-' or label != '' or servo > 0:
             leer = False
-        asymDe = 'symmetrisch'
-        asymEn = 'symmetrical'
-        if getYesNo(item['Asymm']) == 'ja' or getYesNo(item['Asymm']) == 'yes':
-            asymDe = 'asymmetrisch'
-            asymEn = 'asymmetrical'
-        cyc = getYesNo(item['Cycle'])
-        fin = getYesNo(item['Finish'])
-        outDe = '\nQ' + str(key) + ';' + label + ';' + sw + ';' + serout + ';' + asymDe + ';' + cyc + ';' + fin
-        outEn = '\nQ' + str(key) + ';' + label + ';' + sw + ';' + serout + ';' + asymEn + ';' + cyc + ';' + fin
+        asym = ctx.msg['symmetrical']
+        if getYesNo(ctx, item['Asymm'], 'Asymm') == ctx.msg['yes']:
+            asym = ctx.msg['asymmetrical']
+        cyc = getYesNo(ctx, item['Cycle'], 'Cycle')
+        fin = getYesNo(ctx, item['Finish'], 'Finish')
+        out = ['Q' + str(key), label, sw, serout, asym, cyc, fin]
         if not leer:
             if not done:
-                writeLine(out_titleDe, out_titleEn)
+                writeLine(ctx, ctx.msg['sequenceColumns'])
                 done = True
-            writeLine(outDe, outEn)
+            writeLine(ctx, out)
             empty = False
     if empty:
-        writeLine('\nkeine Sequenzer', '\nno sequencer')
+        writeLine(ctx, ctx.msg['noSequencer'])
 
 
-def servos1(modelData): # set servolist[]
+def servos1(ctx, modelData): # set servolist[]
     # servo labels as defined by jeti, codes start at 257 (Querruder1/Aileron1)
-    servoNamesDe = ['Querruder1', 'Querruder2', 'Querruder3', 'Querruder4', 'Klappe1',
-                    'Klappe2', 'Klappe3', 'Klappe4', 'Seite1', 'Seite2', 'Höhe1', 'Höhe2',
-                    '?zefix?', '?zefix?', 'Drossel1', 'Drossel2', 'Drossel3', 'Drossel4',
-                    'Fahrwerk1', 'Fahrwerk2', 'Fahrwerk3', 'Fahrwerk4', 'Störkl.1',
-                    'Störkl.2', 'Roll', 'Nick', 'Pitch', '?zefix?', 'Heck', '?zefix?',
-                    'Gyroempf.', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
-                    '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
-                    '?zefix?', 'Gyroempf.2', 'Gyroempf.3', 'Gimbal R', 'Gimbal P', 'Gimbal Y',
-                    'Mode', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
-                    '?zefix?', '?zefix?']
-    servoNamesEn = ['Aileron1', 'Aileron2', 'Aileron3', 'Aileron4', 'Flap1',
-                    'Flap2', 'Flap3', 'Flap4', 'Rudder1', 'Rudder2', 'Elevator1', 'Elevator2',
-                    '?zefix?', '?zefix?', 'Throttle1', 'Throttle2', 'Throttle3', 'Throttle4',
-                    'Gear1', 'Gear2', 'Gear3', 'Gear4', 'Airbrake1',
-                    'Airbrake2', 'Roll', 'Elevator', 'Pitch', '?zefix?', 'Yaw', '?zefix?',
-                    'Gyro sens.', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
-                    '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
-                    '?zefix?', 'Gyro sens.2', 'Gyro sens.3', 'Gimbal R', 'Gimbal P', 'Gimbal Y',
-                    'Mode', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?', '?zefix?',
-                    '?zefix?', '?zefix?']
-
-    if options['language'] == 'de':
-        servoNames = servoNamesDe
-    else:
-        servoNames = servoNamesEn
+    servoNames = ctx.msg['servoNames']
     # servo codes between 288 and 304 are used for user defined names and stored in servoOther
     servoOther = 16 * ['nix']  # non-standard names
     # code does not work correctly if above assumptions are wrong (might happen if 24 non standard servos used)
-    for item in modelData['Servos']['Data']:  # is list of dicts
-        servo = int(item['Servo-Code'])
-        if servo >= 288 and servo < 300:
-            servoOther[servo - 288] = servo
+    for servo in ctx.model.servos:
+        if servo.code >= 288 and servo.code < 300:
+            servoOther[servo.code - 288] = servo.code
     # assign non-standard functions to other servos,
     # first non-standard function at 14 corresponds to servo 288 (and servoOther[0]), 15 to 289 etc
     # last one assumed to be 29  (16 alltogether)
@@ -1573,130 +2069,123 @@ def servos1(modelData): # set servolist[]
     for ii in range(16):
         ind += 1
         if str(servoOther[ii]) != 'nix':
-            if functionlist[ind] != 'nix':
-                servoOther[ii] = functionlist[ind]
+            if ctx.functionlist[ind] != 'nix':
+                servoOther[ii] = ctx.functionlist[ind]
             else:
                 servoOther[ii] = 'nix'
     # now detail all servos
-    for item in modelData['Servos']['Data']:  # is list of dicts
-        ind = int(item['Index']) + 1
-        servo = int(item['Servo-Code'])
+    for ii, servo in enumerate(ctx.model.servos):
+        ind = servo.index + 1
+        code = servo.code
         # assign names
-        if servo > 256:
-            if servo <= 287:  # standard servos
-                name = servoNames[servo - 257]
-            elif servo >= 300:  # standard servos
-                if servo - 257 < len(servoNames):
-                    name = servoNames[servo - 257]
+        if code > 256:
+            if code <= 287:  # standard servos
+                name = servoNames[code - 257]
+            elif code >= 300:  # standard servos
+                if code - 257 < len(servoNames):
+                    name = servoNames[code - 257]
                 else:
                     name = '?zefix?'
             else:  # other servos
-                name = str(servoOther[servo - 288])
-            servolist[ind] = name
+                name = str(servoOther[code - 288])
+            ctx.servolist[ind] = name
             if name == '?zefix?':
-                zefix(1)
-
+                ctx.path = 'Servos.Data[%d]' % ii
+                zefix(ctx, 1, 'Servo-Code', code)
 
-def servos2(modelData):
-    writeLine('\n\nServozuordnung:', '\n\nServo Assignment:')
-    writeLine('\nSteckplatz;Servo;Mittenverstellung;Max. positiv;Max. negativ;Limit positiv;Limit negativ;Wegumkehr;Verzög. pos/neg;Servobalancer',
-              '\nSlot;Servo;Subtrim;Max positive;Max negative;Max positive limit;Max negative limit;Reverse;Delay positive/negative;Servo balancer')
+def servos2(ctx, modelData):
+    writeTitle(ctx, ctx.msg['servosTitle'])
+    writeLine(ctx, ctx.msg['servosColumns'])
     # now detail all servos
-    for item in modelData['Servos']['Data']:  # is list of dicts
-        ind = int(item['Index']) + 1
-        name = servolist[ind]
-        middle = item['Middle']
-        maxp = item['Max-Positive']
-        maxn = item['Max-Negative']
-        maxpl = item['Max-Positive-Limit']
-        maxnl = item['Max-Negative-Limit']
-        reverse = ';' + getYesNo(item['Servo-Reverse'])
-        delayp = setDecPoint(1, int(item['Delay-Positive']))
-        delayn = setDecPoint(1, int(item['Delay-Negative']))
-        delayout = ';' + str(delayp) + 's   ' + str(delayn) + 's'
-        if 'Curve' in item:
-            balancer = checkBala(item['Curve'])
+    for ii, servo in enumerate(ctx.model.servos):
+        ctx.path = 'Servos.Data[%d]' % ii
+        ind = servo.index + 1
+        name = ctx.servolist[ind]
+        reverse = getYesNo(ctx, servo.reverse, 'Servo-Reverse')
+        delayp = setDecPoint(1, servo.delayPositive)
+        delayn = setDecPoint(1, servo.delayNegative)
+        delayout = str(delayp) + 's   ' + str(delayn) + 's'
+        if servo.curve is not None:
+            balancer = checkBala(ctx, servo.curve)
         if name != 'nix':
-            out = '\n' + str(ind) + ';' + name + ';' + str(middle) + ';' + str(maxp) + ';' + str(maxn) + ';' + str(maxpl) + ';' + str(maxnl) + reverse + delayout + ';' + balancer
-            writeLine(out, out)
+            out = [str(ind), name, str(servo.middle), str(servo.maxPositive), str(servo.maxNegative),
+                   str(servo.maxPositiveLimit), str(servo.maxNegativeLimit), reverse, delayout, balancer]
+            writeLine(ctx, out)
 
-
-def snaprolls(modelData):
-    if aferatgt[8] == 'V-Leitwerksmischer' or aferatgt[8] == 'V-Tail Mix' or aferatgt[8] == 'Delta/Elevon Mischer' or aferatgt[8] == 'Delta/Elevon Mix':
+def snaprolls(ctx, modelData):
+    if ctx.aferatgt[8] in [ctx.msg['vtailMix'], ctx.msg['deltaMix']]:
         return  # no snap roll if v-tail or delta
-    writeLine('\n\nSnap Rolls:', '\n\nSnap Rolls:')
-    out_titleDe = '\nFlugphase;Mode;Master Switch;Schalter Höhe/rechts;Schalter Tiefe/rechts;Schalter Höhe/links;Schalter Tiefe/links'
-    out_titleEn = '\nFlight Mode;Mode;Master Switch;Sw up/right;Sw down/right;Sw up/left;Sw down/left'
+    writeTitle(ctx, ['Snap Rolls:'])
     empty = True
     done = False
-    for item in modelData['SnapRolls']:  # is list of dicts
+    for jj, item in enumerate(modelData['SnapRolls']):  # is list of dicts
+        ctx.path = 'SnapRolls[%d]' % jj
         leer = True
-        out = ''
         flm = int(item['Flight-Mode'])
-        flmt = flightmolist[flm]
+        flmt = ctx.flightmolist[flm]
         mode = item['Mode']
         if mode == 0:
             modet = 'Master'
-            sw = getSwitch(item['Master-Sw'])[1]
+            sw = getSwitch(ctx, item['Master-Sw'], 'Master-Sw')[1]
             if sw != '-':
                 leer = False
         else:
             modet = 'Single'
             sw = '-'
             leer = False
-        out = flmt + ';' + str(modet) + ';' + sw
+        out = [flmt, str(modet), sw]
         for ii in range(4):
-            swx = getSwitch(item['Switch'][ii])[1]
-            out = out + ';' + swx
+            swx = getSwitch(ctx, item['Switch'][ii], 'Switch[%d]' % ii)[1]
+            out.append(swx)
         if not leer:
             if not done:
-                writeLine(out_titleDe, out_titleEn)
+                writeLine(ctx, ctx.msg['snapRollsColumns'])
                 done = True
-            writeLine('\n' + out, '\n' + out)
+            writeLine(ctx, out)
             empty = False
     if empty:
-        writeLine('\nkeine Snap Rolls', '\nno snap rolls')
+        writeLine(ctx, ctx.msg['noSnapRolls'])
 
 
-def telctrl(modelData):
+def telctrl(ctx, modelData):
     if 'Tel-Ctrl' not in modelData:  # transmitter version <3
         return
-    writeLine('\n\nTelemetriegeber:', '\n\nTelemetry Controls:')
+    writeTitle(ctx, ctx.msg['telCtrlTitle'])
     # search the last telctrl which is not equal to default
     last = len(modelData['Tel-Ctrl']['Data'])
     empty = True
     for ii in range(last - 1, -1, -1):
         item = modelData['Tel-Ctrl']['Data'][ii]
+        ctx.path = 'Tel-Ctrl.Data[%d]' % ii
         enabled = item['Enabled']
         label = item['Label']
         key = item['Sensor-ID']
-        sw = getSwitch(item['Switch'])[0]
+        sw = getSwitch(ctx, item['Switch'], 'Switch')[0]
         prop = item['Prop']
         if enabled != 0 or label != '' or key != 0 or sw != '-' or prop != 0:
             empty = False
             last = ii
             break
     if empty:
-        writeLine('\nkeine Telemetriegeber', '\nno telemetry controls')
+        writeLine(ctx, ctx.msg['noTelemetryControls'])
         return
-    writeLine('\nNummer;Titel;Sensor;Messwert;Gebertyp;X < = > / Min;Schwellwert / Mitte;Toleranz / Max;Dauer / Glättung;Standardw %;Switch;Aktiv',
-              '\nNumber;Label;Sensor;Measurement;Type of control;X < = > / Min;Decision level / Center;Hysteresis / Max;Duration / Filtering;Default %;Switch;Enabled')
+    writeLine(ctx, ctx.msg['telCtrlColumns'])
     comp = ['<', '>', '=']
-    for item in modelData['Tel-Ctrl']['Data']:  # is list of dicts
+    for ii, item in enumerate(modelData['Tel-Ctrl']['Data']):  # is list of dicts
         ind = int(item['Index'])
         if ind > last:
             return
-        enabled = getYesNo(int(item['Enabled']))
+        ctx.path = 'Tel-Ctrl.Data[%d]' % ii
+        enabled = getYesNo(ctx, int(item['Enabled']), 'Enabled')
         label = item['Label']
         key = item['Sensor-ID']
-        if key in sensordict:
-            sensor = sensordict[key][0]
-            wert = sensordict[key][item['Param']]
-            out = 'MX' + str(ind + 1) + ';' + label + ';' + sensor + ';' + wert
+        found = getSensor(ctx, key, item['Param'])
+        if found is not None:
+            out = ['MX' + str(ind + 1), label] + found
         else:
-            out = 'MX' + str(ind + 1) + ';' + label + ';' + '-' + ';' + '-'
+            out = ['MX' + str(ind + 1), label, '-', '-']
         if item['Prop'] == 0:
-            out = out + ';Switch'
+            out.append('Switch')
             dat = item['Bin-Data']  # is list
             dec = item['Decimals']
             w1 = comp[dat[0]]
@@ -1704,10 +2193,10 @@ def telctrl(modelData):
             w3 = setDecPoint(dec, dat[3])
             w4 = setDecPoint(1, dat[1])
             stand = item['Default']
-            sw = getSwitch(item['Switch'])[1]
-            out = out + ';' + str(w1) + ';' + str(w2) + ';' + str(w3) + ';' + str(w4) + ';' + str(stand) + ';' + sw
+            sw = getSwitch(ctx, item['Switch'], 'Switch')[1]
+            out += [str(w1), str(w2), str(w3), str(w4), str(stand), sw]
         else:
-            out = out + ';Proportional'
+            out.append('Proportional')
             dat = item['Prop-Data']  # is list
             dec = item['Decimals']
             w1 = setDecPoint(dec, dat[0])
@@ -1715,312 +2204,246 @@ def telctrl(modelData):
             w3 = setDecPoint(dec, dat[2])
             w4 = setDecPoint(0, dat[3])
             stand = item['Default']
-            sw = getSwitch(item['Switch'])[1]
-            out = out + ';' + str(w1) + ';' + str(w2) + ';' + str(w3) + ';' + str(w4) + ';' + str(stand) + ';' + sw
-        out = out + ';' + enabled
-        writeLine('\n' + out, '\n' + out)
-
-
-def telemdetect(modelData):
-    writeLine('\n\nSensoren und Einstellungen:', '\n\nSensors & Variables:')
-    out_titleDe = '\nSensor;;Messwert;Wiederholen;Trigger;Wichtigkeit'
-    out_titleEn = '\nSensor;;Measurement;Repeat;Trigger;Priority'
-    writeLine(out_titleDe, out_titleEn)
-    prioDe = ['Niedrig', 'Mittel', 'Hoch']
-    prioEn = ['Low', 'Medium', 'High']
+            sw = getSwitch(ctx, item['Switch'], 'Switch')[1]
+            out += [str(w1), str(w2), str(w3), str(w4), str(stand), sw]
+        out.append(enabled)
+        writeLine(ctx, out)
+
+
+def telemdetect(ctx, modelData):
+    writeTitle(ctx, ctx.msg['sensorsTitle'])
+    writeLine(ctx, ctx.msg['sensorsColumns'])
+    prio = ctx.msg['priorities']
     # first extract U-Rx, A1 and A2 from Voice
     voc = ['U-Rx', 'A1', 'A2']
-    voctDe = ['Rx-Spannung', 'Antenne 1', 'Antenne 2']
-    voctEn = ['Voltage Rx', 'Antenna 1', 'Antenna 2']
+    voct = ctx.msg['receiverValues']
+    ctx.path = 'Voice'
     for ii in range(3):
-        rep = getYesNo(modelData['Voice'][voc[ii]][0])
-        trig = getYesNo(modelData['Voice'][voc[ii]][1])
-        priotDe = prioDe[modelData['Voice'][voc[ii]][2]]
-        priotEn = prioEn[modelData['Voice'][voc[ii]][2]]
-        outDe = '\nEmpfänger;' + ';' + voctDe[ii] + ';' + rep + ';' + trig + ';' + priotDe
-        outEn = '\nReceiver;' + ';' + voctEn[ii] + ';' + rep + ';' + trig + ';' + priotEn
-        writeLine(outDe, outEn)
-    # now the others
-    if len(modelData['Telem-Detect']['Data']) == 0:
-        return
+        rep = getYesNo(ctx, modelData['Voice'][voc[ii]][0], voc[ii] + '[0]')
+        trig = getYesNo(ctx, modelData['Voice'][voc[ii]][1], voc[ii] + '[1]')
+        priot = prio[modelData['Voice'][voc[ii]][2]]
+        writeLine(ctx, [ctx.msg['receiver'], '', voct[ii], rep, trig, priot])
+    # now the others, each sensor (device) is stored in sensordict with its parameters, see getSensor()
     key = ''
-    device = 256 * ['nix']
-    for item in modelData['Telem-Detect']['Data']:  # is list of dicts
-        ind = int(item['Param'])
-        if ind == 0:  # next device / sensor
-            if key != '':
-                sensordict[key] = device  # store parameter of previous device in dictionary
-            key = item['ID']
-            device = 256 * ['nix']
-        if ind > len(device):
-            zefix(1)
-            return
-        device[ind] = item['Label']
-        headerDe = ''
-        headerEn = ''
-        if ind == 0: # it is a sensor
-            outDe = '\n' + str(device[0]) + ';' + 'ID  ' + getDeviceID(key)
-            outEn = outDe
-        else: # it is a measurement
-            sensor = str(device[0])
-            if key == item['ID']:
-                sensor = str(device[0])
-            else:
-                sensor = 'ID  ' + str(item['ID'])
-                headerDe = 'Kopfsatz fehlt'
-                headerEn = 'header missing'
-            rep = getYesNo(item['Rep'])
-            trig = getYesNo(item['Trig'])
-            priotDe = prioDe[item['Prio']]
-            priotEn = prioEn[item['Prio']]
-            typ = int(item['DataType'])
-            if typ == 9: # values of latitude or longitude etc cannot be spoken
-                outDe = '\n' + sensor + ';' + str(ind) + ';' + str(device[ind]) + ';' + ';' + ';' + ';' + headerDe
-                outEn = '\n' + sensor + ';' + str(ind) + ';' + str(device[ind]) + ';' + ';' + ';' + ';' + headerEn
+    device = {}
+    orphans = []  # parameters without the header of their device, [device ID, parameter]
+    pos = 0  # position in Telem-Detect, for zefix()
+    for sensor in ctx.model.sensors:
+        if sensor.label is not None:  # next device / sensor
+            pos += 1
+            key = sensor.id
+            device = {0: sensor.label}
+            ctx.sensordict[key] = device
+            writeLine(ctx, [str(sensor.label), 'ID  ' + getDeviceID(key)])
+        for param in sensor.params:  # measurements
+            ctx.path = 'Telem-Detect.Data[%d]' % pos
+            pos += 1
+            ind = param.index
+            if ind > 255:  # more parameters than a device can have
+                zefix(ctx, 1, 'Param', ind)
+                return
+            header = ''
+            if key == param.sensorId:
+                device[ind] = param.label
+                name = str(device[0])
+            else:  # not stored in the device above, it belongs to another one
+                orphans.append([param.sensorId, param])
+                name = 'ID  ' + str(param.sensorId)
+                header = ctx.msg['headerMissing']
+            rep = getYesNo(ctx, param.repeat, 'Rep')
+            trig = getYesNo(ctx, param.trigger, 'Trig')
+            priot = prio[param.prio]
+            if param.dataType == 9: # values of latitude or longitude etc cannot be spoken
+                out = [name, str(ind), str(param.label), '', '', '', header]
             else:
-                outDe = '\n' + sensor + ';' + str(ind) + ';' + str(device[ind]) + ';' + rep + ';' + trig + ';' + priotDe + ';' + headerDe
-                outEn = '\n' + sensor + ';' + str(ind) + ';' + str(device[ind]) + ';' + rep + ';' + trig + ';' + priotEn + ';' + headerEn
-        writeLine(outDe, outEn)
-    sensordict[key] = device  # store parameter of last device
+                out = [name, str(ind), str(param.label), rep, trig, priot, header]
+            writeLine(ctx, out)
+    # a parameter without header is added to its device if the device has a header elsewhere in the list
+    for key, param in orphans:
+        if key in ctx.sensordict:
+            ctx.sensordict[key].setdefault(param.index, param.label)
 
 
-def telemvoice(modelData):
-    writeLine('\n\nEinzelsprachansagen:', '\n\nSingle voice announcements')
+def telemvoice(ctx, modelData):
+    writeTitle(ctx, ctx.msg['telemVoiceTitle'])
     if 'Telem-Voice' not in modelData:  # introduced in Jeti V4
-        writeLine('\nkeine Sprachansagen', '\nno voice announcements')
+        writeLine(ctx, ctx.msg['noVoiceAnnouncements'])
         return
     if len(modelData['Telem-Voice']['Data']) == 0:
-        writeLine('\nkeine Sprachansagen', '\nno voice announcements')
+        writeLine(ctx, ctx.msg['noVoiceAnnouncements'])
         return
-    writeLine('\nSchalter;Sensor;Messwert', '\nSwitch;Sensor;Measurement')
-    systemDe = ['?zefix?', '?zefix?', 'Antenne 1', 'Antenne 2', 'RX-Spannung', '?zefix?', '?zefix?', '?zefix?',
-                '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Q (Rx1)']
-    systemEn = ['?zefix?', '?zefix?', 'Antenna 1', 'Antenna 2', 'Voltage RX', '?zefix?', '?zefix?', '?zefix?',
-                '?zefix?', '?zefix?', '?zefix?', '?zefix?', 'Q (Rx1)']
+    writeLine(ctx, ctx.msg['telemVoiceColumns'])
+    system = ctx.msg['telemVoiceSystem']
 
-    for item in modelData['Telem-Voice']['Data']:  # is list of dicts
+    for ii, item in enumerate(modelData['Telem-Voice']['Data']):  # is list of dicts
+        ctx.path = 'Telem-Voice.Data[%d]' % ii
         key = int(item['ID'])
         parm = int(item['Param'])
-        sw = getSwitch(item['Sw'])[1]
+        sw = getSwitch(ctx, item['Sw'], 'Sw')[1]
         if abs(key) < 30: # chosen to cover all timers
             if key == 0:    # system as sensor
-                if parm < len(systemDe):
+                if parm < len(system):
                     if parm == 0:
-                        outDe = sw + ';' + '-' + ';' + '-'
-                        outEn = sw + ';' + '-' + ';' + '-'
+                        out = [sw, '-', '-']
                     else:
-                        outDe = sw + ';' + 'System' + ';' + systemDe[parm]
-                        outEn = sw + ';' + 'System' + ';' + systemEn[parm]
-                        if systemDe[parm] == '?zefix?':
-                            zefix(1)
+                        out = [sw, 'System', system[parm]]
+                        if system[parm] == '?zefix?':
+                            zefix(ctx, 1, 'Param', parm)
                 else:
-                    outDe = sw + ';' + zefix(1)
-                    outEn = sw + ';' + zefix(1)
+                    out = [sw, zefix(ctx, 1, 'Param', parm)]
             else:   # timer
-                if key < len(stopwatch):
-                    outDe = sw + ';' + 'Timer' + ';' + stopwatch[key]
-                    outEn = sw + ';' + 'Timer' + ';' + stopwatch[key]
+                if key < len(ctx.stopwatch):
+                    out = [sw, 'Timer', ctx.stopwatch[key]]
                 else:
-                    outDe = sw + ';' + 'Timer' + ';' + 'existiert nicht'
-                    outDe = sw + ';' + 'Timer' + ';' + 'does not exist'
+                    out = [sw, 'Timer', ctx.msg['doesNotExist']]
         else:
-            if key in sensordict:
-                outDe = sw + ';' + sensordict[key][0] + ';' + sensordict[key][parm]
-                outEn = sw + ';' + sensordict[key][0] + ';' + sensordict[key][parm]
+            found = getSensor(ctx, key, parm)
+            if found is not None:
+                out = [sw] + found
             else:
-                outDe = sw + ';' + 'Sensor ' + getDeviceID(key) + ' fehlt'
-                outEn = sw + ';' + 'Sensor ' + getDeviceID(key) + ' missing'
-        writeLine('\n' + outDe, '\n' + outEn)
+                out = [sw, 'Sensor ' + ctx.msg['missing'].format(getDeviceID(key))]
+        writeLine(ctx, out)
 
 
-def timers1(modelData): # fill stopwatch[]
-    if len(modelData['Timers']['Data']) == 0:
-        return
+def timers1(ctx, modelData): # fill stopwatch[]
     jj = 0
-    for item in modelData['Timers']['Data']:  # is list of dicts
-        key = int(item['ID'])
-        stopwatch[key] = item['Label']
+    for timer in ctx.model.timers:
+        ctx.stopwatch[timer.id] = timer.label
         jj += 1
-        stopwatchid[jj] = key
+        ctx.stopwatchid[jj] = timer.id
 
-
-def timers2(modelData):
-    writeLine('\n\nStoppuhren:', '\n\nTimers:')
+def timers2(ctx, modelData):
+    writeTitle(ctx, ctx.msg['timersTitle'])
+    ctx.path = 'Common'
     # first evaluate common data
     if 'Model-Time2' in modelData['Common']: # transmitter version >=3
         modeltime = getTime(modelData['Common']['Model-Time2']).strip('+')
-        writeLine('\nFlugzeit;' + modeltime, '\nModel Time;' + modeltime)
-        if options['language'] == 'de':
-            reset = ['Kein', 'kurz', 'Alle']
-        else:
-            reset = ['None', 'Short reset', 'All']
+        writeLine(ctx, [ctx.msg['modelTime'], modeltime])
+        reset = ctx.msg['timersResetModes']
         mode = modelData['Common']['Time-Reset']
         if mode < len(reset):
             resmod = reset[mode]
         else:
-            resmod = zefix(1)
-        writeLine('\nZurücksetzen-Timer;(beim Start):;' + resmod, '\nTimers reset;(at power up):;' + resmod)
+            resmod = zefix(ctx, 1, 'Time-Reset', mode)
+        writeLine(ctx, ctx.msg['timersReset'] + [resmod])
 
-    if len(modelData['Timers']['Data']) == 0:
-        writeLine('\nkeine Stoppuhren', '\nno timers')
+    if len(ctx.model.timers) == 0:
+        writeLine(ctx, ctx.msg['noTimers'])
         return
-    if options['language'] == 'de':
-        timtyp = ['Standard', 'durchlaufend', 'Rundenzeit']
-        reptyp = ['Kein', 'Beep 1', 'Beep 2', 'Sprache', 'Sprache (Pos.)']
-    else:
-        timtyp = ['Standard', 'Free-Running', 'Laps']
-        reptyp = ['None', 'Beep 1', 'Beep 2', 'Voice', 'Voice (Up)']
-    writeLine('\nStoppuhr Nummer;Name;Startwert;Zielwert;Timer-Typ;Signalisierung;Schalter;Resetschalter',
-              '\nTimer Number;Label;Initial value;Target value;Timer type;Report type;Switch;Reset switch')
+    timtyp = ctx.msg['timerTypes']
+    reptyp = ctx.msg['timerReportTypes']
+    writeLine(ctx, ctx.msg['timersColumns'])
     jj = 0
-    for item in modelData['Timers']['Data']:  # is list of dicts
+    for timer in ctx.model.timers:
+        ctx.path = 'Timers.Data[%d]' % jj
         jj += 1
-        initial = int(item['Init-Time'])
-        initialo = getTime(initial / 1000)
-        target = int(item['Dest-Time'])
-        targeto = getTime(target / 1000)
-        typ = item['Tim-Type']
-        if typ < len(timtyp):
-            typo = timtyp[typ]
+        initialo = getTime(timer.initTime / 1000)
+        targeto = getTime(timer.destTime / 1000)
+        if timer.type < len(timtyp):
+            typo = timtyp[timer.type]
         else:
-            typo = zefix(1)
-        report = item['Report-Type']
-        if report < len(reptyp):
-            reporto = reptyp[report]
+            typo = zefix(ctx, 1, 'Tim-Type', timer.type)
+        if timer.reportType < len(reptyp):
+            reporto = reptyp[timer.reportType]
         else:
-            reporto = zefix(1)
-        sw = getSwitch(item['Switch'])[1]
-        if 'Sw-Rst' in item:
-            reset = getSwitch(item['Sw-Rst'])[1]
-        else: # transmitter version <3
-            reset = '-'
-        out = '\n' + str(jj) + ';' + item['Label'] + ';' + initialo + ';' + targeto + ';' + typo + ';' + reporto + ';' + sw + ';' + reset
-        writeLine(out, out)
-
-
-def typespecific(modelData):
-    writeLine('\n\nGrundeinstellungen:', '\n\nBasic Properties')
+            reporto = zefix(ctx, 1, 'Report-Type', timer.reportType)
+        sw = getSwitch(ctx, timer.switch, 'Switch')[1]
+        reset = getSwitch(ctx, timer.reset, 'Sw-Rst')[1]  # '-' also if transmitter version <3
+        out = [str(jj), timer.label, initialo, targeto, typo, reporto, sw, reset]
+        writeLine(ctx, out)
+
+def typespecific(ctx, modelData):
+    writeTitle(ctx, ctx.msg['typeTitle'])
+    ctx.path = 'Type-Specific'
     if 'Model-Type' in modelData['Type-Specific']:
         if modelData['Type-Specific']['Model-Type'] != 'Aero':
-            printDict(modelData['Type-Specific'])
+            printDict(ctx, modelData['Type-Specific'])
             return
     else:
-        zefix(1)
-        writeLine('\n' + '?zefix?', '\n' + '?zefix?')
+        zefix(ctx, 1, 'Model-Type')  # missing
+        writeLine(ctx, ['?zefix?'])
 
-    if options['language'] == 'de':
-        wing = ['1 Querruder', '2 Querruder', '2 QR | 1 WK', '2 QR | 2 WK', '4 QR | 2 WK', '2 QR | 4 WK', '4 QR | 4 WK']
-    else:
-        wing = ['0 Flaps | 1 Ail', '0 Flaps | 2 Ail', '1 Flap | 2 Ail', '2 Flaps | 2 Ail', '4 Flaps | 2 Ail', '2 Flaps | 4 Ail', '4 Flaps | 4 Ail']
+    wing = ctx.msg['wingTypes']
     wing_qr = [1, 2, 2, 2, 4, 2, 4]
     wing_wk = [0, 0, 1, 2, 2, 4, 4]
-    if options['language'] == 'de':
-        tail = ['Kreuz- od T-LW: 1HR 1SR', 'V-LW 2 Servos', 'Ailvator 2HR 1SR', '2HR / 2SR', 'kein LW (Delta/Elevon)', 'Kein']
-    else:
-        tail = ['Normal   1H1V', 'V-Tail   2H', 'Ailvator 2H1V', 'Normal   2H2V', 'None - Elevon/Delta', 'None']
+    tail = ctx.msg['tailTypes']
     tail_hr = [1, 2, 2, 2, 2, 0]
     tail_sr = [1, 2, 1, 2, 1, 0]
     for item in modelData['Type-Specific']:
-        outDe = ''
-        outEn = ''
+        out = []
         if item in ['Type', 'Model-Type']:
             continue
         if item == 'Wing-Type':
             ind = int(modelData['Type-Specific'][item])
             if ind < len(wing):
-                outDe = 'Tragfläche' + ';' + wing[ind]
-                outEn = 'Wing type' + ';' + wing[ind]
-                aferatgt[0] = wing_qr[ind]
-                aferatgt[1] = wing_wk[ind]
+                out = [ctx.msg['wingType'], wing[ind]]
+                ctx.aferatgt[0] = wing_qr[ind]
+                ctx.aferatgt[1] = wing_wk[ind]
             else:
-                outDe = 'Tragfläche' + ';' + '?zefix?'
-                outEn = 'Wing type' + ';' + '?zefix?'
-                zefix(1)
-                aferatgt[0] = 0
-                aferatgt[1] = 0
+                out = [ctx.msg['wingType'], zefix(ctx, 1, item, ind)]
+                ctx.aferatgt[0] = 0
+                ctx.aferatgt[1] = 0
         if item == 'Tail-Type':
             ind = int(modelData['Type-Specific'][item])
             if ind < len(tail):
-                outDe = 'Leitwerk' + ';' + tail[ind]
-                outEn = 'Tail type' + ';' + tail[ind]
-                aferatgt[2] = tail_hr[ind]
-                aferatgt[3] = tail_sr[ind]
-            else:
-                outDe = 'Leitwerk' + ';' + '?zefix?'
-                outEn = 'Tail type' + ';' + '?zefix?'
-                zefix(1)
-                aferatgt[2] = 0
-                aferatgt[3] = 0
-            if options['language'] == 'de':
-                if ind == 1:
-                    aferatgt[8] = 'V-Leitwerksmischer'
-                if ind == 2:
-                    aferatgt[8] = 'Ailevator'
-                    if aferatgt[0] >= 2:
-                        aferatgt[7] = 1
-                if ind == 4:
-                    aferatgt[8] = 'Delta/Elevon Mischer'
-                    aferatgt[7] = 1
+                out = [ctx.msg['tailType'], tail[ind]]
+                ctx.aferatgt[2] = tail_hr[ind]
+                ctx.aferatgt[3] = tail_sr[ind]
             else:
-                if ind == 1:
-                    aferatgt[8] = 'V-Tail Mix'
-                if ind == 2:
-                    aferatgt[8] = 'Ailevator'
-                    if aferatgt[0] >= 2:
-                        aferatgt[7] = 1
-                if ind == 4:
-                    aferatgt[8] = 'Delta/Elevon Mix'
-                    aferatgt[7] = 1
+                out = [ctx.msg['tailType'], zefix(ctx, 1, item, ind)]
+                ctx.aferatgt[2] = 0
+                ctx.aferatgt[3] = 0
+            if ind == 1:
+                ctx.aferatgt[8] = ctx.msg['vtailMix']
+            if ind == 2:
+                ctx.aferatgt[8] = 'Ailevator'
+                if ctx.aferatgt[0] >= 2:
+                    ctx.aferatgt[7] = 1
+            if ind == 4:
+                ctx.aferatgt[8] = ctx.msg['deltaMix']
+                ctx.aferatgt[7] = 1
         if item == 'Motor-Count':
             anz = int(modelData['Type-Specific'][item])
-            outDe = 'Antrieb(e)' + ';' + str(anz)
-            outEn = 'Engine count' + ';' + str(anz)
-            aferatgt[5] = anz
+            out = [ctx.msg['engineCount'], str(anz)]
+            ctx.aferatgt[5] = anz
         if item == 'Gear-Servos':
             anz = int(modelData['Type-Specific'][item])
-            outDe = 'Fahrwerk-Servos' + ';' + str(anz)
-            outEn = 'Gear servos' + ';' + str(anz)
-            aferatgt[6] = anz
+            out = [ctx.msg['gearServos'], str(anz)]
+            ctx.aferatgt[6] = anz
         if item == 'Airbrake-Servos':
             anz = int(modelData['Type-Specific'][item])
-            outDe = 'Störklappenservos' + ';' + str(anz)
-            outEn = 'Airbrake servos' + ';' + str(anz)
-            aferatgt[4] = anz
+            out = [ctx.msg['airbrakeServos'], str(anz)]
+            ctx.aferatgt[4] = anz
         for ii in range(3):
-            wertDe = 'nein'
-            wertEn = 'no'
+            wert = ctx.msg['no']
             txt = 'Gyro' + str(ii + 1)
             if item == txt:
                 if int(modelData['Type-Specific'][item]) == 1:
-                    wertDe = 'ja'
-                    wertEn = 'yes'
-                outDe = txt + ';' + wertDe
-                outEn = txt + ';' + wertEn
-        if len(outDe) > 0 or len(outEn) > 0:
-            writeLine('\n' + outDe, '\n' + outEn)
+                    wert = ctx.msg['yes']
+                out = [txt, wert]
+        if len(out) > 0:
+            writeLine(ctx, out)
 
 
-def usermenu(modelData):
-    writeLine('\n\nBenutzermenü:', '\n\nUser-Menu:')
-    printDict(modelData['User-Menu'])
+def usermenu(ctx, modelData):
+    writeTitle(ctx, ctx.msg['userMenuTitle'])
+    printDict(ctx, modelData['User-Menu'])
 
 
-def vario(modelData):
-    writeLine('\n\nVario:', '\n\nVario:')
+def vario(ctx, modelData):
+    writeTitle(ctx, ['Vario:'])
     if 'Setting' not in modelData['Vario']:
-        writeLine('\nDaten in veraltetem Format;Sender updaten', '\nDeprecated data format;update transmitter')
+        writeLine(ctx, ctx.msg['varioDeprecated'])
         return
+    ctx.path = 'Vario'
     empty = True
-    if options['language'] == 'de':
-        modes = ['Aus', 'Alarm JB Profi', 'Wert EX', 'Lua']
-    else:
-        modes = ['Off', 'JB Profi Alarm', 'EX Value', 'Lua']
+    modes = ctx.msg['varioModes']
     mode = modelData['Vario']['Mode']
     if mode < len(modes):
         modet = modes[mode]
     else:
-        modet = zefix(1)
-    sw = getSwitch(modelData['Vario']['Switch'])[1]
+        modet = zefix(ctx, 1, 'Mode', mode)
+    sw = getSwitch(ctx, modelData['Vario']['Switch'], 'Switch')[1]
     for ii in range(len(modelData['Vario']['Setting'])):
         key = modelData['Vario']['Setting'][ii]['Sensor-ID']
         param = int(modelData['Vario']['Setting'][ii]['Sensor-Par'])
@@ -2030,113 +2453,153 @@ def vario(modelData):
         minw = str(setDecPoint(dec, int(modelData['Vario']['Setting'][ii]['Min'])))
         center = str(setDecPoint(dec, int(modelData['Vario']['Setting'][ii]['Center'])))
         maxw = str(setDecPoint(dec, int(modelData['Vario']['Setting'][ii]['Max'])))
-        enabled = getYesNo(modelData['Vario']['Setting'][ii]['En'])
-        if key in sensordict:
-            sensor = sensordict[key][0]
-            parm = sensordict[key][param]
+        enabled = getYesNo(ctx, modelData['Vario']['Setting'][ii]['En'], 'Setting[%d].En' % ii)
+        found = getSensor(ctx, key, param)
+        if found is not None:
+            sensor, parm = found
             if empty:
-                writeLine('\nMode;' + modet, '\nMode;' + modet)
-                writeLine('\nSchalter;' + sw, '\nSwitch;' + sw)
-                writeLine('\nSensor;Messwert;Totzone -;Totzone +;Weite -;Center;Weite +;Aktiv',
-                          '\nSensor;Measurement;Dead Zone -;Dead Zone +;Range -;Center;Range +;Enabled')
+                writeLine(ctx, ['Mode', modet])
+                writeLine(ctx, [ctx.msg['switch'], sw])
+                writeLine(ctx, ctx.msg['varioColumns'])
                 empty = False
-            out = '\n' + sensor + ';' + parm + ';' + deadzneg + ';' + deadzpos + ';' + minw + ';' + center + ';' + maxw + ';' + enabled
-            writeLine(out, out)
+            out = [sensor, parm, deadzneg, deadzpos, minw, center, maxw, enabled]
+            writeLine(ctx, out)
     if empty:
-        writeLine('\nkein Vario', '\nno vario')
+        writeLine(ctx, ctx.msg['noVario'])
 
 
-def voice(modelData):
-    writeLine('\n\nSprachausgabe:', '\n\nVoice Output:')
-    outDe = ''
-    outEn = ''
-    sw = getSwitch(modelData['Voice']['TimerSw'])[1]
+def voice(ctx, modelData):
+    writeTitle(ctx, ctx.msg['voiceTitle'])
+    ctx.path = 'Voice'
+    out = []
+    sw = getSwitch(ctx, modelData['Voice']['TimerSw'], 'TimerSw')[1]
     if sw != '-':
         timer = modelData['Voice']['Timer-ID']
-        outDe = '\nTimer;' + stopwatch[timer] + ';Switch;' + sw
-        writeLine(outDe, outDe)
-    writeLine('\nTelemetrie', '\nTelemetry')
-    sw = getSwitch(modelData['Voice']['RepeatSw'])[1]
+        out = ['Timer', ctx.stopwatch[timer], 'Switch', sw]
+        writeLine(ctx, out)
+    writeLine(ctx, ctx.msg['telemetry'])
+    sw = getSwitch(ctx, modelData['Voice']['RepeatSw'], 'RepeatSw')[1]
     if sw != '-':
         time = modelData['Voice']['Timeout']
-        outDe = '\nWiederh. nach;' + str(time) + 'sec;Switch;' + sw
-        outEn = '\nRepeat every;' + str(time) + 'sec;Switch;' + sw
-        writeLine(outDe, outEn)
-    sw = getSwitch(modelData['Voice']['TrigSw'])[1]
+        out = [ctx.msg['repeatEvery'], str(time) + 'sec', 'Switch', sw]
+        writeLine(ctx, out)
+    sw = getSwitch(ctx, modelData['Voice']['TrigSw'], 'TrigSw')[1]
     if sw != '-':
-        outDe = '\nTrigger Schalter;' + sw
-        outEn = '\nTrigger Switch;' + sw
-        writeLine(outDe, outEn)
-    if outDe == '':
-        writeLine('\nkeine Sprachausgabe', '\nno voice output')
+        out = [ctx.msg['triggerSwitch'], sw]
+        writeLine(ctx, out)
+    if out == []:
+        writeLine(ctx, ctx.msg['noVoiceOutput'])
 
 
-def voicerec(modelData):
-    writeLine('\n\nVoiceRec:', '\n\nVoiceRec:')
-    printDict(modelData['VoiceRec'])
+def voicerec(ctx, modelData):
+    writeTitle(ctx, ['VoiceRec:'])
+    printDict(ctx, modelData['VoiceRec'])
 
 
 # --------------------------------    function to extract all dicts from model file    --------------------------------------
-def extractDict(modelData):
-    # these globals must be declared here again to avoid variable shadowing
-    global aferatgt  # number of servos: aileron flaps elevator ruder airbrake throttle gear butterfly(1=needs butterfly) delta/v-lw
-    global aferatg_txt
-    global functionlist
-    global flightmolist
-    global flightmoid
-    global flightmoseq
-    global luaid
-    global sensordict
-    global servolist
-    global stopwatch
-    global stopwatchid
-    global hasAccel
-
-    # set initial values for all global arrays
-    aferatgt = [0, 0, 0, 0, 0, 0, 0, 0, '']
-    functionlist = 51 * ['nix']
-    flightmolist = 11 * ['nix']
-    flightmoid = 11 * ['nix']
-    flightmoseq = 11 * ['nix']
-    luaid = 31 * [0]
-    sensordict = {}
-    servolist = 25 * ['nix']
-    stopwatch = 11 * ['nix']
-    stopwatchid = 11 * ['nix']
-    hasAccel = False
-    zefix(0) # set zefix marker to 0
-
-    # evaluate all dicts of top level
-    globalstr(modelData)
-    typespecific(modelData)         # sets aferatgt[]
-    functions1(modelData)           # sets functionlist[]
-    servos1(modelData)              # sets servolist[]
-    flightmodes1(modelData)         # sets flightmolist[] flightmoid[] flightmoseq[]  and reads aferatgt[]
-    timers1(modelData)              # sets stopwatch[] stopwatchid[]
-    common(modelData)
-    controls(modelData)
-    ctrlsound(modelData)
-    functions2(modelData)           # modifies functionlist[]
-    servos2(modelData)              # reads functionlist[]
-    flightmodes2(modelData)
-    functionspecs(modelData)        # reads functionlist[] flightmolist[] aferatgt[]
-    flightmodes3(modelData)         # reads aferatgt[]
-    snaprolls(modelData)            # reads flightmolist[] aferatgt[]
-    mixesmain(modelData)            # reads functionlist[] flightmolist[] aferatgt[]
-    sequence(modelData)             # reads servolist[]
-    timers2(modelData)
-    logswitch(modelData)
-    eventsounds(modelData)
-    voice(modelData)                # reads stopwatch[]
-    telemdetect(modelData)          # sets sensordict
-    telemvoice(modelData)           # sets sensordict
-    telctrl(modelData)              # sets sensordict
-    lua1(modelData)                 # sets luaid[] for telemetry
-    displayedtelemetry(modelData)   # reads luaid[] sensordict stopwatch[]
-    vario(modelData)                # reads sensordict
-    alarms(modelData)               # reads sensordict
-    accel(modelData)                # reads hasAccel
-    lua2(modelData)                 # sets luaid[] and reads sensordict
+# call a section function, its time is stored in ctx.timings if profiling is enabled
+def runSection(ctx, section, modelData, *args):
+    ctx.section = section.__name__
+    ctx.path = None
+    if ctx.timings is None:
+        section(ctx, modelData, *args)
+        return
+    start = time.perf_counter()
+    section(ctx, modelData, *args)
+    ctx.timings[section.__name__] = time.perf_counter() - start
+
+
+# lists of ModelContext read by getSwitch(), a section calling it reads all of them
+switchLists = ['functionlist', 'servolist', 'flightmolist', 'flightmoid', 'flightmoseq', 'stopwatch', 'stopwatchid']
+
+# dependency graph of the sections, in the order they are run by extractDict():
+# [section function, fields of ctx.model it reads, state of ctx it reads, state of ctx it sets or modifies]
+# a section needs all sections before it which set or modify anything it reads
+sectionGraph = [
+    [globalstr, [], switchLists, ['hasAccel']],
+    [typespecific, [], [], ['aferatgt']],
+    [functions1, ['functions'], [], ['functionlist']],
+    [servos1, ['servos'], ['functionlist'], ['servolist']],
+    [flightmodes1, ['flightModes'], [], ['flightmolist', 'flightmoid', 'flightmoseq']],
+    [timers1, ['timers'], [], ['stopwatch', 'stopwatchid']],
+    [common, [], switchLists, []],
+    [controls, [], [], []],
+    [ctrlsound, [], switchLists, []],
+    [functions2, ['functions'], switchLists + ['aferatgt'], ['functionlist']],
+    [servos2, ['servos'], ['servolist'], []],
+    [flightmodes2, ['flightModes', 'fmAnnounce'], switchLists, []],
+    [functionspecs, [], switchLists + ['aferatgt'], []],
+    [flightmodes3, [], switchLists + ['aferatgt'], []],
+    [snaprolls, [], switchLists + ['aferatgt'], []],
+    [mixesmain, ['mixes'], switchLists + ['aferatgt'], []],
+    [mixespivot, ['mixes', 'flightModes'], ['functionlist', 'flightmolist'], []],
+    [sequence, [], switchLists, []],
+    [timers2, ['timers'], switchLists, []],
+    [logswitch, ['logSwitches'], switchLists, []],
+    [eventsounds, [], switchLists, []],
+    [voice, [], switchLists, []],
+    [telemdetect, ['sensors'], [], ['sensordict']],
+    [telemvoice, [], switchLists + ['sensordict'], []],
+    [telctrl, [], switchLists + ['sensordict'], []],
+    [lua1, ['luaApps'], [], ['luaid']],
+    [displayedtelemetry, [], ['flightmolist', 'luaid', 'sensordict', 'stopwatch'], []],
+    [vario, [], switchLists + ['sensordict'], []],
+    [alarms, ['alarms'], switchLists + ['sensordict'], []],
+    [accel, [], ['hasAccel'], []],
+    [lua2, ['luaApps'], switchLists + ['luaid', 'sensordict'], ['luaid']],
+]
+# names of the sections which can be selected by option --sections, extractPat() lists the assigned controls
+sectionNames = [node[0].__name__ for node in sectionGraph] + ['extractPat']
+# sections which are only evaluated if selected by --sections
+extraSections = ['mixespivot']
+
+
+# the nodes of sectionGraph to run for the selected section names (None: all sections)
+# returns a list of [node, True if its rows are part of the output]
+def getSectionPlan(selected):
+    if selected is None:
+        return [[node, True] for node in sectionGraph if node[0].__name__ not in extraSections]
+    plan = []
+    needed = set()  # state of ctx read by a section already planned
+    for node in reversed(sectionGraph):
+        section, parts, reads, sets = node
+        wanted = section.__name__ in selected
+        if wanted or needed.intersection(sets):
+            plan.append([node, wanted])
+            needed.update(reads)
+    plan.reverse()
+    return plan
+
+
+def extractDict(ctx, modelData):
+    # ctx is a new ModelContext, so all lists are set to their initial values
+    zefix(ctx, 0) # set zefix marker to 0
+
+    # option sections selects some sections, the sections they need are run too, but their rows are dropped
+    plan = getSectionPlan(ctx.options.get('sections'))
+    parts = set()
+    for node, wanted in plan:
+        parts.update(node[1])
+    runSection(ctx, decodeModel, modelData, parts)  # sets model, read by the sections below
+
+    # evaluate the dicts of top level
+    changed = False  # a list read by getSwitch() has changed since the last newGeneration()
+    for node, wanted in plan:
+        section, reads, sets = node[0], node[2], node[3]
+        if changed and set(reads).intersection(switchLists):
+            ctx.newGeneration()
+            changed = False
+        if wanted:
+            runSection(ctx, section, modelData)
+        else:
+            rowsmark = len(ctx.rows)
+            zefixmark = ctx.zefixmark
+            runSection(ctx, section, modelData)
+            del ctx.rows[rowsmark:]
+            ctx.zefixmark = zefixmark
+            del ctx.unknown[zefixmark:]
+        if set(sets).intersection(switchLists):
+            changed = True
 
     # currently not evaluated
     #mixesvalues(modelData)        # data processed by mixesmain()
@@ -2149,13 +2612,14 @@ def extractDict(modelData):
 
 
 # ---------------------------    function to extract patterns of hardware switches and controls from model file  -----------------------------
-# extracts text patterns, so all controls and switches will be found if used or just referenced in logical switch
+# lists the text patterns found by readModel(), so all controls and switches will be found if used or just referenced in logical switch
 # exceptions: switches at start-up position are defined by index
-def extractPat(modelTxt):
-    writeLine('\n\n\nzugewiesene Geber und Schalter:', '\n\n\nassigned controls and switches:')
+def extractPat(ctx, switches):
+    ctx.section = 'extractPat'
+    ctx.path = None  # the switches are found anywhere in the model file
+    ctx.rows.append([])
+    writeTitle(ctx, ctx.msg['assignedTitle'])
 
-    # pattern of switches and controls
-    swpat = re.compile("\"-?[0-9]+,-?[0-9]+,-?[0-9]+,-?[0-9]+,-?[0-9]+,-?[0-9]+,-?[0-9]+,-?[0-9]+\"")
     # hardware and software controls and switches to be listed
     hw = ['P1', 'P2', 'P4', 'P3', 'P5', 'P6', 'P7', 'P8', 'SA', 'SB',
           'SC', 'SD', 'SE', 'SF', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'P9',
@@ -2166,11 +2630,8 @@ def extractPat(modelTxt):
 
     swlist = []
     swlist2 = []
-    allsw = re.findall(swpat, modelTxt)
-    for xx in allsw:
-        # remove leading and trailing "
-        yy = xx[1:len(xx)-1]
-        sw = getSwitch(yy)[0]
+    for yy in switches:
+        sw = getSwitch(ctx, yy)[0]
         if sw != 'P10':
             sw2 = sw
         else:
@@ -2182,125 +2643,1485 @@ def extractPat(modelTxt):
     swlist2 = sorted(set(swlist))
     for sw in swlist2:
         if sw != 'Q10':
-            out = '\n' + sw
+            out = [sw]
         else:
-            out = '\n' + 'P10'
-        writeLine(out, out)
+            out = ['P10']
+        writeLine(ctx, out)
+
+# ------------------------   function to read one model file, called from convertModel()  ----
+# pattern of switches and controls in the text of a model file, the group is the switch without quotes
+swtextpat = re.compile('"(-?[0-9]+(?:,-?[0-9]+){7})"')
+# the file is read only once, its text is searched for switches (needed by extractPat) and decoded to a dict by json,
+# then the text is dropped, so it does not stay in memory during the conversion
+# returns a list [model as dict, list of switches found in the text]
+# raises OSError if file is not readable and json.decoder.JSONDecodeError if it is not valid json
+# if timings is a dict, the seconds for reading and decoding are stored as 'read' and 'json'
+def readModel(fileName, timings=None):
+    return parseModel(readContent(fileName, timings), timings)
+
+
+# content of a model file as bytes, see readModel()
+def readContent(fileName, timings=None):
+    start = time.perf_counter()
+    with open(fileName, 'rb') as filein:
+        content = filein.read()
+    if timings is not None:
+        timings['read'] = time.perf_counter() - start
+    return content
+
+
+# decode the content of a model file (from disk or from an archive), see readModel()
+def parseModel(content, timings=None):
+    start = time.perf_counter()
+    # input encoding UTF-8 mandatory for portability and German umlaute äöü, is standard for python
+    # non UTF-8 characters like hex B0 (used by SM sensors for centigrades)
+    # will be replaced by character � (by errors='replace')
+    modelTxt = content.decode('utf-8', errors='replace')
+    modelData = json.loads(modelTxt)  # resulting modelData is a dict
+    switches = swtextpat.findall(modelTxt)
+    if timings is not None:
+        timings['json'] = time.perf_counter() - start
+    return [modelData, switches]
+
+
+# ------------------------   manifest of converted models, used by convertFile() and convertBatch()  ----
+# each csv folder gets a manifest file, it stores jemoview version, a fingerprint of the settings and
+# for each converted model file (key is its name) size, mtime and sha256 of its content.
+# a model is skipped if its csv file exists and neither the model nor version or settings have changed since
+manifestName = '.jemoview-manifest.json'
+manifests = {}  # manifests of the csv folders used by the current run, key is the csv folder
+manifestsChanged = set()  # csv folders whose manifest must be written by saveManifests()
+
+
+# name of the csv file of a model file, depends on option csvtarget
+# fileName may be relative (batch mode), e.g. 0001Mode.jsn gives csv/0001Mode.csv for subfolder
+def getCsvName(fileName):
+    filecsv = os.path.splitext(fileName)[0] + '.csv'
+    if options['csvtarget'] == 'subfolder':
+        basNam = os.path.basename(filecsv)
+        dirNam = os.path.dirname(filecsv)
+        filecsv = os.path.join(dirNam, 'csv', basNam)
+    return filecsv
+
+
+# folder of the csv file of a model file as absolute path, the key of its manifest
+# (a relative model file like 0001Mode.jsn has no folder in its name)
+def getCsvFolder(fileName):
+    return os.path.dirname(os.path.abspath(getCsvName(fileName)))
+
+
+# fingerprint of everything except the model that changes the csv file: options, switches and texts
+def getFingerprint():
+    settings = json.dumps([options, swsettings, getCatalog(options['language'])], sort_keys=True)
+    return hashlib.sha256(settings.encode('utf-8')).hexdigest()
+
+
+# dict of the models of the manifest of a csv folder, read once per run,
+# empty if there is no manifest or it was written by another version, csv format (see csvFormat) or with other settings
+def getManifest(csvFolder):
+    if csvFolder in manifests:
+        return manifests[csvFolder]['models']
+    manifest = {'version': progvers, 'format': csvFormat, 'settings': getFingerprint(), 'models': {}}
+    try:
+        with open(os.path.join(csvFolder, manifestName), 'r', encoding='utf-8') as filein:
+            oldManifest = json.load(filein)
+        if (oldManifest['version'] == manifest['version'] and oldManifest['format'] == manifest['format'] and
+                oldManifest['settings'] == manifest['settings']):
+            manifest['models'] = oldManifest['models']
+    except (OSError, ValueError, KeyError, TypeError):  # missing or invalid, all models are converted
+        pass
+    manifests[csvFolder] = manifest
+    return manifest['models']
+
+
+# sha256 of the content of a file
+def getFileHash(fileName):
+    with open(fileName, 'rb') as filein:
+        return hashlib.sha256(filein.read()).hexdigest()
+
+
+# check if the csv file of a model file is current
+# returns a list [True if current, manifest entry of the model file as it is now or None if not readable]
+# the content is only hashed if size or mtime differ from the manifest (e.g. model copied again from SD card)
+def checkModel(fileName):
+    filecsv = getCsvName(fileName)
+    csvFolder = getCsvFolder(fileName)
+    models = getManifest(csvFolder)
+    key = os.path.basename(fileName)
+    try:
+        stat = os.stat(fileName)
+        entry = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+        oldEntry = models.get(key)
+        if oldEntry is None or not os.path.exists(filecsv):
+            entry['sha256'] = getFileHash(fileName)
+            return [False, entry]
+        if oldEntry['size'] == entry['size'] and oldEntry['mtime'] == entry['mtime']:
+            return [True, oldEntry]
+        entry['sha256'] = getFileHash(fileName)
+    except (OSError, KeyError, TypeError):
+        return [False, None]  # convertModel() reports unreadable files
+    if oldEntry.get('sha256') == entry['sha256']:
+        models[key] = entry  # same content, store new mtime to avoid hashing next time
+        manifestsChanged.add(csvFolder)
+        return [True, entry]
+    return [False, entry]
+
+
+# store the result of the conversion of a model file in the manifest of its csv folder
+def recordModel(fileName, entry, converted):
+    csvFolder = getCsvFolder(fileName)
+    models = getManifest(csvFolder)
+    key = os.path.basename(fileName)
+    if converted and entry is not None:
+        models[key] = entry
+    else:
+        models.pop(key, None)  # convert again next time
+    manifestsChanged.add(csvFolder)
+
+
+# write the changed manifests, each at once, and forget all manifests (settings might change before next run)
+def saveManifests():
+    for csvFolder in sorted(manifestsChanged):
+        if not os.path.isdir(csvFolder):  # no csv file written
+            continue
+        fileName = os.path.join(csvFolder, manifestName)
+        try:
+            with open(fileName + '.tmp', 'w', encoding='utf-8') as fileout:
+                json.dump(manifests[csvFolder], fileout, indent=0)
+            os.replace(fileName + '.tmp', fileName)
+        except OSError as e:
+            print(fileName, 'nicht schreibbar / not writable')
+            print(str(e))
+    manifests.clear()
+    manifestsChanged.clear()
+
+
+# ------------------------   function to convert one model file, called from convertFile() and convertBatch()  ----
+# nothing is printed here, so it can run in a worker process of convertBatch()
+# returns a list [name of csv file or None if not converted, list of problems (see getProblem),
+#                 profile record (see profileModel) or None if profiling is not enabled]
+def convertModel(fileName):
+    if profiling['enabled']:
+        return profileModel(fileName)
+    return convertSteps(fileName, None) + [None]
+
+
+# the steps of convertModel(), if timings is a dict the seconds of each step are stored in it
+# returns a list [name of csv file or None if not converted, list of problems (see getProblem)]
+def convertSteps(fileName, timings):
+    msg = getCatalog(options['language'])
+    if not isModelFile(fileName):  # never write the csv file over the model file
+        return [None, [getProblem(fileName, 'unwritable', msg['notModelFile'].format(fileName))]]
+    try:
+        # the content is not kept here, it is freed as soon as it is decoded
+        parsed, messages = parseContent(fileName, readContent(fileName, timings), timings)
+    except OSError as e:
+        return [None, [getProblem(fileName, 'unreadable', msg['unreadableFile'].format(fileName) + str(e), e)]]
+    if parsed is None:
+        return [None, messages]
+    ctx, messages = extractModel(fileName, parsed[0], parsed[1], timings)
+    if ctx is None:
+        return [None, messages]
+
+    # check where to store resulting csv files, default is same folder as model file
+    filecsv = getCsvName(fileName)
+    if options['csvtarget'] == 'subfolder':
+        dirNamCsv = os.path.dirname(filecsv)
+        if not os.path.exists(dirNamCsv):
+            try:
+                os.makedirs(dirNamCsv, exist_ok=True)  # parallel workers may create it at the same time
+            except OSError as e:
+                messages.append(getProblem(fileName, 'unwritable', msg['noSubfolder'] + str(e), e))
+                return [None, messages]
+
+    # create output
+    try:
+        start = time.perf_counter()
+        # lineterminator '\n' of writeCsv() is translated by text mode as before (i.e. '\r\n' on Windows)
+        with open(filecsv, 'w', encoding='utf-8', errors='replace') as fileout:
+            writeCsv(fileout, ctx)
+        if timings is not None:
+            timings['write'] = time.perf_counter() - start
+    except:
+        out = msg['modelError'].format(fileName) + str(sys.exc_info()[0]) + '\n' + str(sys.exc_info()[1])
+        messages.append(getProblem(fileName, 'error', out, sys.exc_info()[1]))
+        return [None, messages]
+
+    return [filecsv, messages]
+
+
+# decode the content of a model file, fileName is only used for the messages
+# returns a list [[modelData, switches] of parseModel() or None if the model is not valid, list of problems (see getProblem)]
+def parseContent(fileName, content, timings=None):
+    msg = getCatalog(options['language'])
+    try:
+        parsed = parseModel(content, timings)
+    except json.decoder.JSONDecodeError as e:
+        return [None, [getProblem(fileName, 'invalid', msg['invalidModel'].format(fileName) + str(e), e)]]
+    if 'Global' not in parsed[0]:
+        return [None, [getProblem(fileName, 'invalid', msg['invalidModel'].format(fileName))]]
+    return [parsed, []]
+
+
+# extract the csv rows of a model decoded by parseContent(), fileName is only used for the messages
+# returns a list [ModelContext with the rows or None if the model is not valid, list of problems (see getProblem)]
+def extractModel(fileName, modelData, switches, timings=None):
+    messages = []
+    msg = getCatalog(options['language'])
+    try:
+        # extract content of model
+        ctx = ModelContext(options, swsettings)
+        ctx.timings = timings
+        extractRows(ctx, modelData, switches)
+    except:
+        out = msg['modelError'].format(fileName) + str(sys.exc_info()[0]) + '\n' + str(sys.exc_info()[1])
+        messages.append(getProblem(fileName, 'error', out, sys.exc_info()[1]))
+        return [None, messages]
+
+    if zefix(ctx, 2) > 0:
+        # the first different unknown values are shown, all are in the report
+        found = []
+        for section, path, value in ctx.unknown:
+            out = '{} {} = {}'.format(section, path or '-', value)
+            if out not in found:
+                found.append(out)
+        out = msg['unknownData'].format(fileName) + '\n' + '\n'.join(found[:5]) + ('\n...' if len(found) > 5 else '')
+        messages.append(getProblem(fileName, 'unknown', out, count=zefix(ctx, 2), unknown=ctx.unknown))
+    return [ctx, messages]
+
+
+# categories of the problems of a model and their texts in the catalogs, the csv file is written only for unknown data
+problemCategories = {'unreadable': 'reportUnreadable', 'invalid': 'reportInvalid', 'error': 'reportError',
+                     'unwritable': 'reportUnwritable', 'unknown': 'reportUnknown'}
+report = []  # problems of the models of the current run, see reportProblems()
+
+
+# a problem of a model for the report of the run, a dict with file, category (one of problemCategories),
+# message for the user, exception as text, number of unknown data and the unknown data (see zefix)
+def getProblem(fileName, category, out, error=None, count=0, unknown=None):
+    exception = None if error is None else type(error).__name__ + ': ' + str(error)
+    return {'file': fileName, 'category': category, 'message': out, 'exception': exception, 'zefix': count,
+            'unknown': unknown or []}
+
+
+# extract the csv rows of a model (as returned by parseModel) into ctx.rows, see extractModel() and convert()
+def extractRows(ctx, modelData, switches):
+    extractDict(ctx, modelData)
+    start = time.perf_counter()
+    if 'sections' not in ctx.options or 'extractPat' in ctx.options['sections']:
+        extractPat(ctx, switches)
+    if ctx.timings is not None:
+        ctx.timings['extractPat'] = time.perf_counter() - start
+
+
+# write all rows at once, csv quotes cells containing the delimiter, quotes or line breaks
+def writeCsv(fileout, ctx):
+    writer = csv.writer(fileout, delimiter=ctx.options['delimiter'], lineterminator='\n')
+    writer.writerow(progrow)
+    writer.writerows(ctx.rows)
+
+
+# convertModel() with profiling: each step is timed, optionally with cProfile and tracemalloc
+# returns the result of convertSteps() and the profile record, a dict which is written by writeProfile()
+def profileModel(fileName):
+    timings = {}
+    profiler = None
+    if profiling['cprofile']:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    tracing = False
+    if profiling['tracemalloc']:
+        import tracemalloc
+        tracing = not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        filecsv, messages = convertSteps(fileName, timings)
+    finally:
+        total = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+        if tracing:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    record = {'model': fileName, 'csv': filecsv, 'start': time.strftime('%Y-%m-%d %H:%M:%S'),
+              'bytes': os.path.getsize(fileName) if os.path.isfile(fileName) else None,
+              'total ms': round(total * 1000, 3),
+              'steps ms': {name: round(timings[name] * 1000, 3) for name in timings}}
+    if tracing:
+        record['peak memory KiB'] = round(peak / 1024)
+    if profiler is not None:
+        # functions with most cumulative time: [function, calls, own ms, cumulative ms]
+        import pstats
+        stats = pstats.Stats(profiler).stats
+        top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:20]
+        record['cprofile'] = [[pstats.func_std_string(func), value[1], round(value[2] * 1000, 3), round(value[3] * 1000, 3)]
+                              for func, value in top]
+    return [filecsv, messages, record]
+
+
+# append the profile record of a model as one json line to the profile log,
+# which is the file given by --profile-log or a file .profile.jsonl next to the csv file
+def writeProfile(record):
+    fileName = profiling['log']
+    if fileName is None:
+        fileName = os.path.splitext(record['csv'] or record['model'])[0] + '.profile.jsonl'
+    steps = record['steps ms']
+    slowest = max(steps, key=steps.get) if steps else '-'
+    print('profile %.3f ms, slowest step %s, written to %s' % (record['total ms'], slowest, fileName))
+    try:
+        with open(fileName, 'a', encoding='utf-8') as fileout:
+            fileout.write(json.dumps(record, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(fileName, 'nicht schreibbar / not writable')
+        print(str(e))
 
-# ------------------------   function to select model files and then call extract... functions for each selected model  ----
+
+# report result of convertModel() in terminal window and report, returns True if the csv file was written
+def reportResult(result):
+    filecsv, messages, record = result
+    reportProblems(messages)
+    if record is not None:
+        writeProfile(record)
+    if filecsv is None:
+        return False
+    print('output', filecsv)
+    return True
+
+
+# convert one model file unless its csv file is current (see checkModel), returns True if the csv file is current
+# the manifest is only updated in memory, the caller has to call saveManifests()
+def convertFile(fileName, force=False):
+    print('\ninput', fileName)
+    current, entry = checkModel(fileName)
+    if current and not force and not profiling['enabled']:  # a profile is only made by a conversion
+        print('unchanged', getCsvName(fileName))
+        return True
+    converted = reportResult(convertModel(fileName))
+    recordModel(fileName, entry, converted)
+    return converted
+
+
+# print the messages of the problems in terminal window and keep the problems for the summary of the run,
+# the GUI shows them all together at the end instead of one message box per model
+def reportProblems(problems):
+    for problem in problems:
+        print(problem['message'])
+    report.extend(problems)
+
+
+# summary of the report of a run, found and converted are the numbers of models
+def getSummary(found, converted):
+    msg = getCatalog(options['language'])
+    lines = [msg['reportSummary'].format(converted, found)]
+    for category in problemCategories:
+        files = [problem['file'] for problem in report if problem['category'] == category]
+        if files:
+            lines.append('%s: %d' % (msg[problemCategories[category]], len(files)))
+            # only the first files are listed, all are in the report file (see writeReport)
+            lines.extend('    ' + fileName for fileName in files[:5])
+            if len(files) > 5:
+                lines.append('    ...')
+    return '\n'.join(lines)
+
+
+# write the report of a run to fileName as json or, if the name ends with .csv, as csv file
+def writeReport(fileName, found, converted):
+    try:
+        with open(fileName, 'w', encoding='utf-8', newline='') as fileout:
+            if fileName.lower().endswith('.csv'):
+                keys = ['file', 'category', 'message', 'exception', 'zefix']
+                writer = csv.writer(fileout, delimiter=options['delimiter'], lineterminator='\n')
+                writer.writerow(keys + ['unknown'])
+                # unknown data as lines section path = value
+                writer.writerows([problem[key] for key in keys] +
+                                 ['\n'.join('{} {} = {}'.format(*item) for item in problem['unknown'])]
+                                 for problem in report)
+            else:
+                json.dump({'models': found, 'converted': converted, 'problems': report}, fileout, ensure_ascii=False, indent=1)
+    except OSError as e:
+        print(fileName, 'nicht schreibbar / not writable')
+        print(str(e))
+        return False
+    print('report', fileName)
+    return True
+
+
+# print message in terminal window and show it as message box if the GUI is running
+# in the worker thread of the GUI the message is passed to the GUI by guiQueue, see convertWorker()
+def showMessage(out):
+    print(out)
+    if app is not None:
+        import threading
+        if threading.current_thread() is not threading.main_thread():
+            guiQueue.put(['message', out])
+            return
+        from tkinter import messagebox
+        messagebox.showinfo(title='jemoview', message=out)
+
+
+# ------------------------   function to select model files and then convert them in a worker thread  ----
 def selectInput():
-    # this global must be declared here again to avoid variable shadowing (is set here)
-    global fileout
+    from tkinter import filedialog
 
     initdir = os.getcwd()
     if options['language'] == 'de':
         txt1 = 'eine oder mehrere jsn Modell Dateien auswählen'
         txt2 = 'jsn Dateien'
+        txt3 = 'Archive (Sicherungen der SD Karte)'
     else:
         txt1 = 'select one or more jsn model files'
         txt2 = 'jsn files'
-    filelist = filedialog.askopenfiles(
-        mode='r',
+        txt3 = 'archives (backups of the SD card)'
+    filelist = filedialog.askopenfilenames(
         title=txt1,
         initialdir=initdir,
-        filetypes=[(txt2, ['.jsn'])],
-        multiple=True)
+        filetypes=[(txt2, ['.jsn']), (txt3, list(archiveTypes))])
     if not filelist:
         return None
 
-    for item in filelist:
-        fileName = item.name  # is a fully qualified name
-        print('\ninput', fileName)
-        # input encoding UTF-8 mandatory for portability and German umlaute äöü, is standard for python
-        # non UTF-8 characters like hex B0 (used by SM sensors for centigrades)
-        # will be replaced by character � (by errors='replace')
+    # the files are converted by a worker thread, so the window stays responsive and can cancel the conversion
+    global guiQueue, guiCancel
+    import queue
+    import threading
+    guiQueue = queue.Queue()
+    guiCancel = threading.Event()
+    setRunning(True)
+    progressBar['maximum'] = len(filelist)
+    progressBar['value'] = 0
+    threading.Thread(target=convertWorker, args=(list(filelist), guiQueue, guiCancel), daemon=True).start()
+    app.after(100, pollWorker)
+
+
+# convert the files selected in the GUI, runs in a worker thread and must not use tkinter
+# the GUI is informed by lists put into events, see pollWorker(), cancel stops after the current model
+def convertWorker(fileNames, events, cancel):
+    report.clear()
+    start = time.perf_counter()
+    done = 0
+    found = 0
+    converted = 0
+    fileName = ''
+    error = ''
+    try:
         try:
-            with open(fileName, 'r', encoding='utf-8', errors='replace') as filein:
-                try:
-                    modelData = json.load(filein)  # resulting modelData is a dict
-                except json.decoder.JSONDecodeError as e:
-                    if options['language'] == 'de':
-                        out = 'Datei ' + fileName + ' ist kein gültiges Modell\n' + str(e)
-                    else:
-                        out = 'file ' + fileName + ' is not a valid model\n' + str(e)
-                    print(out)
-                    tk.messagebox.showinfo(title='jemoview', message=out)
-                    continue
-        except OSError as e:
-            if options['language'] == 'de':
-                out = 'Datei ' + fileName, ' nicht lesbar\n' + str(e)
+            for fileName in fileNames:  # is a fully qualified name
+                if cancel.is_set():
+                    break
+                events.put(['start', done, fileName])
+                if isArchive(fileName):
+                    count, failed, convertedArchive = convertArchives([fileName], cancel=cancel)
+                    found += count
+                    converted += convertedArchive
+                    ok = failed == 0
+                else:
+                    found += 1
+                    ok = convertFile(fileName)
+                    converted += ok
+                done += 1
+                events.put(['done', done, fileName, ok, time.perf_counter() - start])
+        finally:
+            saveManifests()  # also the models converted before an error
+    except Exception as e:  # unexpected error, the run is stopped but the GUI must leave the running state
+        msg = getCatalog(options['language'])
+        error = msg['modelError'].format(fileName) + str(type(e)) + '\n' + str(e)
+        report.append(getProblem(fileName, 'error', error, e))
+    finally:
+        summary = getSummary(found, converted)
+        events.put(['end', done, cancel.is_set(), summary + '\n\n' + error if error else summary])
+
+
+# show the events of convertWorker() in the GUI, called by the Tk main loop every 100 ms while the worker runs
+def pollWorker():
+    import queue
+    from tkinter import messagebox
+    de = options['language'] == 'de'
+    while True:
+        try:
+            event = guiQueue.get_nowait()
+        except queue.Empty:
+            break
+        if event[0] == 'message':
+            messagebox.showinfo(title='jemoview', message=event[1])
+        elif event[0] == 'start':
+            labelStatus['text'] = '%d / %d   %s' % (event[1] + 1, progressBar['maximum'], os.path.basename(event[2]))
+        elif event[0] == 'done':
+            done, fileName, converted, seconds = event[1:]
+            progressBar['value'] = done
+            if de:
+                status = 'fertig' if converted else 'Fehler'
             else:
-                out = 'file ' + fileName, ' not readable\n' + str(e)
-            print(out)
-            tk.messagebox.showinfo(title='jemoview', message=out)
-            continue
-        filein.close()
-        if 'Global' not in modelData:
+                status = 'ok' if converted else 'error'
+            rate = done / seconds if seconds > 0 else 0.0
+            labelStatus['text'] = '%d / %d   %s   %s   %.1f %s' % (done, progressBar['maximum'], os.path.basename(fileName),
+                                                                status, rate, 'Modelle/s' if de else 'models/s')
+        elif event[0] == 'end':
+            setRunning(False)
+            if event[2]:
+                out = 'abgebrochen nach %d Dateien' % event[1] if de else 'cancelled after %d files' % event[1]
+            else:
+                out = 'bereit für weitere Modelle' if de else 'ready for next models'
+            # one message box with the summary of all models, see reportProblems()
+            showMessage(event[3] + '\n\n' + out)
+            return
+    app.after(100, pollWorker)
+
+
+# enable or disable the buttons of the GUI while the worker thread converts
+def setRunning(running):
+    state = 'disabled' if running else 'normal'
+    for button in [buttonStart, buttonDe, buttonEn, buttonCsvsame, buttonCsvsub, checkProfile]:
+        button['state'] = state
+    buttonCancel['state'] = 'normal' if running else 'disabled'
+
+
+# called by the cancel button, the worker stops after the current model
+def cancelWorker():
+    if guiCancel is not None:
+        guiCancel.set()
+        labelStatus['text'] = 'wird abgebrochen ...' if options['language'] == 'de' else 'cancelling ...'
+
+
+# ------------------------   batch mode without GUI, called from main()  ----
+# model files end with .jsn in any case (e.g. 0001MODE.JSN copied by some tools)
+def isModelFile(fileName):
+    return os.path.splitext(fileName)[1].lower() == '.jsn'
+
+
+# expand files, folders and patterns like Model/*.jsn into a sorted list of model files and archives,
+# other files are ignored
+def collectFiles(paths):
+    fileNames = []
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(glob.glob(os.path.join(glob.escape(path), '*')))
+            names = [name for name in names if isModelFile(name) and os.path.isfile(name)]
+        else:  # file or pattern, pattern needed if the shell does not expand it (Windows)
+            names = [path] if os.path.isfile(path) else sorted(glob.glob(path))
+            names = [name for name in names if isModelFile(name) or isArchive(name)]
+        if not names:
             if options['language'] == 'de':
-                out = 'Datei ' + fileName + ' ist kein gültiges Modell\n'
+                print('keine Modell Dateien gefunden:', path)
             else:
-                out = 'file ' + fileName + ' is not a valid model\n'
-            print(out)
-            tk.messagebox.showinfo(title='jemoview', message=out)
-            continue
-        # open fileName again and read as one line text (previous open was successful so try not needed again)
-        with open(fileName, 'r', encoding='utf-8', errors='replace') as filein2:
-            modelTxt = filein2.readline()
-            filein2.close()
-
-        # check where to store resulting csv files, default is same folder as model file
-        filecsv = fileName.replace('.jsn', '.csv')
-        if options['csvtarget'] == 'subfolder':
-            basNam = os.path.basename(filecsv)
-            dirNam = os.path.dirname(filecsv)
-            dirNamCsv = dirNam + os.path.sep + 'csv'
-            filecsv = dirNamCsv + os.path.sep + basNam
-            if not os.path.exists(dirNamCsv):
+                print('no model files found:', path)
+        for fileName in names:
+            if fileName not in seen:
+                seen.add(fileName)
+                fileNames.append(fileName)
+    return fileNames
+
+
+# set options of a worker process of convertBatch(), needed if workers do not inherit the globals (Windows, macOS)
+def initWorker(workerOptions, workerSwsettings, workerCatalogs, workerProfiling):
+    options.update(workerOptions)
+    swsettings[:] = workerSwsettings
+    catalogs.update(workerCatalogs)
+    profiling.update(workerProfiling)
+
+
+# convert all model files given by paths, using jobs worker processes if jobs > 1
+# unchanged models are skipped unless force is True, see checkModel()
+# zip and tar archives are converted by convertArchives(), their csv files go to archiveOut if it is not None
+# the problems of all models are summarized at the end and written to reportName if it is not None
+# returns exit code 0 if all csv files are current, 1 if a model was not converted,
+# 3 if all were converted but with unknown data, 4 if no model files were found
+def convertBatch(paths, jobs=1, force=False, archiveOut=None, reportName=None):
+    report.clear()
+    fileNames = collectFiles(paths)
+    archives = [fileName for fileName in fileNames if isArchive(fileName)]
+    fileNames = [fileName for fileName in fileNames if not isArchive(fileName)]
+    force = force or profiling['enabled']  # a profile is only made by a conversion
+    failed = 0
+    if jobs > 1 and len(fileNames) > 1:
+        # only changed models are given to the workers, manifests are updated here
+        changed = []
+        for fileName in fileNames:
+            current, entry = checkModel(fileName)
+            if current and not force:
+                print('\ninput', fileName)
+                print('unchanged', getCsvName(fileName))
+            else:
+                changed.append([fileName, entry])
+        if len(changed) > 0:
+            from concurrent.futures import ProcessPoolExecutor
+            # results come back in order of changed, chunks reduce the overhead per model
+            chunk = max(1, len(changed) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(options, swsettings, catalogs, profiling)) as executor:
+                results = executor.map(convertModel, [item[0] for item in changed], chunksize=chunk)
+                for [fileName, entry], result in zip(changed, results):
+                    print('\ninput', fileName)
+                    converted = reportResult(result)
+                    recordModel(fileName, entry, converted)
+                    if not converted:
+                        failed += 1
+    else:
+        for fileName in fileNames:
+            if not convertFile(fileName, force):
+                failed += 1
+    found = len(fileNames)
+    converted = found - failed
+    if archives:
+        count, failedArchives, convertedArchives = convertArchives(archives, jobs, archiveOut)
+        found += count
+        failed += failedArchives
+        converted += convertedArchives
+    saveManifests()
+    print('\n' + getSummary(found, converted))
+    if reportName is not None and not writeReport(reportName, found, converted):
+        return 1
+    if failed > 0:
+        return 1
+    if found == 0:
+        return 4
+    if any(problem['category'] == 'unknown' for problem in report):
+        return 3
+    return 0
+
+
+# ------------------------   model files in zip or tar archives, called from convertBatch() and selectInput()  ----
+# e.g. backups of the SD card of the transmitter, the model files are the members *.jsn in a folder Model
+# (Lua apps store jsn files in folder Apps, they are not models)
+archiveTypes = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+
+def isArchive(fileName):
+    return fileName.lower().endswith(archiveTypes)
+
+
+def isModelMember(memberName):
+    parts = memberName.lower().split('/')
+    return len(parts) >= 2 and parts[-2] == 'model' and parts[-1].endswith('.jsn')
+
+
+# folder of the csv files of an archive: the name of the archive without extension,
+# with -2, -3 ... appended if another archive of the run has the same name (e.g. backup.zip and backup.tar.gz)
+def getArchiveFolder(archiveName, usedFolders):
+    base = os.path.basename(archiveName)
+    for ext in archiveTypes:
+        if base.lower().endswith(ext):
+            base = base[:-len(ext)]
+            break
+    folder = base
+    number = 1
+    while folder in usedFolders:
+        number += 1
+        folder = base + '-' + str(number)
+    usedFolders.add(folder)
+    return folder
+
+
+# relative name of the csv file of a model member in the folder of the archive, see getArchiveFolder()
+# members named like ../x.jsn or /x.jsn stay inside that folder
+def getMemberCsvName(folder, memberName):
+    parts = [folder] + [part for part in memberName.split('/') if part not in ['', '.', '..']]
+    if options['csvtarget'] == 'subfolder':
+        parts.insert(-1, 'csv')
+    parts[-1] = parts[-1][:-4] + '.csv'
+    return '/'.join(parts)
+
+
+# model members of an archive in the order they are stored, each read once without temporary files
+# (a tar file is read as stream, a zip file member by member)
+# yields lists [archive name, member name, content as bytes]
+# raises OSError, zipfile.BadZipFile or tarfile.TarError if the archive is not readable
+def readArchive(archiveName):
+    if archiveName.lower().endswith('.zip'):
+        import zipfile
+        with zipfile.ZipFile(archiveName) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and isModelMember(info.filename):
+                    yield [archiveName, info.filename, archive.read(info)]
+    else:
+        import tarfile
+        with tarfile.open(archiveName, 'r|*') as archive:
+            for info in archive:
+                if info.isfile() and isModelMember(info.name):
+                    yield [archiveName, info.name, archive.extractfile(info).read()]
+
+
+# convert one member of readArchive(), nothing is printed here, so it can run in a worker process
+# returns a list [member name, text of csv file or None if not converted, list of problems (see getProblem)]
+def convertMember(member):
+    archiveName, memberName, content = member
+    parsed, messages = parseContent(archiveName + ':' + memberName, content)
+    if parsed is None:
+        return [memberName, None, messages]
+    ctx, messages = extractModel(archiveName + ':' + memberName, parsed[0], parsed[1])
+    if ctx is None:
+        return [memberName, None, messages]
+    fileout = io.StringIO()
+    writeCsv(fileout, ctx)
+    return [memberName, fileout.getvalue(), messages]
+
+
+# archive for the csv files, its type is given by the extension of its name
+def openArchive(archiveName):
+    lower = archiveName.lower()
+    if lower.endswith('.zip'):
+        import zipfile
+        return zipfile.ZipFile(archiveName, 'w', zipfile.ZIP_DEFLATED)
+    import tarfile
+    for ext, mode in [['.tar.gz', 'w:gz'], ['.tgz', 'w:gz'], ['.tar.bz2', 'w:bz2'], ['.tar.xz', 'w:xz']]:
+        if lower.endswith(ext):
+            return tarfile.open(archiveName, mode)
+    return tarfile.open(archiveName, 'w')
+
+
+def addToArchive(archive, memberName, text):
+    # same line breaks as a csv file written in text mode
+    data = text.replace('\n', os.linesep).encode('utf-8', errors='replace')
+    if hasattr(archive, 'writestr'):  # zip
+        archive.writestr(memberName, data)
+        return
+    import tarfile
+    info = tarfile.TarInfo(memberName)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    archive.addfile(info, io.BytesIO(data))
+
+
+# results of func for the items in order, like executor.map, but at most limit items are submitted at once,
+# so the items of a generator (e.g. the members of an archive with their content) are taken only when needed.
+# without executor the items are done here one by one. if cancel (a threading.Event) is set,
+# no further item is taken and the submitted items not yet started are cancelled
+def mapBounded(executor, func, items, limit, cancel=None):
+    items = iter(items)
+    pending = collections.deque()
+    more = True
+    try:
+        while True:
+            if cancel is not None and cancel.is_set():
+                return
+            if executor is None:
+                item = next(items, None)  # items are lists, never None
+                if item is None:
+                    return
+                yield func(item)
+                continue
+            if more and len(pending) < limit:
+                item = next(items, None)
+                if item is not None:
+                    pending.append(executor.submit(func, item))
+                    continue
+                more = False
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# convert the model members of the archives, using jobs worker processes if jobs > 1
+# the csv files are written into the archive archiveOut or, if it is None, next to each archive into a folder
+# named like the archive (see getArchiveFolder), members are always converted (there is no manifest)
+# cancel is a threading.Event of the GUI, if it is set no further member is converted
+# returns a list [number of models found, number of models or archives not converted, number of models converted]
+def convertArchives(archives, jobs=1, archiveOut=None, cancel=None):
+    import tarfile
+    import zipfile
+    found = 0
+    failed = 0
+    converted = 0
+    output = None
+    executor = None
+    try:
+        if archiveOut is not None:
+            output = openArchive(archiveOut)
+        if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(options, swsettings, catalogs, profiling))
+        usedFolders = set()
+        for archiveName in archives:
+            if cancel is not None and cancel.is_set():
+                break
+            print('\narchive', archiveName)
+            count = 0
+            folder = getArchiveFolder(archiveName, usedFolders)
+            failedBefore = failed
+            try:
+                # the archive is read here once, member by member while the workers convert the members in order
+                for memberName, text, messages in mapBounded(executor, convertMember, readArchive(archiveName), 2 * jobs, cancel):
+                    count += 1
+                    print('\ninput', archiveName + ':' + memberName)
+                    reportProblems(messages)
+                    if text is None:
+                        failed += 1
+                        continue
+                    csvName = getMemberCsvName(folder, memberName)
+                    if output is not None:
+                        try:
+                            addToArchive(output, csvName, text)
+                        except OSError as e:
+                            print(archiveOut, 'nicht schreibbar / not writable')
+                            print(str(e))
+                            report.append(getProblem(archiveName + ':' + memberName, 'unwritable', archiveOut + ' ' + str(e), e))
+                            failed += 1
+                            continue
+                        print('output', archiveOut + ':' + csvName)
+                        converted += 1
+                        continue
+                    filecsv = os.path.join(os.path.dirname(archiveName), *csvName.split('/'))
+                    try:
+                        os.makedirs(os.path.dirname(filecsv), exist_ok=True)
+                        with open(filecsv, 'w', encoding='utf-8', errors='replace') as fileout:
+                            fileout.write(text)
+                    except OSError as e:
+                        print(filecsv, 'nicht schreibbar / not writable')
+                        print(str(e))
+                        report.append(getProblem(archiveName + ':' + memberName, 'unwritable', filecsv + ' ' + str(e), e))
+                        failed += 1
+                        continue
+                    print('output', filecsv)
+                    converted += 1
+            except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+                print(archiveName, 'nicht lesbar / not readable')
+                print(str(e))
+                report.append(getProblem(archiveName, 'unreadable', archiveName + ' ' + str(e), e))
+                failed += 1
+            if count == 0 and failed == failedBefore:
+                if options['language'] == 'de':
+                    print('keine Modell Dateien gefunden:', archiveName)
+                else:
+                    print('no model files found:', archiveName)
+            found += count
+    except (OSError, tarfile.TarError) as e:
+        print(archiveOut, 'nicht schreibbar / not writable')
+        print(str(e))
+        report.append(getProblem(archiveOut, 'unwritable', archiveOut + ' ' + str(e), e))
+        failed += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if output is not None:
+            output.close()
+    return [found, failed, converted]
+
+
+# ------------------------   watch mode without GUI, called from main()  ----
+# snapshot of the model files given by paths (like collectFiles), dict of file name: [size, mtime]
+# only the folders are listed and the files stated, the files are not read
+def getSnapshot(paths):
+    snapshot = {}
+    for path in paths:
+        if os.path.isdir(path):
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if isModelFile(entry.name) and entry.is_file():
+                            stat = entry.stat()
+                            snapshot[entry.path] = [stat.st_size, stat.st_mtime_ns]
+            except OSError:  # e.g. SD card removed, files will be found again later
+                continue
+        else:
+            names = [path] if os.path.isfile(path) else glob.glob(path)
+            for fileName in [name for name in names if isModelFile(name)]:
                 try:
-                    os.mkdir(dirNamCsv)
-                except OSError as e:
-                    if options['language'] == 'de':
-                        out = 'konnte Unterordner csv nicht anlegen\n' + str(e)
-                    else:
-                        out = 'could not create subfolder csv\n' + str(e)
-                    print(out)
-                    tk.messagebox.showinfo(title='jemoview', message=out)
+                    stat = os.stat(fileName)
+                except OSError:
+                    continue
+                snapshot[fileName] = [stat.st_size, stat.st_mtime_ns]
+    return snapshot
+
+
+# poll the model files given by paths every interval seconds and convert new or changed ones,
+# a file is converted when it was unchanged in two checks and has not been modified for settle seconds,
+# so a model is not read while it is still copied. runs until Ctrl+C, returns exit code 0
+def watchModels(paths, interval=1.0, settle=2.0):
+    converted = {}  # file name: [size, mtime] when it was last converted (or found current)
+    pending = {}    # file name: [size, mtime, time of detection, time of last change]
+    # models whose csv file is current (see checkModel) are not converted at start
+    for fileName, stat in getSnapshot(paths).items():
+        if checkModel(fileName)[0]:
+            converted[fileName] = stat
+    saveManifests()
+    print('watching', ', '.join(paths), '(Ctrl+C to stop)')
+    try:
+        while True:
+            now = time.monotonic()
+            snapshot = getSnapshot(paths)
+            ready = []
+            for fileName, stat in snapshot.items():
+                if converted.get(fileName) == stat:
                     continue
+                if fileName in pending and pending[fileName][:2] == stat:
+                    if now - pending[fileName][3] >= settle:
+                        ready.append(fileName)
+                    continue
+                # new or still being written, time of last change is estimated by mtime
+                age = max(0.0, time.time() - stat[1] / 1e9)
+                detected = pending[fileName][2] if fileName in pending else now
+                pending[fileName] = stat + [detected, now - age]
+            for fileName in list(pending):
+                if fileName not in snapshot:  # deleted before it settled
+                    del pending[fileName]
+            for fileName in list(converted):
+                if fileName not in snapshot:
+                    del converted[fileName]
+            for fileName in sorted(ready):
+                start = time.monotonic()
+                convertFile(fileName)  # also reports errors, a broken file is tried again after its next change
+                end = time.monotonic()
+                print('latency {:.2f}s (conversion {:.2f}s)'.format(end - pending[fileName][2], end - start))
+                converted[fileName] = pending.pop(fileName)[:2]
+            if len(ready) > 0:
+                saveManifests()
+                report.clear()  # the problems are printed by convertFile(), there is no summary in watch mode
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        saveManifests()
+        print('\nwatch stopped')
+    return 0
+
+
+# ------------------------   export of decoded models into a sqlite database, called from main()  ----
+# one database for many models, e.g. all models of a club or of several transmitters. each table has a column
+# model (id of table models), switches are stored as name like 'SF' and as position like 'SF  ↑' (see getSwitch).
+# a model exported again replaces its old rows, models not given on the command line are kept
+exportSchema = '''
+PRAGMA foreign_keys = ON;
+CREATE TABLE IF NOT EXISTS models (id INTEGER PRIMARY KEY, file TEXT UNIQUE NOT NULL, name TEXT, transmitter TEXT,
+    txversion TEXT, language TEXT, size INTEGER, mtime REAL, exported TEXT);
+CREATE TABLE IF NOT EXISTS functions (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    number INTEGER, id INTEGER, label TEXT, control TEXT, position TEXT, trimcontrol TEXT, trimmax INTEGER);
+CREATE TABLE IF NOT EXISTS servos (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    output INTEGER, code INTEGER, name TEXT, middle INTEGER, maxpositive INTEGER, maxnegative INTEGER,
+    maxpositivelimit INTEGER, maxnegativelimit INTEGER, reverse INTEGER, delaypositive REAL, delaynegative REAL);
+CREATE TABLE IF NOT EXISTS mixes (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    source TEXT, target TEXT, flightmode TEXT, global INTEGER, intensity INTEGER, switch TEXT, position TEXT);
+CREATE TABLE IF NOT EXISTS logswitches (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    number INTEGER, label TEXT, enabled INTEGER, switch1 TEXT, switch2 TEXT, logtype INTEGER);
+CREATE TABLE IF NOT EXISTS sensors (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    deviceid TEXT, sensor TEXT, param INTEGER, label TEXT);
+CREATE TABLE IF NOT EXISTS alarms (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    number INTEGER, deviceid TEXT, sensor TEXT, param INTEGER, label TEXT, greater INTEGER, value REAL,
+    file TEXT, switch TEXT, position TEXT, active INTEGER);
+CREATE TABLE IF NOT EXISTS timers (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    number INTEGER, label TEXT, initms INTEGER, destms INTEGER, type INTEGER, switch TEXT, position TEXT, reset TEXT);
+CREATE TABLE IF NOT EXISTS luaapps (model INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    number INTEGER, appid INTEGER);
+CREATE INDEX IF NOT EXISTS functions_model ON functions (model);
+CREATE INDEX IF NOT EXISTS functions_control ON functions (control);
+CREATE INDEX IF NOT EXISTS servos_model ON servos (model);
+CREATE INDEX IF NOT EXISTS mixes_model ON mixes (model);
+CREATE INDEX IF NOT EXISTS mixes_switch ON mixes (switch);
+CREATE INDEX IF NOT EXISTS logswitches_model ON logswitches (model);
+CREATE INDEX IF NOT EXISTS logswitches_switch1 ON logswitches (switch1);
+CREATE INDEX IF NOT EXISTS logswitches_switch2 ON logswitches (switch2);
+CREATE INDEX IF NOT EXISTS sensors_model ON sensors (model);
+CREATE INDEX IF NOT EXISTS sensors_deviceid ON sensors (deviceid);
+CREATE INDEX IF NOT EXISTS alarms_model ON alarms (model);
+CREATE INDEX IF NOT EXISTS alarms_deviceid ON alarms (deviceid);
+CREATE INDEX IF NOT EXISTS alarms_switch ON alarms (switch);
+CREATE INDEX IF NOT EXISTS timers_model ON timers (model);
+CREATE INDEX IF NOT EXISTS timers_switch ON timers (switch);
+CREATE INDEX IF NOT EXISTS luaapps_model ON luaapps (model);
+'''
+exportTables = ['functions', 'servos', 'mixes', 'logswitches', 'sensors', 'alarms', 'timers', 'luaapps']
+
+
+# name and position of a switch for the database, None if no switch
+def getSwitchNames(ctx, aSwitch):
+    hit = getSwitch(ctx, aSwitch)
+    if hit[0] == '-':
+        return [None, None]
+    return [hit[0], hit[1]]
+
+
+# decode one model for exportBatch(), the labels are resolved like in the csv file
+# returns a list [dict of table: list of rows without column model, list of messages for the user]
+# the dict is None if the model could not be decoded
+def exportModel(fileName):
+    messages = []
+    msg = getCatalog(options['language'])
+    try:
+        modelData = readModel(fileName)[0]
+    except json.decoder.JSONDecodeError as e:
+        messages.append(msg['invalidModel'].format(fileName) + str(e))
+        return [None, messages]
+    except OSError as e:
+        messages.append(msg['unreadableFile'].format(fileName) + str(e))
+        return [None, messages]
+    if 'Global' not in modelData:
+        messages.append(msg['invalidModel'].format(fileName))
+        return [None, messages]
+    try:
+        # all sections are evaluated, so functionlist, sensordict etc. are complete
+        ctx = ModelContext(options, swsettings)
+        extractDict(ctx, modelData)
+        model = ctx.model
+        stat = os.stat(fileName)
+        tx = txTyp.get(int(modelData['Global'].get('Version', 1)), [None])[0]
+        tables = {'models': [[os.path.abspath(fileName), modelData['Global'].get('Name'), tx,
+                              modelData['Global'].get('TxVers'), ctx.options['language'], stat.st_size, stat.st_mtime,
+                              time.strftime('%Y-%m-%d %H:%M:%S')]]}
+        tables['functions'] = [[ii + 1, func.id, func.label] + getSwitchNames(ctx, func.control) +
+                               [getSwitchNames(ctx, func.trimControl)[0], func.trimMax]
+                               for ii, func in enumerate(model.functions)]
+        tables['servos'] = [[servo.index + 1, servo.code, ctx.servolist[servo.index + 1], servo.middle, servo.maxPositive,
+                             servo.maxNegative, servo.maxPositiveLimit, servo.maxNegativeLimit, servo.reverse,
+                             setDecPoint(1, servo.delayPositive), setDecPoint(1, servo.delayNegative)]
+                            for servo in model.servos]
+        tables['mixes'] = [[ctx.functionlist[mix.source], ctx.functionlist[mix.target],
+                            'Global' if mix.isGlobal else ctx.flightmolist[mv.flightMode], int(mix.isGlobal),
+                            mv.intensity] + getSwitchNames(ctx, mv.switch)
+                           for mix in model.mixes for mv in mix.values]
+        tables['logswitches'] = [[logsw.index + 1, logsw.label, logsw.enabled, getSwitchNames(ctx, logsw.switch1)[0],
+                                  getSwitchNames(ctx, logsw.switch2)[0], logsw.logType]
+                                 for logsw in model.logSwitches]
+        tables['sensors'] = []
+        for sensor in model.sensors:
+            if sensor.label is not None:
+                tables['sensors'].append([getDeviceID(sensor.id), sensor.label, 0, sensor.label])
+            for param in sensor.params:
+                tables['sensors'].append([getDeviceID(param.sensorId), sensor.label, param.index, param.label])
+        tables['alarms'] = []
+        for ii, alarm in enumerate(model.alarms):
+            found = getSensor(ctx, alarm.sensorId, alarm.sensorParam) or [None, None]
+            tables['alarms'].append([ii + 1, getDeviceID(alarm.sensorId) if alarm.sensorId else None,
+                                     found[0], alarm.sensorParam, found[1], alarm.greater,
+                                     setDecPoint(alarm.decimals, alarm.value), alarm.file] +
+                                    getSwitchNames(ctx, alarm.switch) + [alarm.active])
+        tables['timers'] = [[ii + 1, timer.label, timer.initTime, timer.destTime, timer.type] +
+                            getSwitchNames(ctx, timer.switch) + [getSwitchNames(ctx, timer.reset)[0]]
+                            for ii, timer in enumerate(model.timers)]
+        tables['luaapps'] = [[ii + 1, app.appId] for ii, app in enumerate(model.luaApps)]
+    except:
+        out = msg['modelError'].format(fileName) + str(sys.exc_info()[0]) + '\n' + str(sys.exc_info()[1])
+        messages.append(out)
+        return [None, messages]
+    return [tables, messages]
+
+
+# decode all model files given by paths (using jobs worker processes if jobs > 1) and store them in the
+# sqlite database dbName, all rows are inserted in one transaction. returns exit code 0 if all models were stored
+def exportBatch(paths, dbName, jobs=1):
+    import sqlite3
+    fileNames = collectFiles(paths)
+    if jobs > 1 and len(fileNames) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunk = max(1, len(fileNames) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(options, swsettings, catalogs, profiling)) as executor:
+            results = list(executor.map(exportModel, fileNames, chunksize=chunk))
+    else:
+        results = [exportModel(fileName) for fileName in fileNames]
+    # rows of all models per table, the column model is set below
+    rows = {name: [] for name in ['models'] + exportTables}
+    failed = 0
+    for fileName, [tables, messages] in zip(fileNames, results):
+        print('\ninput', fileName)
+        for out in messages:
+            showMessage(out)
+        if tables is None:
+            failed += 1
+            continue
+        for name in rows:
+            rows[name].append(tables[name])
+    try:
+        con = sqlite3.connect(dbName)
+    except sqlite3.Error as e:
+        print(dbName, 'nicht schreibbar / not writable')
+        print(str(e))
+        return 1
+    try:
+        con.executescript(exportSchema)
+        with con:  # one transaction, rolled back if anything fails
+            con.execute('PRAGMA foreign_keys = ON')
+            # models exported again are deleted including their rows in all tables
+            con.executemany('DELETE FROM models WHERE file = ?', [[model[0][0]] for model in rows['models']])
+            first = con.execute('SELECT coalesce(max(id), 0) + 1 FROM models').fetchone()[0]
+            con.executemany('INSERT INTO models VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                            [[first + ii] + model[0] for ii, model in enumerate(rows['models'])])
+            for name in exportTables:
+                data = [[first + ii] + row for ii, model in enumerate(rows[name]) for row in model]
+                if len(data) > 0:
+                    con.executemany('INSERT INTO %s VALUES (%s)' % (name, ', '.join(len(data[0]) * '?')), data)
+    except sqlite3.Error as e:
+        print(dbName, 'nicht schreibbar / not writable')
+        print(str(e))
+        return 1
+    finally:
+        con.close()
+    print('\n%d models stored in %s' % (len(rows['models']), dbName))
+    if failed > 0 or not fileNames:
+        return 1
+    return 0
+
+
+# ------------------------   where-used index of controls, switches, sensors and Lua apps, called from main()  ----
+# one index file for many models, stores for each key (e.g. SF, Log3, MX2, sensor device ID 25978:615, Lua:46617)
+# the model files and their top-level sections (e.g. Functions, Alarms) which use it. built incrementally, only new
+# or changed model files are read, so a lookup needs no model file
+usageNames = set(['P1', 'P2', 'P3', 'P4', 'P5', 'P6', 'P7', 'P8', 'P9', 'P10'] + list(swlist) +
+                 ['Log' + str(ii) for ii in range(1, 25)] + ['MX' + str(ii) for ii in range(1, 17)] +
+                 ['GX', 'GY', 'GZ', 'G/L', 'G/R', 'GXL', 'GXR', 'GHi'] + ['Tr' + str(ii) for ii in range(1, 7)])
+
+
+# sections whose key ID is the device ID of a sensor, in all sections the key Sensor-ID is one
+sensorIdSections = set(['Telem-Detect', 'Telem-Voice', 'Displayed-Telemetry'])
+
+
+# keys used by a model, returns a dict key: sorted list of top-level sections
+# switches are found by their pattern (like extractPat), sensors by the device IDs of Telem-Detect
+# stored as Sensor-ID or as ID of the sections sensorIdSections, Lua apps by appID and by Displayed-Telemetry
+def getUsage(modelData):
+    ctx = ModelContext(options, swsettings)
+    usage = {}
+    devices = set(item['ID'] for item in modelData['Telem-Detect']['Data'])
+    for section, data in modelData.items():
+        found = set()
+        findUsage(ctx, devices, section, data, None, found)
+        for key in found:
+            usage.setdefault(key, []).append(section)
+    for key in usage:
+        usage[key].sort()
+    return usage
+
+
+# add the keys used by value to found, name is its key if value is an element of a dict
+def findUsage(ctx, devices, section, value, name, found):
+    typ = type(value)
+    if typ is dict:
+        if section == 'Displayed-Telemetry' and value.get('Item-Type') == 4:
+            found.add('Lua:' + str(value['ID']))
+        for key, item in value.items():
+            findUsage(ctx, devices, section, item, key, found)
+    elif typ is list:
+        for item in value:
+            if type(item) is not int:  # most lists are numbers (e.g. curves, data of Lua apps), they are no references
+                findUsage(ctx, devices, section, item, None, found)
+    elif typ is str:
+        if switchpat.fullmatch(value):
+            try:
+                sw = getSwitch(ctx, value)[0]
+            except (IndexError, ValueError):  # looks like a switch but is not one, e.g. data of a Lua app
+                return
+            if sw in usageNames:
+                found.add(sw)
+    elif typ is int:
+        if name == 'appID':
+            found.add('Lua:' + str(value))
+        elif value in devices and (name == 'Sensor-ID' or (name == 'ID' and section in sensorIdSections)):
+            found.add(getDeviceID(value))
+
+
+# read a model file for indexBatch(), nothing is printed, so it can run in a worker process
+# returns a list [usage (see getUsage) or None if not readable, list of messages for the user]
+def indexModel(fileName):
+    msg = getCatalog(options['language'])
+    try:
+        modelData = readModel(fileName)[0]
+        return [getUsage(modelData), []]
+    except json.decoder.JSONDecodeError as e:
+        return [None, [msg['invalidModel'].format(fileName) + str(e)]]
+    except OSError as e:
+        return [None, [msg['unreadableFile'].format(fileName) + str(e)]]
+    except (KeyError, TypeError, IndexError, ValueError):  # skipped like convertModel() does, the others are indexed
+        return [None, [msg['invalidModel'].format(fileName)]]
 
-        # create output
+
+# version of the keys found by getUsage(), an index of another version is built again (like csvFormat)
+# 2: numbers in lists and ID outside of sensorIdSections are no sensors
+indexFormat = 2
+
+
+# read the index file, returns a new empty index if it is missing, invalid or of another version
+def readIndex(indexName):
+    try:
+        with open(indexName, 'r', encoding='utf-8') as filein:
+            index = json.load(filein)
+        if (index['version'] == progvers and index['format'] == indexFormat and isinstance(index['models'], dict) and
+                isinstance(index['keys'], dict)):
+            return index
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {'version': progvers, 'format': indexFormat, 'models': {}, 'keys': {}}
+
+
+# remove a model from index and its keys
+def removeIndex(index, fileName):
+    entry = index['models'].pop(fileName, None)
+    if entry is None:
+        return
+    for key in entry['keys']:
+        models = index['keys'].get(key, {})
+        models.pop(fileName, None)
+        if len(models) == 0:
+            index['keys'].pop(key, None)
+
+
+# update the index file indexName with the model files given by paths (using jobs worker processes if jobs > 1),
+# only new or changed model files are read, model files which no longer exist are removed.
+# returns exit code 0 if all model files were indexed
+def indexBatch(paths, indexName, jobs=1):
+    index = readIndex(indexName)
+    for fileName in list(index['models']):
+        if not os.path.isfile(fileName):
+            removeIndex(index, fileName)
+    changed = []
+    for fileName in collectFiles(paths):
+        fileName = os.path.abspath(fileName)
         try:
-            with open(filecsv, 'w', encoding='utf-8', errors='replace') as fileout:
-                fileout.write(progvers)
-                # extract content of model
-                extractDict(modelData)
-                extractPat(modelTxt)
-                fileout.write('\n') # last line
-        except:
-            if options['language'] == 'de':
-                out = 'Fehler bei Modell\n' + fileName + '\nGrund: '
-            else:
-                out = 'error at model\n' + fileName + '\nreason: '
-            out = out + str(sys.exc_info()[0]) + '\n' + str(sys.exc_info()[1])
-            print(out)
-            tk.messagebox.showinfo(title='jemoview', message=out)
+            stat = os.stat(fileName)
+        except OSError:
+            stat = None
+        entry = index['models'].get(fileName)
+        if stat is not None and entry is not None and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
             continue
-
-        if zefix(2) > 0:
+        changed.append([fileName, stat])
+    if jobs > 1 and len(changed) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunk = max(1, len(changed) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(options, swsettings, catalogs, profiling)) as executor:
+            results = list(executor.map(indexModel, [item[0] for item in changed], chunksize=chunk))
+    else:
+        results = [indexModel(item[0]) for item in changed]
+    failed = 0
+    for [fileName, stat], [usage, messages] in zip(changed, results):
+        for out in messages:
+            showMessage(out)
+        removeIndex(index, fileName)
+        if usage is None or stat is None:
+            failed += 1
+            continue
+        index['models'][fileName] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'keys': usage}
+        for key, sections in usage.items():
+            index['keys'].setdefault(key, {})[fileName] = sections
+    try:
+        with open(indexName + '.tmp', 'w', encoding='utf-8') as fileout:
+            json.dump(index, fileout, ensure_ascii=False, indent=0)
+        os.replace(indexName + '.tmp', indexName)
+    except OSError as e:
+        print(indexName, 'nicht schreibbar / not writable')
+        print(str(e))
+        return 1
+    print('%d models read, %d models in %s' % (len(changed), len(index['models']), indexName))
+    if failed > 0:
+        return 1
+    return 0
+
+
+# print the model files and sections which use the keys, returns exit code 0 if all keys were found
+def lookupIndex(keys, indexName):
+    index = readIndex(indexName)
+    missing = 0
+    for key in keys:
+        models = index['keys'].get(key)
+        if models is None:
             if options['language'] == 'de':
-                out = 'unbekannte Daten in Modell\n' + fileName + '\nbitte Modell im jetiforum.de einstellen'
+                print(key + ': nicht verwendet')
             else:
-                out = 'unknown data in model\n' + fileName + '\nplease post model at jetiforum.de'
-            print(out)
-            tk.messagebox.showinfo(title='jemoview', message=out)
-
-        print('output', filecsv)
-        fileout.close()
-
+                print(key + ': not used')
+            missing += 1
+            continue
+        print(key + ':')
+        for fileName in sorted(models):
+            print('   ', fileName, ' '.join(models[fileName]))
+    if missing > 0:
+        return 1
+    return 0
+
+
+# ------------------------   unknown data of many models, called from main()  ----
+# all models are evaluated like convert does (without writing csv files) and their unknown data (see zefix)
+# is counted by section, JSON path without the positions in lists and value, so values of new transmitter
+# versions are found in one run over the models of many transmitters
+indexpat = re.compile(r'\[[0-9]+\]')
+
+
+# model files and the model files in archives given by fileNames, each as list [name, content]
+# content is None for model files, they are read by the worker
+def getScanMembers(fileNames):
+    for fileName in fileNames:
+        if not isArchive(fileName):
+            yield [fileName, None]
+            continue
+        try:
+            for archiveName, memberName, content in readArchive(fileName):
+                yield [archiveName + ':' + memberName, content]
+        except Exception as e:  # zipfile.BadZipFile, tarfile.TarError or OSError
+            print(fileName, 'nicht lesbar / not readable')
+            print(str(e))
+
+
+# evaluate a model for scanUnknown(), nothing is printed, so it can run in a worker process
+# returns a list [name, unknown data (see zefix) or None if not evaluated, list of problems (see getProblem)]
+def scanModel(member):
+    fileName, content = member
+    if content is None:
+        msg = getCatalog(options['language'])
+        try:
+            content = readContent(fileName)
+        except OSError as e:
+            return [fileName, None, [getProblem(fileName, 'unreadable', msg['unreadableFile'].format(fileName) + str(e), e)]]
+    parsed, messages = parseContent(fileName, content)
+    if parsed is None:
+        return [fileName, None, messages]
+    ctx, messages = extractModel(fileName, parsed[0], parsed[1])
+    if ctx is None:
+        return [fileName, None, messages]
+    return [fileName, ctx.unknown, []]
+
+
+# count the unknown data of the models given by paths (using jobs worker processes if jobs > 1),
+# prints the most frequent ones and writes all to the csv file outName if it is not None
+# returns exit code 0 if there is no unknown data, 1 if a model was not evaluated, 3 if unknown data was found,
+# 4 if no model files were found
+def scanUnknown(paths, outName=None, jobs=1):
+    table = {}  # (section, path, value): [number, set of models, first model]
+    found = 0
+    failed = 0
+    executor = None
+    try:
+        members = getScanMembers(collectFiles(paths))
+        if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(options, swsettings, catalogs, profiling))
+        for fileName, unknown, messages in mapBounded(executor, scanModel, members, 2 * jobs):
+            found += 1
+            for problem in messages:
+                print(problem['message'])
+            if unknown is None:
+                failed += 1
+                continue
+            for section, path, value in unknown:
+                key = (section, indexpat.sub('[*]', path) if path else '-', str(value))
+                entry = table.get(key)
+                if entry is None:
+                    table[key] = [1, {fileName}, fileName]
+                else:
+                    entry[0] += 1
+                    entry[1].add(fileName)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # values found in most models first
+    rows = [[entry[0], len(entry[1])] + list(key) + [entry[2]]
+            for key, entry in sorted(table.items(), key=lambda item: (-len(item[1][1]), -item[1][0], item[0]))]
+    if options['language'] == 'de':
+        columns = ['Anzahl', 'Modelle', 'Abschnitt', 'JSON Pfad', 'Wert', 'erstes Modell']
+    else:
+        columns = ['count', 'models', 'section', 'JSON path', 'value', 'first model']
+    for row in [columns] + rows[:40]:
+        print('%6s %6s  %-14s %-45s %s' % tuple(row[:5]))
+    if len(rows) > 40:
+        print('...')
+    models = len(set().union(*[entry[1] for entry in table.values()]))
     if options['language'] == 'de':
-        out = 'bereit für weitere Modelle'
+        print('%d Modelle gelesen, %d mit unbekannten Daten, %d verschiedene unbekannte Werte' % (found, models, len(rows)))
     else:
-        out = 'ready for next models'
-    tk.messagebox.showinfo(title='jemoview', message=out)
+        print('%d models read, %d with unknown data, %d different unknown values' % (found, models, len(rows)))
+    if outName is not None:
+        try:
+            with open(outName, 'w', encoding='utf-8', newline='') as fileout:
+                writer = csv.writer(fileout, delimiter=options['delimiter'], lineterminator='\n')
+                writer.writerow(columns)
+                writer.writerows(rows)
+        except OSError as e:
+            print(outName, 'nicht schreibbar / not writable')
+            print(str(e))
+            return 1
+        print('output', outName)
+    if failed > 0:
+        return 1
+    if found == 0:
+        return 4
+    if rows:
+        return 3
+    return 0
+
+
+# ------------------------   library functions, for programs using import jemoview  ----
+# importing jemoview reads no settings file and creates no window (tkinter is imported by startGui() only),
+# these functions convert in the calling process without files and without changing the globals options and
+# swsettings, so they can be called from several threads:
+#     rows = jemoview.convert('Model/0007Pipe.jsn', {'language': 'en', 'sections': ['servos2', 'alarms']})
+#     text = jemoview.convertCsv(modelData, {'delimiter': ','})
+#     model = jemoview.decode('Model/0007Pipe.jsn')
+# a model is given as dict (the decoded json of a model file), as content of a model file (bytes) or as file name.
+# They raise OSError if the file is not readable and ValueError (json.JSONDecodeError is one) if it is not a model,
+# model files lacking data raise KeyError, IndexError etc. like the sections
+libraryOptions = ['language', 'delimiter', 'sections', 'switches']
+
+
+# ModelContext for the library functions, modelOptions is None or a dict with keys of libraryOptions:
+# language (e.g. 'en'), delimiter (one character), sections (list of names of sectionNames) and switches (dict like
+# in settings.txt, e.g. {'SA': 0} if switch SA is mounted reversed), missing options are taken from the globals
+def getLibraryContext(modelOptions=None):
+    modelOptions = modelOptions or {}
+    unknown = [key for key in modelOptions if key not in libraryOptions]
+    if unknown:
+        raise ValueError('unknown option %s, options are %s' % (', '.join(unknown), ', '.join(libraryOptions)))
+    ctxOptions = dict(options)
+    ctxSwsettings = list(swsettings)
+    if 'language' in modelOptions:
+        if modelOptions['language'] not in catalogs:
+            loadCatalogs()  # jemoview-xx.json are only loaded by main()
+        if modelOptions['language'] not in catalogs:
+            raise ValueError('unknown language %s, languages are %s' % (modelOptions['language'], ', '.join(sorted(catalogs))))
+        ctxOptions['language'] = modelOptions['language']
+    if 'delimiter' in modelOptions:
+        delimiter = modelOptions['delimiter']
+        if not isinstance(delimiter, str) or len(delimiter) != 1 or delimiter in ['"', '\r', '\n']:
+            raise ValueError('delimiter must be one character except quote and line break')
+        ctxOptions['delimiter'] = delimiter
+    if modelOptions.get('sections') is not None:
+        unknown = [name for name in modelOptions['sections'] if name not in sectionNames]
+        if unknown:
+            raise ValueError('unknown section %s, sections are %s' % (', '.join(unknown), ', '.join(sectionNames)))
+        ctxOptions['sections'] = sorted(set(modelOptions['sections']))
+    for name, value in modelOptions.get('switches', {}).items():
+        if name not in swlist or value not in [0, 1]:
+            raise ValueError('switches must be like {"SA": 0}, 0 if reversed, 1 if mounted correctly')
+        ctxSwsettings[swlist.index(name)] = value
+    return ModelContext(ctxOptions, ctxSwsettings)
+
+
+# the model for the library functions (dict, bytes or file name), returns the list [modelData, switches] of parseModel()
+def getLibraryModel(model):
+    if isinstance(model, dict):
+        # the switches are found in the text like in a model file
+        return [model, swtextpat.findall(json.dumps(model, ensure_ascii=False))]
+    if isinstance(model, (bytes, bytearray)):
+        return parseModel(bytes(model))
+    return parseModel(readContent(model))
+
+
+# the ModelContext with the rows of a model for convert() and convertCsv()
+def extractLibrary(model, modelOptions, unknown):
+    ctx = getLibraryContext(modelOptions)
+    modelData, switches = getLibraryModel(model)
+    if 'Global' not in modelData:
+        raise ValueError('not a model, Global is missing')
+    extractRows(ctx, modelData, switches)
+    if unknown is not None:
+        unknown.extend(ctx.unknown)
+    return ctx
+
+
+# convert a model (dict, bytes or file name) into the rows of its csv file, each row a list of cells (strings),
+# the first row is the header of jemoview. If unknown is a list, the unknown data (see zefix) is appended to it
+# the rows are copied, some of them are lists of the catalogs (e.g. column titles) which must not be changed by the caller
+def convert(model, modelOptions=None, unknown=None):
+    return [list(progrow)] + [list(row) for row in extractLibrary(model, modelOptions, unknown).rows]
+
+
+# like convert(), but returns the text of the csv file (lines end with '\n')
+def convertCsv(model, modelOptions=None, unknown=None):
+    fileout = io.StringIO()
+    writeCsv(fileout, extractLibrary(model, modelOptions, unknown))
+    return fileout.getvalue()
+
+
+# decode a model (dict, bytes or file name) into a DecodedModel, its values are as stored by the transmitter
+def decode(model):
+    ctx = getLibraryContext()
+    decodeModel(ctx, getLibraryModel(model)[0])
+    return ctx.model
 
 
 # ------------------------------- extract options from settings, called from main  -------------------
@@ -2311,12 +4132,14 @@ def extractOpt(optData):
     if 'jemoview' in optData:
         if 'language' in optData['jemoview']:
             xx = optData['jemoview']['language']
-            if xx in ['de', 'en']:
+            if xx in catalogs:
                 options['language'] = xx
                 if xx == 'de':
                     print('settings: Sprache deutsch')
-                else:
+                elif xx == 'en':
                     print('settings: language English')
+                else:
+                    print('settings: language', xx)
         if 'csvtarget' in optData['jemoview']:
             yy = optData['jemoview']['csvtarget']
             if yy in ['samefolder', 'subfolder']:
@@ -2331,6 +4154,14 @@ def extractOpt(optData):
                         print('settings: csv in Unterordner')
                     else:
                         print('settings: csv in subfolder')
+        if 'delimiter' in optData['jemoview']:
+            zz = optData['jemoview']['delimiter']
+            if isinstance(zz, str) and len(zz) == 1 and zz not in ['"', '\r', '\n']:
+                options['delimiter'] = zz
+                if options['language'] == 'de':
+                    print('settings: Trennzeichen', repr(zz))
+                else:
+                    print('settings: delimiter', repr(zz))
     if 'switches' in optData:
         if options['language'] == 'de':
             revstr = '(umgedreht)'
@@ -2358,12 +4189,16 @@ def setLang(langOpt):
         labelCsvtarget['text'] = 'wo sollen die csv Ergebnis Dateien gespeichert werden'
         buttonCsvsame['text'] = '1) im selben Ordner \nwie Model Datei'
         buttonCsvsub['text'] = '2) in Unterordner csv \nvon Model Datei Ordner'
+        checkProfile['text'] = 'Laufzeit je Modell protokollieren (Profil)'
+        buttonCancel['text'] = 'Abbrechen'
         buttonEn['bg'] = app["bg"]
         buttonDe['bg'] = 'white'
     if langOpt == 'en':
         labelCsvtarget['text'] = 'where to store the resulting csv files'
         buttonCsvsame['text'] = '1) in same folder as model file'
         buttonCsvsub['text'] = '2) in subfolder of model folder'
+        checkProfile['text'] = 'log time per model (profile)'
+        buttonCancel['text'] = 'Cancel'
         buttonDe['bg'] = app['bg']
         buttonEn['bg'] = 'white'
     return
@@ -2379,74 +4214,204 @@ def setCsv(csvOpt):
         buttonCsvsub['bg'] = 'white'
     return
 
+def setProfile():
+    profiling['enabled'] = varProfile.get()
+    return
 
-# ------------------------------------     main   loop -------------------
 
-# default options
-options = {'language': 'de',
-           'csvtarget': 'samefolder'}
-swsettings = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-
-# create the GUI structures (but do not display yet)
-app = tk.Tk()
-app.title(progvers)
-# Create a canvas and frames
-app.geometry('400x370+400+300')
-frameLanguage = tk.Frame(master=app, relief=tk.RIDGE, borderwidth=5)
-frameCsvtarget = tk.Frame(master=app, height=100, width=100, relief=tk.RIDGE, borderwidth=5)
-frameStart = tk.Frame(master=app, height=100, width=100, relief=tk.RIDGE, borderwidth=5)
-# language option buttons
-buttonDe = tk.Button(master=frameLanguage, text='Sprache Deutsch', font=('Times', 12, 'bold'), command=lambda: setLang('de'))
-buttonDe.pack(side=tk.LEFT)
-buttonEn = tk.Button(master=frameLanguage, text='Language English', font=('Times', 12, 'bold'), command=lambda: setLang('en'))
-buttonEn.pack(side=tk.RIGHT)
-# csvtarget option buttons (
-labelCsvtarget = tk.Label(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), padx=20)
-labelCsvtarget.pack() # this pack must be done in separate line, otherwise label or button not known in function setLang()
-buttonCsvsame = tk.Button(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), width=40, padx=5, command=lambda: setCsv('samefolder'))
-buttonCsvsame.pack()
-buttonCsvsub = tk.Button(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), width=40, padx=5, command=lambda: setCsv('subfolder'))
-buttonCsvsub.pack()
-# start button
-tk.Button(master=frameStart, text='Start', font=('Times', 15, 'bold'), width=15, fg='blue', padx=20, pady=20, command=lambda: selectInput()).pack(side=tk.LEFT)
-# exit button
-buttonExit = tk.Button(master=frameStart, text='Exit', font=('Times', 15, 'bold'), width=15, fg='red', padx=20, pady=20, command=lambda: sys.exit()).pack(side=tk.RIGHT)
-# pack frames
-tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
-frameLanguage.pack()
-tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
-frameCsvtarget.pack()
-tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
-frameStart.pack()
-
-
-# check if file named settings.txt exists
-fileName = 'settings.txt'
-settok = False
-if os.path.exists(fileName):
-    # read settings
-    try:
-        with open(fileName, 'r', encoding='utf-8', errors='replace') as filein:
-            try:
-                optData = json.load(filein)  # resulting optData is a dict
-                extractOpt(optData)
-                settok = True
-            except json.decoder.JSONDecodeError as e:
-                print(fileName, 'enthält ungültige Optionen / contains invalid options ')
-                print(str(e))
-    except OSError as e:
-        print(fileName, 'nicht lesbar / not readable')
-        print(str(e))
-    if settok is False:
-        print('settings ignoriert / ignored')
-else:
-    print('Datei', fileName, 'nicht gefunden')
-    print('File', fileName, 'not found')
+# ------------------------------------     GUI, called from main   -------------------
+
+def startGui():
+    # these globals are needed by setLang() and setCsv()
+    global app, buttonDe, buttonEn, labelCsvtarget, buttonCsvsame, buttonCsvsub, checkProfile, varProfile
+    global buttonStart, buttonCancel, progressBar, labelStatus
+    # tkinter is imported here, so batch mode works without it
+    import tkinter as tk
+    from tkinter import ttk
+
+    # create the GUI structures (but do not display yet)
+    app = tk.Tk()
+    app.title(progvers)
+    # Create a canvas and frames
+    app.geometry('400x520+400+300')
+    frameLanguage = tk.Frame(master=app, relief=tk.RIDGE, borderwidth=5)
+    frameCsvtarget = tk.Frame(master=app, height=100, width=100, relief=tk.RIDGE, borderwidth=5)
+    frameStart = tk.Frame(master=app, height=100, width=100, relief=tk.RIDGE, borderwidth=5)
+    frameProgress = tk.Frame(master=app, relief=tk.RIDGE, borderwidth=5)
+    # language option buttons
+    buttonDe = tk.Button(master=frameLanguage, text='Sprache Deutsch', font=('Times', 12, 'bold'), command=lambda: setLang('de'))
+    buttonDe.pack(side=tk.LEFT)
+    buttonEn = tk.Button(master=frameLanguage, text='Language English', font=('Times', 12, 'bold'), command=lambda: setLang('en'))
+    buttonEn.pack(side=tk.RIGHT)
+    # csvtarget option buttons (
+    labelCsvtarget = tk.Label(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), padx=20)
+    labelCsvtarget.pack() # this pack must be done in separate line, otherwise label or button not known in function setLang()
+    buttonCsvsame = tk.Button(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), width=40, padx=5, command=lambda: setCsv('samefolder'))
+    buttonCsvsame.pack()
+    buttonCsvsub = tk.Button(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), width=40, padx=5, command=lambda: setCsv('subfolder'))
+    buttonCsvsub.pack()
+    # profile checkbox, records are written next to the csv files
+    varProfile = tk.BooleanVar(master=app, value=profiling['enabled'])
+    checkProfile = tk.Checkbutton(master=frameCsvtarget, text=' ', font=('Times', 12, 'bold'), variable=varProfile, command=setProfile)
+    checkProfile.pack()
+    # start button
+    buttonStart = tk.Button(master=frameStart, text='Start', font=('Times', 15, 'bold'), width=15, fg='blue', padx=20, pady=20, command=lambda: selectInput())
+    buttonStart.pack(side=tk.LEFT)
+    # exit button
+    tk.Button(master=frameStart, text='Exit', font=('Times', 15, 'bold'), width=15, fg='red', padx=20, pady=20, command=lambda: sys.exit()).pack(side=tk.RIGHT)
+    # pack frames
+    tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
+    frameLanguage.pack()
+    tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
+    frameCsvtarget.pack()
+    tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
+    frameStart.pack()
+    # progress of the conversion by the worker thread, see selectInput()
+    progressBar = ttk.Progressbar(master=frameProgress, orient=tk.HORIZONTAL, length=360, mode='determinate')
+    progressBar.pack()
+    labelStatus = tk.Label(master=frameProgress, text=' ', font=('Times', 10), width=50)
+    labelStatus.pack()
+    buttonCancel = tk.Button(master=frameProgress, text=' ', font=('Times', 12, 'bold'), width=15, state=tk.DISABLED, command=cancelWorker)
+    buttonCancel.pack()
+    tk.Label(master=app, text=' ', font=('Times', 10, 'bold'), width=50, fg='black').pack()
+    frameProgress.pack()
+
+    # now put initial options into GUI
+    setLang(options['language'])
+    setCsv(options['csvtarget'])
+
+    # draw and loop
+    app.mainloop()
+
+
+# ------------------------------------     settings, called from main   -------------------
+
+# check if settings file (normally settings.txt) exists and read its options
+def readSettings(fileName):
+    settok = False
+    if os.path.exists(fileName):
+        # read settings
+        try:
+            with open(fileName, 'r', encoding='utf-8', errors='replace') as filein:
+                try:
+                    optData = json.load(filein)  # resulting optData is a dict
+                    extractOpt(optData)
+                    settok = True
+                except json.decoder.JSONDecodeError as e:
+                    print(fileName, 'enthält ungültige Optionen / contains invalid options ')
+                    print(str(e))
+        except OSError as e:
+            print(fileName, 'nicht lesbar / not readable')
+            print(str(e))
+        if settok is False:
+            print('settings ignoriert / ignored')
+    else:
+        print('Datei', fileName, 'nicht gefunden')
+        print('File', fileName, 'not found')
 
 
-# now put initial options into GUI
-setLang(options['language'])
-setCsv(options['csvtarget'])
+# ------------------------------------     main   -------------------
 
-# draw and loop
-app.mainloop()
+# default options
+options = {'language': 'de',
+           'csvtarget': 'samefolder',
+           'delimiter': ';'}
+swsettings = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+# profiling of conversions, see profileModel(), set by --profile... or the GUI checkbox, does not change the csv files
+profiling = {'enabled': False,      # time each step of each conversion
+             'cprofile': False,     # also run cProfile, the record gets the functions with most cumulative time
+             'tracemalloc': False,  # also trace memory allocations, the record gets the peak memory
+             'log': None}           # file for all profile records, None: file .profile.jsonl next to each csv file
+app = None  # the Tk root window, only set if the GUI is running
+guiQueue = None   # events of the worker thread of the GUI, see convertWorker()
+guiCancel = None  # set by the cancel button of the GUI to stop the worker thread
+
+
+# without arguments the GUI is started, otherwise the command line is evaluated (batch mode)
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    loadCatalogs()
+    if len(argv) == 0:
+        readSettings('settings.txt')
+        startGui()
+        return 0
+
+    import argparse
+    parser = argparse.ArgumentParser(prog='jemoview', description='jeti model viewer, converts jeti model files (.jsn) into csv files')
+    commands = parser.add_subparsers(dest='command', required=True)
+    parserConvert = commands.add_parser('convert', help='convert model files without GUI')
+    parserWatch = commands.add_parser('watch', help='convert new or changed model files as soon as they are written, stop with Ctrl+C')
+    parserExport = commands.add_parser('export', help='store the decoded model files in a sqlite database')
+    parserIndex = commands.add_parser('index', help='update the where-used index of controls, switches, sensors and Lua apps')
+    parserLookup = commands.add_parser('lookup', help='list the models and sections using a control, switch, sensor or Lua app')
+    parserUnknown = commands.add_parser('unknown', help='count the unknown data of many models by section, JSON path and value')
+    parserLookup.add_argument('keys', nargs='+', metavar='KEY', help='e.g. SF, P3, Log2, MX1, Tr4, sensor device ID like 25978:615 or Lua:APPID')
+    for parserCommand in [parserIndex, parserLookup]:
+        parserCommand.add_argument('--index', default='jemoview-index.json', metavar='FILE', help='index file (default jemoview-index.json)')
+    for parserCommand in [parserConvert, parserWatch, parserExport, parserIndex, parserUnknown]:
+        parserCommand.add_argument('paths', nargs='+', metavar='PATH', help='model file, folder of model files or pattern like Model/*.jsn')
+    for parserCommand in [parserConvert, parserWatch, parserExport, parserIndex, parserLookup, parserUnknown]:
+        parserCommand.add_argument('--lang', choices=sorted(catalogs), help='language of the csv files, overrides settings')
+        parserCommand.add_argument('--settings', default='settings.txt', help='settings file (default settings.txt)')
+    for parserCommand in [parserConvert, parserWatch]:
+        parserCommand.add_argument('--csvtarget', choices=['samefolder', 'subfolder'], help='where to store the csv files, overrides settings')
+        parserCommand.add_argument('--delimiter', help='separator of the values in the csv files (one character), overrides settings')
+        parserCommand.add_argument('--profile', action='store_true', help='time each step of each conversion and write a profile record per model')
+        parserCommand.add_argument('--profile-log', metavar='FILE', help='append all profile records to FILE (implies --profile)')
+        parserCommand.add_argument('--profile-cpu', action='store_true', help='add the functions with most time by cProfile (implies --profile)')
+        parserCommand.add_argument('--profile-mem', action='store_true', help='add the peak memory by tracemalloc (implies --profile)')
+        parserCommand.add_argument('--sections', metavar='NAMES', help='comma separated sections to convert, e.g. servos2,alarms (default all: '
+                                   + ','.join(sectionNames) + ')')
+    parserWatch.add_argument('--interval', type=float, default=1.0, help='seconds between two checks of the files (default 1)')
+    parserWatch.add_argument('--settle', type=float, default=2.0, help='seconds a file must be unchanged before it is converted (default 2)')
+    parserConvert.add_argument('--force', action='store_true', help='convert all models, also unchanged ones (see manifest in README)')
+    parserConvert.add_argument('--report', metavar='FILE', help='write the problems of all models to FILE (.json or .csv)')
+    parserConvert.add_argument('--archive-out', metavar='FILE', help='write the csv files of models in zip or tar archives into FILE (.zip, .tar, .tar.gz, ...)')
+    for parserCommand in [parserConvert, parserExport, parserIndex, parserUnknown]:
+        parserCommand.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='number of parallel worker processes (default number of CPUs)')
+    parserExport.add_argument('--db', required=True, metavar='FILE', help='sqlite database, created if missing, models exported again are replaced')
+    parserUnknown.add_argument('--out', metavar='FILE', help='write the table of all unknown data to the csv file FILE')
+    for parserCommand in [parserExport, parserIndex, parserLookup, parserUnknown]:
+        parserCommand.set_defaults(csvtarget=None, delimiter=None, profile=False, profile_log=None, profile_cpu=False, profile_mem=False,
+                                   sections=None)
+    args = parser.parse_args(argv)
+
+    readSettings(args.settings)
+    if args.lang is not None:
+        options['language'] = args.lang
+    if args.csvtarget is not None:
+        options['csvtarget'] = args.csvtarget
+    if args.delimiter is not None:
+        if len(args.delimiter) != 1 or args.delimiter in ['"', '\r', '\n']:
+            parser.error('delimiter must be one character except quote and line break')
+        options['delimiter'] = args.delimiter
+    if args.sections is not None:
+        selected = [name.strip() for name in args.sections.split(',') if name.strip()]
+        unknown = [name for name in selected if name not in sectionNames] or ([] if selected else [args.sections])
+        if unknown:
+            parser.error('unknown section %s, sections are %s' % (','.join(unknown), ','.join(sectionNames)))
+        options['sections'] = sorted(set(selected))  # part of the fingerprint of the manifest, so sorted
+    profiling['enabled'] = args.profile or args.profile_log is not None or args.profile_cpu or args.profile_mem
+    profiling['cprofile'] = args.profile_cpu
+    profiling['tracemalloc'] = args.profile_mem
+    profiling['log'] = args.profile_log
+    if args.command == 'watch':
+        return watchModels(args.paths, max(0.1, args.interval), max(0.0, args.settle))
+    if args.command == 'export':
+        return exportBatch(args.paths, args.db, max(1, args.jobs))
+    if args.command == 'index':
+        return indexBatch(args.paths, args.index, max(1, args.jobs))
+    if args.command == 'lookup':
+        return lookupIndex(args.keys, args.index)
+    if args.command == 'unknown':
+        return scanUnknown(args.paths, args.out, max(1, args.jobs))
+    if args.archive_out is not None and not isArchive(args.archive_out):
+        parser.error('archive-out must end with one of ' + ' '.join(archiveTypes))
+    if args.report is not None and not args.report.lower().endswith(('.json', '.csv')):
+        parser.error('report must end with .json or .csv')
+    return convertBatch(args.paths, max(1, args.jobs), args.force, args.archive_out, args.report)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# aufruf: python3 -m unittest test_jemoview (oder python3 -m pytest test_jemoview.py)
+#
+# tests of the batch mode of jemoview with model files created by jemogen
+#
+# Copyright (c) 2020 - 2023, werinza (aka nikolausi / Klaus)
+# All Rights Reserved, Open Source MIT license applies to this program and related works
+#
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import jemogen
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+# run jemoview.py convert in folder cwd, returns the lines printed
+def runConvert(cwd, *args):
+    command = [sys.executable, os.path.join(here, 'jemoview.py'), 'convert'] + list(args) + \
+              ['--lang', 'en', '--settings', os.path.join(cwd, 'missing-settings.txt')]
+    result = subprocess.run(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            encoding='utf-8')
+    return result.returncode, result.stdout.splitlines()
+
+
+class ConvertInModelFolder(unittest.TestCase):
+    # model files given by relative names without folder, e.g. cd Model; jemoview.py convert *.jsn
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        fileNames = jemogen.generateCorpus(self.folder.name, 3, jemogen.sizes['small'])
+        self.names = sorted(os.path.basename(name) for name in fileNames)
+
+    def convertTwice(self, csvtarget):
+        rc, lines = runConvert(self.folder.name, *self.names, '--csvtarget', csvtarget)
+        self.assertEqual(rc, 0, lines)
+        self.assertEqual([line for line in lines if line.startswith('unchanged')], [])
+        rc, lines = runConvert(self.folder.name, *self.names, '--csvtarget', csvtarget)
+        self.assertEqual(rc, 0, lines)
+        return [line for line in lines if line.startswith('unchanged')]
+
+    def test_samefolder(self):
+        unchanged = self.convertTwice('samefolder')
+        self.assertEqual(len(unchanged), len(self.names))
+        self.assertTrue(os.path.isfile(os.path.join(self.folder.name, '.jemoview-manifest.json')))
+        for name in self.names:
+            self.assertTrue(os.path.isfile(os.path.join(self.folder.name, name[:-4] + '.csv')))
+
+    def test_subfolder(self):
+        unchanged = self.convertTwice('subfolder')
+        self.assertEqual(len(unchanged), len(self.names))
+        csvFolder = os.path.join(self.folder.name, 'csv')
+        self.assertTrue(os.path.isfile(os.path.join(csvFolder, '.jemoview-manifest.json')))
+        for name in self.names:
+            self.assertTrue(os.path.isfile(os.path.join(csvFolder, name[:-4] + '.csv')))
+
+
+if __name__ == '__main__':
+    unittest.main()